@@ -2,39 +2,508 @@ from __future__ import annotations
 
 """Simple Flask API for T-BEEP message storage.
 
-This demo implementation stores messages in memory only. Future versions
-may persist data to SQLite and require token-based authentication.
+Messages are kept by a pluggable message store. The default keeps them in
+memory; setting ``TBEEP_MESSAGE_DB`` to a file path switches the app to an
+indexed SQLite store that survives restarts and can be shared by several
+worker processes. Token-based authentication is still pending.
 """
 
-from typing import Dict, List
-from flask import Flask, request, jsonify
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Protocol, Tuple
+from flask import Flask, Response, request, jsonify, url_for
 
 app = Flask(__name__)
 
 # In-memory message store keyed by thread token
 MESSAGE_STORE: Dict[str, List[dict]] = {}
 
+MAX_PAGE_SIZE = 1000
+MAX_BATCH_SIZE = 500
 
-@app.route("/api/v1/messages", methods=["POST"])
-def post_message():
-    """Store a T-BEEP message in memory."""
-    data = request.get_json(force=True, silent=True)
+
+def normalize_timestamp(value: str) -> str:
+    """Return ISO 8601 ``value`` as a fixed-width UTC string that sorts in time order.
+
+    Timestamps without an offset are taken to be UTC, as written by
+    ``datetime.utcnow().isoformat()``. Raises ``ValueError`` if ``value`` is
+    not an ISO 8601 date or date-time.
+    """
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def message_timestamp(message: dict) -> Optional[str]:
+    """Return the message's normalized ``timestamp``, or ``None`` if it has none."""
+    timestamp = message.get("timestamp")
+    if not isinstance(timestamp, str):
+        return None
+    try:
+        return normalize_timestamp(timestamp)
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True)
+class MessageQuery:
+    """Filters for one page of a thread.
+
+    ``after`` is a cursor returned by a previous page. ``since`` is inclusive
+    and ``until`` exclusive; both hold :func:`normalize_timestamp` values and
+    are compared with the message's normalized ``timestamp``, so messages
+    without a valid timestamp never match them.
+    """
+
+    after: int = 0
+    limit: Optional[int] = None
+    since: Optional[str] = None
+    until: Optional[str] = None
+    instance: Optional[str] = None
+
+    def matches(self, message: dict, timestamp: Optional[str]) -> bool:
+        """Whether ``message``, whose normalized timestamp is ``timestamp``, is selected."""
+        if self.instance is not None and message.get("instance") != self.instance:
+            return False
+        if self.since is None and self.until is None:
+            return True
+        if timestamp is None:
+            return False
+        if self.since is not None and timestamp < self.since:
+            return False
+        return self.until is None or timestamp < self.until
+
+
+@dataclass(frozen=True)
+class MessagePage:
+    """Messages in thread order plus the cursor to resume after them.
+
+    ``cursors`` holds each message's own cursor. ``next_cursor`` is the
+    cursor of the last returned message, or the query's ``after`` when
+    nothing matched, so polling with it never skips or repeats a message.
+    """
+
+    messages: List[dict]
+    cursors: List[int]
+    next_cursor: int
+    has_more: bool
+
+
+class MessageStore(Protocol):
+    """Storage backend used by the API routes."""
+
+    def append(self, message: dict) -> None: ...
+
+    def append_many(self, messages: List[dict]) -> None: ...
+
+    def page(self, thread_token: str, query: MessageQuery) -> MessagePage: ...
+
+    def flush(self) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class InMemoryMessageStore:
+    """Keep messages in a dict of per-thread lists (the default backend)."""
+
+    def __init__(self, threads: Dict[str, List[dict]] | None = None):
+        self.threads = {} if threads is None else threads
+        # Normalized timestamps per thread, kept beside the list they index.
+        self._timestamps: Dict[str, Tuple[List[dict], List[Optional[str]]]] = {}
+
+    def append(self, message: dict) -> None:
+        self.threads.setdefault(message["threadToken"], []).append(message)
+
+    def append_many(self, messages: List[dict]) -> None:
+        for message in messages:
+            self.append(message)
+
+    def page(self, thread_token: str, query: MessageQuery) -> MessagePage:
+        """Cursors are 1-based positions in the thread's list."""
+        thread = self.threads.get(thread_token, [])
+        timestamps = self._thread_timestamps(thread_token, thread)
+        selected: List[dict] = []
+        cursors: List[int] = []
+        for position in range(query.after, len(thread)):
+            message = thread[position]
+            if not query.matches(message, timestamps[position]):
+                continue
+            if query.limit is not None and len(selected) == query.limit:
+                return MessagePage(selected, cursors, cursors[-1], True)
+            selected.append(message)
+            cursors.append(position + 1)
+        return MessagePage(selected, cursors, cursors[-1] if cursors else query.after, False)
+
+    def _thread_timestamps(
+        self, thread_token: str, thread: List[dict]
+    ) -> List[Optional[str]]:
+        """Normalize timestamps of messages appended since the last call.
+
+        ``threads`` may be shared and edited directly, so the cache starts over
+        when the thread's list was replaced or shrank.
+        """
+        cached = self._timestamps.get(thread_token)
+        if cached is None or cached[0] is not thread or len(cached[1]) > len(thread):
+            cached = self._timestamps[thread_token] = (thread, [])
+        timestamps = cached[1]
+        timestamps.extend(message_timestamp(m) for m in thread[len(timestamps):])
+        return timestamps
+
+    def messages(self, thread_token: str) -> List[dict]:
+        return self.page(thread_token, MessageQuery()).messages
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class SQLiteMessageStore:
+    """Persist messages in SQLite, indexed by thread token and UTC timestamp.
+
+    Each :meth:`append_many` call is one transaction, committed before it
+    returns, so one request (or one ``:batch`` payload) costs one commit and
+    the write lock is never held between requests. Several processes or
+    workers may therefore share one database file. ``utc_timestamp`` holds
+    :func:`normalize_timestamp` of each message's ``timestamp``; databases
+    written before it existed gain and backfill the column when opened.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level="DEFERRED"
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA busy_timeout=5000")
+        with self._connection:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS messages (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    thread_token TEXT NOT NULL,
+                    timestamp TEXT,
+                    payload_json TEXT NOT NULL,
+                    utc_timestamp TEXT
+                )
+                """
+            )
+            columns = {
+                row[1] for row in self._connection.execute("PRAGMA table_info(messages)")
+            }
+            if "utc_timestamp" not in columns:
+                self._connection.execute(
+                    "ALTER TABLE messages ADD COLUMN utc_timestamp TEXT"
+                )
+                self._connection.executemany(
+                    "UPDATE messages SET utc_timestamp=? WHERE seq=?",
+                    (
+                        (message_timestamp({"timestamp": timestamp}), seq)
+                        for seq, timestamp in self._connection.execute(
+                            "SELECT seq, timestamp FROM messages "
+                            "WHERE timestamp IS NOT NULL"
+                        ).fetchall()
+                    ),
+                )
+            self._connection.execute("DROP INDEX IF EXISTS messages_thread_timestamp")
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS messages_thread_utc_timestamp "
+                "ON messages(thread_token, utc_timestamp, seq)"
+            )
+
+    def append(self, message: dict) -> None:
+        self.append_many([message])
+
+    def append_many(self, messages: List[dict]) -> None:
+        """Insert ``messages`` with one statement and commit them together."""
+        rows = [self._row(message) for message in messages]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO messages"
+                "(thread_token, timestamp, payload_json, utc_timestamp) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+    @staticmethod
+    def _row(message: dict) -> tuple:
+        timestamp = message.get("timestamp")
+        return (
+            message["threadToken"],
+            timestamp if isinstance(timestamp, str) else None,
+            json.dumps(message, ensure_ascii=False, separators=(",", ":")),
+            message_timestamp(message),
+        )
+
+    def page(self, thread_token: str, query: MessageQuery) -> MessagePage:
+        """Cursors are the store-wide ``seq`` of the last returned row."""
+        clauses = ["thread_token=?", "seq>?"]
+        params: List[object] = [thread_token, query.after]
+        if query.since is not None:
+            clauses.append("utc_timestamp>=?")
+            params.append(query.since)
+        if query.until is not None:
+            clauses.append("utc_timestamp<?")
+            params.append(query.until)
+        if query.instance is not None:
+            clauses.append("json_extract(payload_json, '$.instance')=?")
+            params.append(query.instance)
+        sql = (
+            "SELECT seq, payload_json FROM messages WHERE "
+            + " AND ".join(clauses)
+            + " ORDER BY seq"
+        )
+        if query.limit is not None:
+            sql += " LIMIT ?"
+            params.append(query.limit + 1)
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+        has_more = query.limit is not None and len(rows) > query.limit
+        if has_more:
+            rows = rows[: query.limit]
+        cursors = [seq for seq, _ in rows]
+        return MessagePage(
+            [json.loads(payload) for _, payload in rows],
+            cursors,
+            cursors[-1] if cursors else query.after,
+            has_more,
+        )
+
+    def messages(self, thread_token: str) -> List[dict]:
+        return self.page(thread_token, MessageQuery()).messages
+
+    def flush(self) -> None:
+        pass  # every append is already committed
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class MessageNotifier:
+    """Wake stream subscribers when this process stores new messages.
+
+    Subscribers remember :attr:`version` before reading the store and then
+    :meth:`wait` for it to change, so a message stored between the read and
+    the wait is never missed. Messages stored by other processes are picked up
+    when the wait times out and the subscriber reads the store again.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self.version = 0
+
+    def notify(self) -> None:
+        with self._condition:
+            self.version += 1
+            self._condition.notify_all()
+
+    def wait(self, version: int, timeout: float) -> bool:
+        """Return ``True`` if :attr:`version` moved past ``version`` in time."""
+        with self._condition:
+            return self._condition.wait_for(lambda: self.version != version, timeout)
+
+
+def store_from_environment() -> MessageStore:
+    """Build the store selected by ``TBEEP_MESSAGE_DB``."""
+    path = os.environ.get("TBEEP_MESSAGE_DB")
+    if not path:
+        return InMemoryMessageStore(MESSAGE_STORE)
+    return SQLiteMessageStore(path)
+
+
+def set_message_store(store: MessageStore) -> MessageStore:
+    """Install ``store`` for the API routes and return the previous one.
+
+    The previous store is flushed but left open; closing it is the caller's
+    decision.
+    """
+    previous = message_store()
+    previous.flush()
+    app.extensions["tbeep_message_store"] = store
+    return previous
+
+
+def message_store() -> MessageStore:
+    """Return the store the API routes currently use."""
+    return app.extensions["tbeep_message_store"]
+
+
+app.extensions["tbeep_message_store"] = store_from_environment()
+app.config.setdefault("TBEEP_STREAM_HEARTBEAT", 15.0)
+MESSAGE_EVENTS = MessageNotifier()
+
+
+def message_error(data) -> Optional[str]:
+    """Return why ``data`` cannot be stored as a message, or ``None``."""
     if not isinstance(data, dict):
-        return jsonify({"error": "Invalid JSON"}), 400
+        return "Invalid JSON"
     thread_id = data.get("threadToken")
     if not thread_id:
-        return jsonify({"error": "threadToken missing"}), 400
-    MESSAGE_STORE.setdefault(thread_id, []).append(data)
+        return "threadToken missing"
+    if not isinstance(thread_id, str):
+        return "threadToken must be a string"
+    return None
+
+
+@app.route("/api/v1/messages", methods=["POST"])
+def post_message():
+    """Store a T-BEEP message in the configured message store."""
+    data = request.get_json(force=True, silent=True)
+    error = message_error(data)
+    if error:
+        return jsonify({"error": error}), 400
+    message_store().append(data)
+    MESSAGE_EVENTS.notify()
     return jsonify({"status": "stored"}), 201
 
 
+@app.route("/api/v1/messages:batch", methods=["POST"])
+def post_message_batch():
+    """Validate a JSON array of messages and store the valid ones together.
+
+    The response lists ``{"index", "status"}`` per item (plus ``error`` for
+    rejected items) in request order. The status code is 201 when every item
+    was stored, 207 when only some were, and 400 when none were.
+    """
+    data = request.get_json(force=True, silent=True)
+    if not isinstance(data, list) or not data:
+        return jsonify({"error": "expected a non-empty JSON array"}), 400
+    if len(data) > MAX_BATCH_SIZE:
+        return jsonify({"error": f"batch exceeds {MAX_BATCH_SIZE} messages"}), 413
+    results = []
+    accepted = []
+    for index, message in enumerate(data):
+        error = message_error(message)
+        if error:
+            results.append({"index": index, "status": "rejected", "error": error})
+        else:
+            results.append({"index": index, "status": "stored"})
+            accepted.append(message)
+    if accepted:
+        message_store().append_many(accepted)
+        MESSAGE_EVENTS.notify()
+    if len(accepted) == len(data):
+        status = 201
+    elif accepted:
+        status = 207
+    else:
+        status = 400
+    return jsonify({"stored": len(accepted), "results": results}), status
+
+
+def parse_message_query(args) -> MessageQuery:
+    """Build a :class:`MessageQuery` from request arguments.
+
+    Raises ``ValueError`` naming the offending parameter.
+    """
+    after = args.get("after", "0")
+    if not after.isdigit():
+        raise ValueError("after must be a cursor returned by a previous page")
+    limit = args.get("limit")
+    if limit is not None:
+        if not limit.isdigit() or not 1 <= int(limit) <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be an integer between 1 and {MAX_PAGE_SIZE}")
+        limit = int(limit)
+    bounds = {}
+    for name in ("since", "until"):
+        value = args.get(name) or None
+        if value is not None:
+            try:
+                value = normalize_timestamp(value)
+            except ValueError:
+                raise ValueError(f"{name} must be an ISO 8601 timestamp") from None
+        bounds[name] = value
+    return MessageQuery(
+        after=int(after),
+        limit=limit,
+        instance=args.get("instance") or None,
+        **bounds,
+    )
+
+
 @app.route("/api/v1/messages", methods=["GET"])
 def get_messages():
-    """Return messages for the given thread ID."""
+    """Return one page of messages for the given thread ID.
+
+    The body stays a plain JSON list. ``X-Next-Cursor`` carries the cursor to
+    pass as ``after`` on the next request; when ``limit`` cut the page short,
+    ``X-Has-More`` is ``true`` and a ``Link: rel="next"`` header is added.
+    """
     thread_id = request.args.get("thread_id")
     if not thread_id:
         return jsonify({"error": "thread_id required"}), 400
-    return jsonify(MESSAGE_STORE.get(thread_id, []))
+    try:
+        query = parse_message_query(request.args)
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+    page = message_store().page(thread_id, query)
+    response = jsonify(page.messages)
+    response.headers["X-Next-Cursor"] = str(page.next_cursor)
+    response.headers["X-Has-More"] = "true" if page.has_more else "false"
+    if page.has_more:
+        args = request.args.to_dict()
+        args["after"] = str(page.next_cursor)
+        response.headers["Link"] = (
+            f'<{url_for("get_messages", **args)}>; rel="next"'
+        )
+    return response
+
+
+def message_events(store: MessageStore, thread_token: str, after: int,
+                   heartbeat: float) -> Iterator[str]:
+    """Yield Server-Sent Events for messages stored after cursor ``after``.
+
+    Each event's ``id`` is the message cursor, so a reconnecting client that
+    sends it back as ``Last-Event-ID`` resumes exactly after that message.
+    A comment line is sent when ``heartbeat`` seconds pass without messages.
+    """
+    yield f"retry: {int(heartbeat * 1000)}\n\n"
+    cursor = after
+    while True:
+        version = MESSAGE_EVENTS.version
+        page = store.page(thread_token, MessageQuery(after=cursor, limit=MAX_PAGE_SIZE))
+        for event_id, message in zip(page.cursors, page.messages):
+            data = json.dumps(message, ensure_ascii=False, separators=(",", ":"))
+            yield f"id: {event_id}\nevent: message\ndata: {data}\n\n"
+        cursor = page.next_cursor
+        if page.has_more:
+            continue
+        if not MESSAGE_EVENTS.wait(version, heartbeat):
+            yield ": keep-alive\n\n"
+
+
+@app.route("/api/v1/threads/<path:thread_token>/stream", methods=["GET"])
+def stream_thread(thread_token: str):
+    """Push a thread's messages as Server-Sent Events.
+
+    Streaming starts after the cursor in the ``Last-Event-ID`` header, or the
+    ``after`` query parameter, and from the beginning of the thread if neither
+    is given.
+    """
+    after = request.headers.get("Last-Event-ID") or request.args.get("after", "0")
+    if not after.isdigit():
+        return jsonify({"error": "Last-Event-ID must be a cursor from a previous event"}), 400
+    events = message_events(
+        message_store(),
+        thread_token,
+        int(after),
+        float(app.config["TBEEP_STREAM_HEARTBEAT"]),
+    )
+    return Response(
+        events,
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 if __name__ == "__main__":
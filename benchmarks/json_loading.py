@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+"""Benchmark duplicate-key-rejecting JSON loading against the original loader."""
+
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from cpas.dka import seal_record
+from cpas.provenance import (
+    JCS_CANONICALIZATION,
+    DuplicateKeyError,
+    canonicalize_json,
+    loads_json,
+)
+
+
+def _baseline_reject_duplicates(pairs: Iterable[tuple[str, Any]]) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    for key, value in pairs:
+        if key in result:
+            raise DuplicateKeyError(f"duplicate JSON key: {key}")
+        result[key] = value
+    return result
+
+
+def baseline_loads_json(text: str) -> Any:
+    """The loader as it was before the shared decoder: one decoder per call."""
+
+    def reject_constant(value: str) -> None:
+        raise ValueError(f"non-finite JSON number: {value}")
+
+    return json.loads(
+        text,
+        object_pairs_hook=_baseline_reject_duplicates,
+        parse_constant=reject_constant,
+    )
+
+
+def example_corpus() -> list[str]:
+    paths = sorted((ROOT / "examples").rglob("*.json"))
+    paths += sorted((ROOT / "agents" / "json").rglob("*.json"))
+    paths += sorted((ROOT / "schemas").glob("*.schema.json"))
+    return [path.read_text(encoding="utf-8") for path in paths]
+
+
+def synthetic_corpus(records: int = 20, relationships: int = 2_000) -> list[str]:
+    base = json.loads(
+        (ROOT / "examples/v2/dka-e-v2.example.json").read_text(encoding="utf-8")
+    )
+    corpus = []
+    for index in range(records):
+        record = dict(base)
+        record["dka_id"] = f"{base['dka_id']}-bench-{index}"
+        record["relationships"] = [
+            {"relation": "supports", "target": f"urn:cpas:bench:{index}:{item:06d}"}
+            for item in range(relationships)
+        ]
+        sealed = seal_record(record)
+        corpus.append(canonicalize_json(sealed, profile=JCS_CANONICALIZATION).decode("utf-8"))
+    return corpus
+
+
+def audit_event_corpus(count: int = 2_000) -> list[str]:
+    return [
+        canonicalize_json(
+            {
+                "event_version": "1.0",
+                "sequence": index,
+                "event_type": "commit",
+                "dka_ref": {"dka_id": f"bench-{index}", "branch": "main"},
+                "actor": {"principal_id": "bench"},
+                "detail": {},
+            },
+            profile=JCS_CANONICALIZATION,
+        ).decode("utf-8")
+        for index in range(count)
+    ]
+
+
+def measure(loader: Callable[[str], Any], corpus: list[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in corpus:
+            loader(text)
+    return time.perf_counter() - start
+
+
+def benchmark(repeat: int = 5) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    for name, corpus in (
+        ("examples", example_corpus()),
+        ("synthetic_dka", synthetic_corpus()),
+        ("audit_events", audit_event_corpus()),
+    ):
+        for text in corpus:
+            assert loads_json(text) == baseline_loads_json(text)
+        size = sum(len(text.encode("utf-8")) for text in corpus) * repeat
+        baseline = measure(baseline_loads_json, corpus, repeat)
+        current = measure(loads_json, corpus, repeat)
+        results[name] = {
+            "documents": len(corpus),
+            "baseline_mib_per_second": size / baseline / 2**20,
+            "loads_json_mib_per_second": size / current / 2**20,
+            "speedup": baseline / current,
+        }
+    return results
+
+
+def main() -> None:
+    result = benchmark()
+    out = Path(__file__).with_name('results.log')
+    with out.open('a', encoding='utf-8') as f:
+        f.write(json.dumps({"json_loading": result}) + '\n')
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == '__main__':
+    main()
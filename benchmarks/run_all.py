@@ -9,6 +9,10 @@ SCRIPTS = [
     'hardware_specs.py',
     'token_processing.py',
     'update_throughput.py',
+    'seal_verify_allocations.py',
+    'json_loading.py',
+    'transcript_replay.py',
+    'transcript_validation.py',
 ]
 
 
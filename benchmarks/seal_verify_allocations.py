@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+"""Benchmark peak allocations and time of DKA-E seal, verify and store paths."""
+
+import copy
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from cpas.dka import merge_records, revise_record, seal_record, verify_record_integrity
+from cpas.dka_store import StoreContext
+from cpas.sqlite_dka_store import SQLiteDKAStore
+
+
+def large_record(relationships: int) -> dict[str, Any]:
+    record = json.loads(
+        (ROOT / "examples/v2/dka-e-v2.example.json").read_text(encoding="utf-8")
+    )
+    record["relationships"] = [
+        {"relation": "supports", "target": f"urn:cpas:bench:{index:06d}"}
+        for index in range(relationships)
+    ]
+    return seal_record(record)
+
+
+def measure(operation: Callable[[], Any], repeat: int) -> dict[str, float]:
+    operation()
+    tracemalloc.start()
+    operation()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        operation()
+    elapsed = time.perf_counter() - start
+    return {"peak_kib": peak / 1024, "ms_per_op": elapsed * 1000 / repeat}
+
+
+def benchmark(relationships: int = 5_000, repeat: int = 20) -> dict[str, Any]:
+    record = large_record(relationships)
+    left = revise_record(
+        record,
+        {"title": "Left benchmark title"},
+        actor="bench",
+        updated_at="2026-08-13T00:00:00Z",
+        change_summary="left",
+    )
+    right = revise_record(
+        record,
+        {"claim": "Right benchmark claim."},
+        actor="bench",
+        updated_at="2026-08-13T00:00:00Z",
+        change_summary="right",
+    )
+    context = StoreContext(
+        tenant_id="tenant-bench",
+        principal_id="bench",
+        permissions=frozenset({"dka:*"}),
+        authentication_ref="bench-authn",
+        authorization_ref="bench-authz",
+        request_id="bench",
+    )
+    results: dict[str, Any] = {
+        "relationships": relationships,
+        "verify_record_integrity": measure(lambda: verify_record_integrity(record), repeat),
+        "seal_record": measure(lambda: seal_record(record), repeat),
+        "revise_record": measure(
+            lambda: revise_record(
+                record,
+                {"title": "Benchmark revision"},
+                actor="bench",
+                updated_at="2026-08-13T00:00:00Z",
+                change_summary="bench",
+            ),
+            repeat,
+        ),
+        "merge_records": measure(
+            lambda: merge_records(
+                record,
+                left,
+                right,
+                actor="bench",
+                updated_at="2026-08-13T00:00:00Z",
+                target_branch="main",
+            ),
+            repeat,
+        ),
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        store = SQLiteDKAStore(
+            Path(directory) / "bench.db",
+            tenant_id="tenant-bench",
+            local_filesystem=True,
+        )
+        counter = iter(range(1_000_000))
+
+        def put() -> None:
+            candidate = copy.deepcopy(record)
+            candidate["dka_id"] = f"{record['dka_id']}-{next(counter)}"
+            candidate = seal_record(candidate)
+            store.put(candidate, expected_head=None, context=context)
+
+        results["sqlite_put"] = measure(put, repeat)
+        store.close()
+    return results
+
+
+def main() -> None:
+    result = benchmark()
+    out = Path(__file__).with_name('results.log')
+    with out.open('a', encoding='utf-8') as f:
+        f.write(json.dumps({"seal_verify_allocations": result}) + '\n')
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == '__main__':
+    main()
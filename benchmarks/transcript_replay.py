@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+"""Benchmark memory and latency of transcript replay adapters.
+
+Compares the eager ``TranscriptRuntimeAdapter`` (load the transcript, then
+deep-copy it into indexes and again on every call) with the byte-offset
+``IndexedTranscriptRuntimeAdapter`` over a synthetic recorded transcript.
+"""
+
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from cpas.provenance import load_json
+from cpas.runtime import IndexedTranscriptRuntimeAdapter, TranscriptRuntimeAdapter
+
+FIXTURE = ROOT / "compliance-tests/runtime-evaluation/clarence-9-v1/candidate-transcript.json"
+
+
+def synthetic_transcript(path: Path, responses: int, evidence_items: int) -> list[dict[str, Any]]:
+    transcript = load_json(FIXTURE)
+    template = transcript["responses"][0]
+    cases = []
+    items = []
+    for index in range(responses):
+        case_id = f"bench-case-{index:05d}"
+        item = json.loads(json.dumps(template))
+        item["case_id"] = item["output"]["case_id"] = case_id
+        item["output"]["epistemic_summary"]["evidence"] = [
+            f"recorded observation {index}.{line}" for line in range(evidence_items)
+        ]
+        items.append(item)
+        cases.append({"case_id": case_id})
+    transcript["responses"] = items
+    path.write_text(json.dumps(transcript), encoding="utf-8")
+    return cases
+
+
+def eager_adapter(path: Path) -> TranscriptRuntimeAdapter:
+    return TranscriptRuntimeAdapter(load_json(path))
+
+
+def measure(open_adapter: Callable[[Path], Any], path: Path, cases: list[dict[str, Any]]) -> dict[str, float]:
+    """Memory held by the open adapter, peak memory of opening and fully
+    replaying it, then the time of each step."""
+
+    tracemalloc.start()
+    adapter = open_adapter(path)
+    retained = tracemalloc.get_traced_memory()[0]
+    for case in cases:
+        adapter.invoke(case)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del adapter
+    start = time.perf_counter()
+    adapter = open_adapter(path)
+    opened = time.perf_counter()
+    for case in cases:
+        adapter.invoke(case)
+    replayed = time.perf_counter()
+    return {
+        "retained_kib": retained / 1024,
+        "peak_kib": peak / 1024,
+        "open_seconds": opened - start,
+        "us_per_invoke": (replayed - opened) * 1e6 / len(cases),
+    }
+
+
+def benchmark(responses: int = 2_000, evidence_items: int = 50) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "transcript.json"
+        cases = synthetic_transcript(path, responses, evidence_items)
+        return {
+            "responses": responses,
+            "file_kib": path.stat().st_size / 1024,
+            "eager": measure(eager_adapter, path, cases),
+            "indexed": measure(IndexedTranscriptRuntimeAdapter, path, cases),
+        }
+
+
+def main() -> None:
+    result = benchmark()
+    out = Path(__file__).with_name("results.log")
+    with out.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"transcript_replay": result}) + "\n")
+    print(result)
+
+
+if __name__ == "__main__":
+    main()
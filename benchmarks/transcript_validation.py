@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+"""Benchmark memory and time of runtime transcript validation.
+
+Compares loading a transcript and validating the whole document
+(``load_json`` + ``validate_transcript``) with the streaming
+``load_transcript`` and the entry-discarding ``validate_transcript_file``
+over a synthetic, correctly sealed recorded transcript.
+"""
+
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from cpas.evaluation import (
+    load_transcript,
+    seal_transcript,
+    validate_transcript,
+    validate_transcript_file,
+)
+from cpas.provenance import load_json
+
+FIXTURE = ROOT / "compliance-tests/runtime-evaluation/clarence-9-v1/candidate-transcript.json"
+
+
+def synthetic_transcript(path: Path, responses: int, evidence_items: int) -> None:
+    transcript = load_json(FIXTURE)
+    template = transcript["responses"][0]
+    items = []
+    for index in range(responses):
+        case_id = f"bench-case-{index:05d}"
+        item = json.loads(json.dumps(template))
+        item["case_id"] = item["output"]["case_id"] = case_id
+        item["output"]["epistemic_summary"]["evidence"] = [
+            f"recorded observation {index}.{line}" for line in range(evidence_items)
+        ]
+        items.append(item)
+    transcript["responses"] = items
+    path.write_text(json.dumps(seal_transcript(transcript)), encoding="utf-8")
+
+
+def whole_document(path: Path) -> Any:
+    transcript = load_json(path)
+    validate_transcript(transcript)
+    return transcript
+
+
+def measure(validate: Callable[[Path], Any], path: Path) -> dict[str, float]:
+    """Peak traced memory of one validation, then its best-of-three time."""
+
+    tracemalloc.start()
+    validate(path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        validate(path)
+        timings.append(time.perf_counter() - start)
+    return {"peak_kib": peak / 1024, "seconds": min(timings)}
+
+
+def benchmark(responses: int = 2_000, evidence_items: int = 50) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "transcript.json"
+        synthetic_transcript(path, responses, evidence_items)
+        return {
+            "responses": responses,
+            "file_kib": path.stat().st_size / 1024,
+            "whole_document": measure(whole_document, path),
+            "load_transcript": measure(load_transcript, path),
+            "validate_transcript_file": measure(validate_transcript_file, path),
+        }
+
+
+def main() -> None:
+    result = benchmark()
+    out = Path(__file__).with_name("results.log")
+    with out.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"transcript_validation": result}) + "\n")
+    print(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
-"""Benchmark script for measuring update throughput of the T-BEEP API."""
+"""Benchmark script for measuring update throughput of the T-BEEP API.
+
+Each message store backend is measured through the Flask test client: the
+default in-memory store, SQLite with one message per request, and SQLite
+with many messages per ``:batch`` request (one commit each).
+"""
 
 import json
+import tempfile
 import time
 from pathlib import Path
 import sys
@@ -11,31 +17,64 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from api.tbeep_api import app
+from api.tbeep_api import (
+    InMemoryMessageStore,
+    MessageStore,
+    SQLiteMessageStore,
+    app,
+    set_message_store,
+)
+
+
+PAYLOAD = {
+    "threadToken": "#BENCH_001.0",
+    "instance": "Bench",
+    "reasoningLevel": "Basic",
+    "confidence": "High",
+    "collaborationMode": "Benchmark",
+    "timestamp": "2025-01-01T00:00:00Z",
+    "version": "#BENCH.v1.0",
+    "content": "x",
+}
 
 
-def benchmark(count: int = 100) -> dict[str, float]:
+def benchmark(
+    count: int = 100, store: MessageStore | None = None, *, batch_size: int = 1
+) -> dict[str, float]:
+    previous = set_message_store(store) if store is not None else None
     client = app.test_client()
-    payload = {
-        "threadToken": "#BENCH_001.0",
-        "instance": "Bench",
-        "reasoningLevel": "Basic",
-        "confidence": "High",
-        "collaborationMode": "Benchmark",
-        "timestamp": "2025-01-01T00:00:00Z",
-        "version": "#BENCH.v1.0",
-        "content": "x",
-    }
     start = time.perf_counter()
-    for _ in range(count):
-        client.post("/api/v1/messages", json=payload)
+    if batch_size == 1:
+        for _ in range(count):
+            client.post("/api/v1/messages", json=PAYLOAD)
+    else:
+        for offset in range(0, count, batch_size):
+            size = min(batch_size, count - offset)
+            client.post("/api/v1/messages:batch", json=[PAYLOAD] * size)
     elapsed = time.perf_counter() - start
+    if previous is not None:
+        set_message_store(previous)
     ups = count / elapsed if elapsed else 0.0
     return {"updates": count, "seconds": elapsed, "updates_per_second": ups}
 
 
+def compare_backends(count: int = 500, batch_size: int = 64) -> dict[str, dict[str, float]]:
+    results = {"memory": benchmark(count, InMemoryMessageStore())}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, size in (("sqlite", 1), ("sqlite_batched", batch_size)):
+            store = SQLiteMessageStore(Path(tmp) / f"{name}.db")
+            try:
+                results[name] = {
+                    **benchmark(count, store, batch_size=size),
+                    "batch_size": size,
+                }
+            finally:
+                store.close()
+    return results
+
+
 def main() -> None:
-    result = benchmark()
+    result = compare_backends()
     out = Path(__file__).with_name('results.log')
     with out.open('a', encoding='utf-8') as f:
         f.write(json.dumps({"update_throughput": result}) + '\n')
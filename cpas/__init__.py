@@ -8,10 +8,13 @@ distributed persistence, or model-runtime implementation.
 from .identity import identity_digest, identity_projection
 from .dka_store import DKAStore, StoreContext
 from .evaluation import (
+    compare_runtime_candidates,
     compare_runtime_transcripts,
+    load_transcript,
     validate_manifest,
     validate_report,
     validate_transcript,
+    validate_transcript_file,
 )
 from .governance import (
     classify_declaration_change,
@@ -25,18 +28,26 @@ from .idp import (
     migrate_idp_v2_draft_governance,
     validate_idp,
 )
+from .record_cache import VerifiedRecordCache
 from .sqlite_dka_store import SQLiteDKAStore
-from .runtime import RuntimeAdapter, TranscriptRuntimeAdapter
+from .runtime import (
+    IndexedTranscriptRuntimeAdapter,
+    RuntimeAdapter,
+    TranscriptRuntimeAdapter,
+)
 
 __all__ = [
     "identity_digest",
     "identity_projection",
     "DKAStore",
     "StoreContext",
+    "compare_runtime_candidates",
     "compare_runtime_transcripts",
+    "load_transcript",
     "validate_manifest",
     "validate_report",
     "validate_transcript",
+    "validate_transcript_file",
     "classify_declaration_change",
     "create_transition_record",
     "evaluate_approvals",
@@ -45,9 +56,11 @@ __all__ = [
     "migrate_idp_v2_draft_governance",
     "validate_idp",
     "validate_transition",
+    "VerifiedRecordCache",
     "SQLiteDKAStore",
     "RuntimeAdapter",
     "TranscriptRuntimeAdapter",
+    "IndexedTranscriptRuntimeAdapter",
 ]
 
 __version__ = "2.0.0.dev1"
@@ -9,18 +9,17 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Mapping
 
-from jsonschema import Draft202012Validator, FormatChecker
 from jsonschema.exceptions import ValidationError
 
 from .provenance import (
     DKA_SNAPSHOT_DIGEST_PROFILE,
     JCS_CANONICALIZATION,
     LEGACY_CANONICALIZATION,
-    load_json,
+    omit_paths,
     profiled_digest,
     resolve_digest_profile,
-    without_paths,
 )
+from .schema_cache import schema_validator
 
 
 REPOSITORY_ROOT = Path(__file__).resolve().parents[1]
@@ -29,8 +28,7 @@ _UNSET = object()
 
 
 def validate_record(record: Mapping[str, Any]) -> None:
-    schema = load_json(DKA_SCHEMA)
-    validator = Draft202012Validator(schema, format_checker=FormatChecker())
+    validator = schema_validator(DKA_SCHEMA)
     errors = sorted(validator.iter_errors(dict(record)), key=lambda error: list(error.path))
     if errors:
         details = "; ".join(
@@ -75,7 +73,7 @@ def dka_digest_spec(record: Mapping[str, Any]) -> tuple[str, str]:
 def dka_digest(record: Mapping[str, Any]) -> str:
     canonicalization, profile = dka_digest_spec(record)
     return profiled_digest(
-        without_paths(dict(record), [("integrity", "digest")]),
+        omit_paths(record, [("integrity", "digest")]),
         canonicalization=canonicalization,
         digest_profile=profile,
         expected_v2_profile=DKA_SNAPSHOT_DIGEST_PROFILE,
@@ -89,7 +87,23 @@ def seal_record(
     digest_profile: str | None | object = _UNSET,
     validate: bool = True,
 ) -> dict[str, Any]:
-    sealed = copy.deepcopy(dict(record))
+    return _seal_owned(
+        copy.deepcopy(dict(record)),
+        canonicalization=canonicalization,
+        digest_profile=digest_profile,
+        validate=validate,
+    )
+
+
+def _seal_owned(
+    sealed: dict[str, Any],
+    *,
+    canonicalization: str | None = None,
+    digest_profile: str | None | object = _UNSET,
+    validate: bool = True,
+) -> dict[str, Any]:
+    """Seal a record this module already owns, in place."""
+
     integrity = sealed.setdefault("integrity", {})
     if not isinstance(integrity, dict):
         raise TypeError("DKA integrity metadata must be an object")
@@ -227,17 +241,17 @@ def revise_record(
     revised["provenance"]["transformations"] = list(
         revised["provenance"].get("transformations", [])
     ) + [f"revision by {actor}: {change_summary}"]
-    return seal_record(revised)
+    return _seal_owned(revised)
 
 
 def _select_three_way(base: Any, left: Any, right: Any) -> tuple[Any, bool]:
-    if left == right:
-        return copy.deepcopy(left), False
+    """Choose a field value; the caller copies it only if it is not ``base``."""
+
     if left == base:
-        return copy.deepcopy(right), False
-    if right == base:
-        return copy.deepcopy(left), False
-    return copy.deepcopy(base), True
+        return right, False
+    if right == base or left == right:
+        return left, False
+    return base, True
 
 
 def _position(value: Any) -> str:
@@ -280,8 +294,8 @@ def merge_records(
         value, conflict = _select_three_way(base.get(field), left.get(field), right.get(field))
         if value is None and field not in base:
             merged.pop(field, None)
-        else:
-            merged[field] = value
+        elif value is not base.get(field):
+            merged[field] = copy.deepcopy(value)
         if conflict:
             conflicts.append((field, left.get(field), right.get(field)))
 
@@ -317,4 +331,4 @@ def merge_records(
     merged["provenance"]["transformations"] = list(
         merged["provenance"].get("transformations", [])
     ) + [f"three-way merge by {actor}"]
-    return seal_record(merged)
+    return _seal_owned(merged)
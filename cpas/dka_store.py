@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import contextlib
-import copy
 import fcntl
 import json
 import os
@@ -11,11 +10,12 @@ import tempfile
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterator, Mapping, Protocol, runtime_checkable
+from typing import Any, Iterable, Iterator, Mapping, Protocol, runtime_checkable
 from urllib.parse import quote
 
 from .dka import dka_digest_spec, seal_record, validate_record, verify_record_integrity
-from .provenance import LEGACY_DIGEST_PROFILE, load_json
+from .provenance import LEGACY_DIGEST_PROFILE, load_json, loads_json
+from .record_cache import VerifiedRecordCache, json_copy
 
 
 class DKAStoreError(RuntimeError):
@@ -157,6 +157,13 @@ class DKAStore(Protocol):
         context: StoreContext | None = None,
     ) -> dict[str, Any]: ...
 
+    def get_many(
+        self,
+        refs: Iterable[Mapping[str, Any]],
+        *,
+        context: StoreContext | None = None,
+    ) -> list[dict[str, Any]]: ...
+
     def history(
         self,
         dka_id: str,
@@ -165,6 +172,17 @@ class DKAStore(Protocol):
         context: StoreContext | None = None,
     ) -> list[dict[str, Any]]: ...
 
+    def iter_history(
+        self,
+        dka_id: str,
+        branch: str = "main",
+        *,
+        since_revision: int | None = None,
+        until_revision: int | None = None,
+        newest_first: bool = False,
+        context: StoreContext | None = None,
+    ) -> Iterator[dict[str, Any]]: ...
+
     def events(
         self,
         dka_id: str,
@@ -184,6 +202,37 @@ class DKAStore(Protocol):
     ) -> dict[str, Any]: ...
 
 
+def lookup_result(index: int, outcome: Mapping[str, Any] | Exception) -> dict[str, Any]:
+    """Shape one ``get_many`` entry from a record or a per-reference failure."""
+
+    if isinstance(outcome, DKAStoreError):
+        return {"index": index, "status": "error", "error": outcome.as_dict()}
+    if isinstance(outcome, Exception):
+        return {
+            "index": index,
+            "status": "error",
+            "error": {
+                "code": "invalid_reference",
+                "message": str(outcome),
+                "retryable": False,
+            },
+        }
+    return {"index": index, "status": "found", "record": outcome}
+
+
+def revision_bounds(
+    since_revision: int | None, until_revision: int | None
+) -> tuple[int, int | None]:
+    """Validate an inclusive ``iter_history`` revision range."""
+
+    for name, value in (("since_revision", since_revision), ("until_revision", until_revision)):
+        if value is not None and (
+            not isinstance(value, int) or isinstance(value, bool) or value < 1
+        ):
+            raise ValueError(f"{name} must be a positive integer")
+    return since_revision or 1, until_revision
+
+
 def assert_lineage(
     candidate: Mapping[str, Any], current: Mapping[str, Any] | None
 ) -> None:
@@ -242,8 +291,14 @@ class FileDKAStore:
     persistence_kind = "local-filesystem-reference"
     profile_id = "cpas-file-reference-v1"
 
-    def __init__(self, root: str | Path):
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        record_cache: VerifiedRecordCache | None = None,
+    ):
         self.root = Path(root)
+        self.record_cache = record_cache
         for child in ("snapshots", "heads", "events", "locks"):
             (self.root / child).mkdir(parents=True, exist_ok=True)
 
@@ -313,7 +368,9 @@ class FileDKAStore:
         actor: str = "unspecified",
         context: StoreContext | None = None,
     ) -> dict[str, Any]:
-        candidate = copy.deepcopy(dict(record))
+        # A private copy: nested values shared with the caller could change
+        # while we wait for the branch lock, after integrity was verified.
+        candidate = json_copy(dict(record))
         validate_record(candidate)
         if not verify_record_integrity(candidate):
             raise DKAStoreError("record integrity verification failed")
@@ -395,21 +452,60 @@ class FileDKAStore:
                 raise RecordNotFound(f"no head for {dka_id}/{branch}")
             revision = int(head["revision"])
             expected_digest = head["digest"]
+            key = (head.get("digest_profile", LEGACY_DIGEST_PROFILE), expected_digest)
         else:
             expected_digest = None
+            key = None
         path = self._snapshot_path(dka_id, branch, revision)
         if not path.exists():
             raise RecordNotFound(f"no snapshot for {dka_id}/{branch}/{revision}")
-        record = load_json(path)
-        if not isinstance(record, dict):
-            raise DKAStoreError("snapshot is not an object")
-        validate_record(record)
-        if not verify_record_integrity(record):
-            raise DKAStoreError("snapshot digest verification failed")
+        payload = path.read_text(encoding="utf-8")
+        record = (
+            self.record_cache.get(key, payload, location=str(path))
+            if self.record_cache is not None
+            else None
+        )
+        if record is None:
+            record = loads_json(payload)
+            if not isinstance(record, dict):
+                raise DKAStoreError("snapshot is not an object")
+            validate_record(record)
+            if not verify_record_integrity(record):
+                raise DKAStoreError("snapshot digest verification failed")
+            if self.record_cache is not None:
+                self.record_cache.put(
+                    (dka_digest_spec(record)[1], record["integrity"]["digest"]),
+                    payload,
+                    record,
+                    location=str(path),
+                )
         if expected_digest and record["integrity"]["digest"] != expected_digest:
             raise DKAStoreError("head digest does not match snapshot")
         return record
 
+    def get_many(
+        self,
+        refs: Iterable[Mapping[str, Any]],
+        *,
+        context: StoreContext | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch several ``{dka_id, branch, revision}`` refs, one entry per ref."""
+
+        results: list[dict[str, Any]] = []
+        for index, ref in enumerate(refs):
+            try:
+                record = self.get(
+                    ref["dka_id"],
+                    ref.get("branch", "main"),
+                    ref.get("revision"),
+                    context=context,
+                )
+            except (DKAStoreError, KeyError, TypeError, ValueError, OSError) as exc:
+                results.append(lookup_result(index, exc))
+            else:
+                results.append(lookup_result(index, record))
+        return results
+
     def history(
         self,
         dka_id: str,
@@ -417,14 +513,42 @@ class FileDKAStore:
         *,
         context: StoreContext | None = None,
     ) -> list[dict[str, Any]]:
+        return list(self.iter_history(dka_id, branch, context=context))
+
+    def iter_history(
+        self,
+        dka_id: str,
+        branch: str = "main",
+        *,
+        since_revision: int | None = None,
+        until_revision: int | None = None,
+        newest_first: bool = False,
+        context: StoreContext | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield revisions in an inclusive range, verifying each as it is read.
+
+        Only file names are listed up front; snapshot payloads are read and
+        validated one at a time as the caller advances the iterator.
+        """
+
+        low, high = revision_bounds(since_revision, until_revision)
         directory = self.root / "snapshots" / _component(dka_id) / _component(branch)
         if not directory.exists():
-            return []
-        revisions = sorted(int(path.stem) for path in directory.glob("*.json") if path.stem.isdigit())
-        return [
+            return iter(())
+        revisions = sorted(
+            (
+                revision
+                for revision in (
+                    int(path.stem) for path in directory.glob("*.json") if path.stem.isdigit()
+                )
+                if revision >= low and (high is None or revision <= high)
+            ),
+            reverse=newest_first,
+        )
+        return (
             self.get(dka_id, branch, revision, context=context)
             for revision in revisions
-        ]
+        )
 
     def events(
         self,
@@ -456,7 +580,8 @@ class FileDKAStore:
         if self.head(dka_id, target_branch, context=context) is not None:
             raise HeadConflict(f"target branch already exists: {target_branch}")
         source = self.get(dka_id, source_branch, context=context)
-        branched = copy.deepcopy(source)
+        # ``get`` returns a private copy and ``seal_record`` copies again.
+        branched = dict(source)
         branched["branch"] = target_branch
         branched["revision"] = 1
         branched["evolution"] = {
@@ -10,11 +10,15 @@ from __future__ import annotations
 
 import copy
 import json
+import tempfile
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Callable, Iterable, Iterator, Mapping, Sequence
 
-from jsonschema import Draft202012Validator, FormatChecker
 from jsonschema.exceptions import ValidationError
 
 from .identity import identity_digest
@@ -25,11 +29,15 @@ from .provenance import (
     RUNTIME_EVALUATION_MANIFEST_DIGEST_PROFILE,
     RUNTIME_EVALUATION_REPORT_DIGEST_PROFILE,
     RUNTIME_TRANSCRIPT_DIGEST_PROFILE,
+    canonicalize_json,
+    digest_hasher,
     file_sha256,
-    load_json,
+    omit_paths,
     profiled_digest,
 )
+from .json_stream import JSONStreamReader
 from .runtime import RuntimeAdapter, RuntimeAdapterError
+from .schema_cache import schema_validator
 
 
 REPOSITORY_ROOT = Path(__file__).resolve().parents[1]
@@ -57,22 +65,22 @@ class EvaluationError(RuntimeError):
     """Evaluation input, contract, or integrity failure."""
 
 
-def _validator(path: Path) -> Draft202012Validator:
-    schema = load_json(path)
-    Draft202012Validator.check_schema(schema)
-    return Draft202012Validator(schema, format_checker=FormatChecker())
-
-
-def _validate_schema(value: Mapping[str, Any], path: Path, label: str) -> None:
-    errors = sorted(_validator(path).iter_errors(dict(value)), key=lambda error: list(error.path))
+def _check_schema(
+    validator: Any, value: Any, label: str, prefix: tuple[Any, ...] = ()
+) -> None:
+    errors = sorted(validator.iter_errors(value), key=lambda error: list(error.path))
     if errors:
         details = "; ".join(
-            f"{'/'.join(map(str, error.path)) or '<root>'}: {error.message}"
+            f"{'/'.join(map(str, (*prefix, *error.path))) or '<root>'}: {error.message}"
             for error in errors
         )
         raise ValidationError(f"{label}: {details}")
 
 
+def _validate_schema(value: Mapping[str, Any], path: Path, label: str) -> None:
+    _check_schema(schema_validator(path), dict(value), label)
+
+
 def _without_integrity(value: Mapping[str, Any]) -> dict[str, Any]:
     projected = copy.deepcopy(dict(value))
     projected.pop("integrity", None)
@@ -81,7 +89,7 @@ def _without_integrity(value: Mapping[str, Any]) -> dict[str, Any]:
 
 def _semantic_digest(value: Mapping[str, Any], profile: str) -> str:
     return profiled_digest(
-        _without_integrity(value),
+        omit_paths(value, [("integrity",)]),
         canonicalization=JCS_CANONICALIZATION,
         digest_profile=profile,
         expected_v2_profile=profile,
@@ -97,7 +105,10 @@ def runtime_configuration_projection(runtime: Mapping[str, Any]) -> dict[str, An
 
 def runtime_configuration_digest(runtime: Mapping[str, Any]) -> str:
     return profiled_digest(
-        runtime_configuration_projection(runtime),
+        omit_paths(
+            runtime,
+            [("configuration_digest",), ("configuration_digest_profile",)],
+        ),
         canonicalization=JCS_CANONICALIZATION,
         digest_profile=RUNTIME_CONFIGURATION_DIGEST_PROFILE,
         expected_v2_profile=RUNTIME_CONFIGURATION_DIGEST_PROFILE,
@@ -118,7 +129,7 @@ def seal_manifest(manifest: Mapping[str, Any]) -> dict[str, Any]:
 
 def seal_transcript(transcript: Mapping[str, Any]) -> dict[str, Any]:
     sealed = _without_integrity(transcript)
-    runtime = copy.deepcopy(dict(sealed["runtime"]))
+    runtime = dict(sealed["runtime"])
     runtime["configuration_digest_profile"] = RUNTIME_CONFIGURATION_DIGEST_PROFILE
     runtime["configuration_digest"] = runtime_configuration_digest(runtime)
     sealed["runtime"] = runtime
@@ -140,7 +151,15 @@ def seal_report(report: Mapping[str, Any]) -> dict[str, Any]:
     return sealed
 
 
-def _validate_integrity(value: Mapping[str, Any], profile: str, label: str) -> None:
+def _validate_integrity(
+    value: Mapping[str, Any],
+    profile: str,
+    label: str,
+    *,
+    digest: str | None = None,
+) -> None:
+    """Check ``value``'s seal; ``digest`` supplies an already-streamed digest."""
+
     integrity = value.get("integrity")
     if not isinstance(integrity, Mapping):
         raise EvaluationError(f"{label} integrity metadata is missing")
@@ -148,11 +167,17 @@ def _validate_integrity(value: Mapping[str, Any], profile: str, label: str) -> N
         raise EvaluationError(f"{label} canonicalization is not {JCS_CANONICALIZATION}")
     if integrity.get("digest_profile") != profile:
         raise EvaluationError(f"{label} digest profile is not {profile}")
-    expected = _semantic_digest(value, profile)
+    expected = digest if digest is not None else _semantic_digest(value, profile)
     if integrity.get("digest") != expected:
         raise EvaluationError(f"{label} integrity digest mismatch")
 
 
+def verify_report_integrity(report: Mapping[str, Any]) -> None:
+    """Check only a report's seal, for reports already validated when sealed."""
+
+    _validate_integrity(report, RUNTIME_EVALUATION_REPORT_DIGEST_PROFILE, "report")
+
+
 def validate_manifest(manifest: Mapping[str, Any]) -> None:
     _validate_schema(manifest, MANIFEST_SCHEMA, "runtime evaluation manifest")
     _validate_integrity(
@@ -244,12 +269,36 @@ def validate_manifest(manifest: Mapping[str, Any]) -> None:
 
 def validate_transcript(transcript: Mapping[str, Any]) -> None:
     _validate_schema(transcript, TRANSCRIPT_SCHEMA, "runtime transcript")
+    _check_transcript(
+        transcript,
+        probe_ids=[item["probe_id"] for item in transcript["capability_probes"]],
+        case_ids=[item["case_id"] for item in transcript["responses"]],
+        evidence_kinds={
+            item["evidence_kind"] for item in transcript["capability_probes"]
+        },
+    )
+
+
+def _check_transcript(
+    transcript: Mapping[str, Any],
+    *,
+    probe_ids: list[str],
+    case_ids: list[str],
+    evidence_kinds: set[str],
+    digest: str | None = None,
+) -> None:
+    """Cross-field checks that follow schema validation of a transcript.
+
+    ``transcript`` may omit its entry arrays when ``digest`` and the entry
+    summaries were gathered while streaming them.
+    """
+
     runtime = transcript["runtime"]
     if runtime["configuration_digest"] != runtime_configuration_digest(runtime):
         raise EvaluationError("runtime configuration digest mismatch")
-    _validate_integrity(transcript, RUNTIME_TRANSCRIPT_DIGEST_PROFILE, "transcript")
-    probe_ids = [item["probe_id"] for item in transcript["capability_probes"]]
-    case_ids = [item["case_id"] for item in transcript["responses"]]
+    _validate_integrity(
+        transcript, RUNTIME_TRANSCRIPT_DIGEST_PROFILE, "transcript", digest=digest
+    )
     if len(probe_ids) != len(set(probe_ids)):
         raise EvaluationError("transcript probe identifiers must be unique")
     if len(case_ids) != len(set(case_ids)):
@@ -261,15 +310,257 @@ def validate_transcript(transcript: Mapping[str, Any]) -> None:
         "recorded_runtime": {"recorded_observation"},
         "live_runtime": {"live_probe"},
     }[transcript["assurance"]]
-    observed_evidence = {
-        item["evidence_kind"] for item in transcript["capability_probes"]
-    }
-    if not observed_evidence.issubset(allowed_evidence):
+    if not evidence_kinds.issubset(allowed_evidence):
         raise EvaluationError(
             "transcript capability evidence kind exceeds its assurance level"
         )
 
 
+_TRANSCRIPT_ENTRIES = {"capability_probes": "probe_id", "responses": "case_id"}
+_TRANSCRIPT_PARTS_LOCK = threading.Lock()
+_TRANSCRIPT_PARTS: tuple[Any, Any, dict[str, Any]] | None = None
+
+
+def _transcript_part_validators() -> tuple[Any, dict[str, Any]]:
+    """Validators for a transcript's header and for one item of each array.
+
+    Derived from the cached transcript schema and rebuilt whenever the
+    schema cache compiles a new validator for it.
+    """
+
+    global _TRANSCRIPT_PARTS
+    root = schema_validator(TRANSCRIPT_SCHEMA)
+    with _TRANSCRIPT_PARTS_LOCK:
+        if _TRANSCRIPT_PARTS is not None and _TRANSCRIPT_PARTS[0] is root:
+            return _TRANSCRIPT_PARTS[1], _TRANSCRIPT_PARTS[2]
+    schema = root.schema
+    header_schema = dict(schema)
+    header_schema["required"] = [
+        name for name in schema["required"] if name not in _TRANSCRIPT_ENTRIES
+    ]
+    header_schema["properties"] = {
+        **schema["properties"],
+        **{name: {"type": "array"} for name in _TRANSCRIPT_ENTRIES},
+    }
+    header = root.evolve(schema=header_schema)
+    items = {
+        name: root.evolve(schema=schema["properties"][name]["items"])
+        for name in _TRANSCRIPT_ENTRIES
+    }
+    with _TRANSCRIPT_PARTS_LOCK:
+        _TRANSCRIPT_PARTS = (root, header, items)
+    return header, items
+
+
+def _jcs_key(name: str) -> bytes:
+    return name.encode("utf-16-be")
+
+
+class _ObjectDigest:
+    """Hash a JCS object whose members arrive in document order.
+
+    JCS orders members by key, so a member is hashed as soon as every member
+    before it in key order has been; earlier arrivals wait, small values in
+    memory and arrays in a spooled temporary file. A document already in key
+    order is hashed without buffering anything.
+    """
+
+    SPOOL_BYTES = 1024 * 1024
+
+    def __init__(self, hasher: Any, keys: Iterable[str]):
+        self._hasher = hasher
+        self._order = sorted(keys, key=_jcs_key)
+        self._next = 0
+        self._held: dict[str, Any] = {}
+        self._sink: Any = None
+        self._first_item = True
+
+    def _is_next(self, key: str) -> bool:
+        return self._next < len(self._order) and self._order[self._next] == key
+
+    def _prefix(self, key: str) -> None:
+        self._hasher.update(b"{" if self._next == 0 else b",")
+        self._hasher.update(canonicalize_json(key, profile=JCS_CANONICALIZATION))
+        self._hasher.update(b":")
+
+    def _advance(self) -> None:
+        self._next += 1
+        while self._next < len(self._order) and self._order[self._next] in self._held:
+            key = self._order[self._next]
+            held = self._held.pop(key)
+            self._prefix(key)
+            if isinstance(held, bytes):
+                self._hasher.update(held)
+            else:
+                with held:
+                    held.seek(0)
+                    for chunk in iter(lambda: held.read(self.SPOOL_BYTES), b""):
+                        self._hasher.update(chunk)
+            self._next += 1
+
+    def member(self, key: str, value: Any) -> None:
+        data = canonicalize_json(value, profile=JCS_CANONICALIZATION)
+        if self._is_next(key):
+            self._prefix(key)
+            self._hasher.update(data)
+            self._advance()
+        else:
+            self._held[key] = data
+
+    def open_array(self, key: str) -> None:
+        if self._is_next(key):
+            self._prefix(key)
+            self._sink = self._hasher
+        else:
+            self._sink = tempfile.SpooledTemporaryFile(max_size=self.SPOOL_BYTES)
+        self._first_item = True
+        self._write(b"[")
+
+    def _write(self, data: bytes) -> None:
+        if self._sink is self._hasher:
+            self._hasher.update(data)
+        else:
+            self._sink.write(data)
+
+    def item(self, value: Any) -> None:
+        if not self._first_item:
+            self._write(b",")
+        self._first_item = False
+        self._write(canonicalize_json(value, profile=JCS_CANONICALIZATION))
+
+    def close_array(self, key: str) -> None:
+        self._write(b"]")
+        sink, self._sink = self._sink, None
+        if sink is self._hasher:
+            self._advance()
+        else:
+            self._held[key] = sink
+
+    def digest(self) -> str:
+        if self._held or self._next != len(self._order):
+            raise EvaluationError("transcript members do not match the schema")
+        self._hasher.update(b"}")
+        return "sha256:" + self._hasher.hexdigest()
+
+    def close(self) -> None:
+        for held in self._held.values():
+            if not isinstance(held, bytes):
+                held.close()
+        if self._sink is not None and self._sink is not self._hasher:
+            self._sink.close()
+
+
+def _read_transcript(
+    path: str | Path, *, keep_entries: bool, chunk_size: int
+) -> dict[str, Any]:
+    header_validator, item_validators = _transcript_part_validators()
+    label = "runtime transcript"
+    members: dict[str, Any] = {}
+    counts: dict[str, int] = {}
+    identifiers: dict[str, list[str]] = {name: [] for name in _TRANSCRIPT_ENTRIES}
+    evidence_kinds: set[str] = set()
+    digest = _ObjectDigest(
+        digest_hasher(
+            canonicalization=JCS_CANONICALIZATION,
+            digest_profile=RUNTIME_TRANSCRIPT_DIGEST_PROFILE,
+        ),
+        (
+            name
+            for name in schema_validator(TRANSCRIPT_SCHEMA).schema["properties"]
+            if name != "integrity"
+        ),
+    )
+    try:
+        with Path(path).open("rb") as handle:
+            reader = JSONStreamReader(handle, chunk_size=chunk_size)
+            reader.expect("{")
+            first = True
+            while not reader.accept("}"):
+                if not first:
+                    reader.expect(",")
+                first = False
+                key = reader.value()
+                if not isinstance(key, str):
+                    raise ValueError(f"expected an object key at offset {reader.offset}")
+                if key in members:
+                    raise ValueError(f"duplicate JSON key: {key}")
+                reader.expect(":")
+                if key not in _TRANSCRIPT_ENTRIES or reader.peek() != "[":
+                    members[key] = reader.value()
+                    if key != "integrity":
+                        digest.member(key, members[key])
+                    continue
+                reader.expect("[")
+                digest.open_array(key)
+                entries: list[Any] = []
+                index = 0
+                while not reader.accept("]"):
+                    if index:
+                        reader.expect(",")
+                    item = reader.value()
+                    _check_schema(item_validators[key], item, label, (key, index))
+                    identifiers[key].append(item[_TRANSCRIPT_ENTRIES[key]])
+                    if key == "capability_probes":
+                        evidence_kinds.add(item["evidence_kind"])
+                    digest.item(item)
+                    if keep_entries:
+                        entries.append(item)
+                    index += 1
+                digest.close_array(key)
+                members[key] = entries
+                counts[key] = index
+            reader.end()
+            header = {key: value for key, value in members.items() if key not in counts}
+            _check_schema(header_validator, header, label)
+            for name, count in counts.items():
+                if not count:
+                    raise ValidationError(f"{label}: {name}: [] should be non-empty")
+            missing = [name for name in _TRANSCRIPT_ENTRIES if name not in members]
+            if missing:
+                raise ValidationError(
+                    f"{label}: <root>: '{missing[0]}' is a required property"
+                )
+            _check_transcript(
+                header,
+                probe_ids=identifiers["capability_probes"],
+                case_ids=identifiers["responses"],
+                evidence_kinds=evidence_kinds,
+                digest=digest.digest(),
+            )
+    except ValueError as exc:  # JSON syntax, encoding or canonicalization
+        raise EvaluationError(f"{label} {path}: {exc}") from exc
+    finally:
+        digest.close()
+    return members if keep_entries else header
+
+
+def load_transcript(path: str | Path, *, chunk_size: int = 64 * 1024) -> dict[str, Any]:
+    """Read, validate and digest a transcript file in one streaming pass.
+
+    Equivalent to :func:`~cpas.provenance.load_json` followed by
+    :func:`validate_transcript`, without a second walk for schema validation
+    or a re-serialization for the seal: each ``capability_probes`` and
+    ``responses`` item is checked against its sub-schema and fed to the
+    digest as it is decoded.
+    """
+
+    return _read_transcript(path, keep_entries=True, chunk_size=chunk_size)
+
+
+def validate_transcript_file(
+    path: str | Path, *, chunk_size: int = 64 * 1024
+) -> dict[str, Any]:
+    """Validate a transcript file without keeping its entries.
+
+    Performs every check of :func:`validate_transcript` and returns the
+    transcript header (every member except ``capability_probes`` and
+    ``responses``). Entries are discarded once checked, so memory stays
+    bounded by the largest single entry rather than the file.
+    """
+
+    return _read_transcript(path, keep_entries=False, chunk_size=chunk_size)
+
+
 def validate_report(
     report: Mapping[str, Any], *, manifest: Mapping[str, Any] | None = None
 ) -> None:
@@ -647,12 +938,15 @@ def _decode_pointer_token(token: str) -> str:
     return token.replace("~1", "/").replace("~0", "~")
 
 
-def _pointer(value: Any, pointer: str) -> Any:
+def _pointer_tokens(pointer: str) -> tuple[str, ...]:
     if pointer == "":
-        return value
+        return ()
+    return tuple(_decode_pointer_token(raw) for raw in pointer.split("/")[1:])
+
+
+def _resolve(value: Any, tokens: tuple[str, ...]) -> Any:
     current = value
-    for raw in pointer.split("/")[1:]:
-        token = _decode_pointer_token(raw)
+    for token in tokens:
         if isinstance(current, Mapping):
             if token not in current:
                 return _MISSING
@@ -691,43 +985,143 @@ def _observation(value: Any) -> dict[str, Any]:
     return {"present": True, "type": type(value).__name__}
 
 
-def evaluate_assertion(output: Mapping[str, Any], assertion: Mapping[str, Any]) -> dict[str, Any]:
-    observed = _pointer(output, assertion["path"])
+def _exists(observed: Any, expected: Any) -> bool:
+    return observed is not _MISSING
+
+
+def _absent(observed: Any, expected: Any) -> bool:
+    return observed is _MISSING
+
+
+def _equals(observed: Any, expected: Any) -> bool:
+    return observed is not _MISSING and observed == expected
+
+
+def _not_equals(observed: Any, expected: Any) -> bool:
+    return observed is not _MISSING and observed != expected
+
+
+def _contains(observed: Any, expected: Any) -> bool:
+    return isinstance(observed, (str, list)) and expected in observed
+
+
+def _not_contains(observed: Any, expected: Any) -> bool:
+    return isinstance(observed, (str, list)) and expected not in observed
+
+
+def _min_items(observed: Any, expected: int) -> bool:
+    return isinstance(observed, (list, Mapping)) and len(observed) >= expected
+
+
+def _max_items(observed: Any, expected: int) -> bool:
+    return isinstance(observed, (list, Mapping)) and len(observed) <= expected
+
+
+_PREDICATES: dict[str, Callable[[Any, Any], bool]] = {
+    "exists": _exists,
+    "absent": _absent,
+    "equals": _equals,
+    "not_equals": _not_equals,
+    "contains": _contains,
+    "not_contains": _not_contains,
+    "min_items": _min_items,
+    "max_items": _max_items,
+}
+
+
+@dataclass(frozen=True)
+class AssertionPlan:
+    """A machine assertion with its pointer decoded and predicate resolved.
+
+    Plans hold no per-output state, so one plan serves both runtimes and
+    every comparison under the same manifest.
+    """
+
+    assertion_id: str
+    path: str
+    operator: str
+    severity: str
+    drift_category: str
+    expected: Any
+    tokens: tuple[str, ...]
+    predicate: Callable[[Any, Any], bool]
+
+    def evaluate(self, output: Mapping[str, Any]) -> dict[str, Any]:
+        observed = _resolve(output, self.tokens)
+        return {
+            "assertion_id": self.assertion_id,
+            "path": self.path,
+            "operator": self.operator,
+            "severity": self.severity,
+            "drift_category": self.drift_category,
+            "passed": bool(self.predicate(observed, self.expected)),
+            "observation": _observation(observed),
+        }
+
+
+def compile_assertion(assertion: Mapping[str, Any]) -> AssertionPlan:
     operator = assertion["operator"]
-    expected = assertion.get("expected")
-    if operator == "exists":
-        passed = observed is not _MISSING
-    elif operator == "absent":
-        passed = observed is _MISSING
-    elif operator == "equals":
-        passed = observed is not _MISSING and observed == expected
-    elif operator == "not_equals":
-        passed = observed is not _MISSING and observed != expected
-    elif operator == "contains":
-        passed = observed is not _MISSING and isinstance(observed, (str, list)) and expected in observed
-    elif operator == "not_contains":
-        passed = observed is not _MISSING and isinstance(observed, (str, list)) and expected not in observed
-    elif operator == "min_items":
-        passed = isinstance(observed, (list, Mapping)) and len(observed) >= int(expected)
-    elif operator == "max_items":
-        passed = isinstance(observed, (list, Mapping)) and len(observed) <= int(expected)
-    else:  # schema validation should make this unreachable
+    predicate = _PREDICATES.get(operator)
+    if predicate is None:  # schema validation should make this unreachable
         raise EvaluationError(f"unsupported assertion operator: {operator}")
-    return {
-        "assertion_id": assertion["assertion_id"],
-        "path": assertion["path"],
-        "operator": operator,
-        "severity": assertion["severity"],
-        "drift_category": assertion["drift_category"],
-        "passed": bool(passed),
-        "observation": _observation(observed),
+    expected = assertion.get("expected")
+    if operator in {"min_items", "max_items"}:
+        expected = int(expected)
+    return AssertionPlan(
+        assertion_id=assertion["assertion_id"],
+        path=assertion["path"],
+        operator=operator,
+        severity=assertion["severity"],
+        drift_category=assertion["drift_category"],
+        expected=expected,
+        tokens=_pointer_tokens(assertion["path"]),
+        predicate=predicate,
+    )
+
+
+_PLAN_CACHE_SIZE = 32
+_PLAN_CACHE: OrderedDict[str, dict[str, tuple[AssertionPlan, ...]]] = OrderedDict()
+_PLAN_CACHE_LOCK = threading.Lock()
+
+
+def compile_assertion_plans(
+    manifest: Mapping[str, Any],
+) -> dict[str, tuple[AssertionPlan, ...]]:
+    """Return each case's compiled assertions, keyed by ``case_id``.
+
+    Plans are cached by the manifest's integrity digest, so callers must pass
+    a manifest that :func:`validate_manifest` accepted; the digest then
+    stands for the exact assertions.
+    """
+
+    digest = manifest["integrity"]["digest"]
+    with _PLAN_CACHE_LOCK:
+        plans = _PLAN_CACHE.get(digest)
+        if plans is not None:
+            _PLAN_CACHE.move_to_end(digest)
+            return plans
+    plans = {
+        case["case_id"]: tuple(
+            compile_assertion(assertion) for assertion in case["machine_assertions"]
+        )
+        for case in manifest["cases"]
     }
+    with _PLAN_CACHE_LOCK:
+        _PLAN_CACHE[digest] = plans
+        while len(_PLAN_CACHE) > _PLAN_CACHE_SIZE:
+            _PLAN_CACHE.popitem(last=False)
+    return plans
+
+
+def evaluate_assertion(output: Mapping[str, Any], assertion: Mapping[str, Any]) -> dict[str, Any]:
+    return compile_assertion(assertion).evaluate(output)
 
 
 def _run_case(
     adapter: RuntimeAdapter,
     case: Mapping[str, Any],
     *,
+    plans: tuple[AssertionPlan, ...],
     expected_response: Mapping[str, Any],
     maximum_response_bytes: int,
 ) -> dict[str, Any]:
@@ -750,10 +1144,9 @@ def _run_case(
         status = "invalid_output"
     else:
         status = "completed"
+    # Key order does not change the encoded length, so no sort is needed.
     encoded_size = len(
-        json.dumps(output, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode(
-            "utf-8"
-        )
+        json.dumps(output, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
     )
     if encoded_size > maximum_response_bytes:
         output = {}
@@ -764,10 +1157,7 @@ def _run_case(
         for event in tool_events
         if isinstance(event, Mapping) and event.get("executed") is True
     )
-    assertions = [
-        evaluate_assertion(output, assertion)
-        for assertion in case["machine_assertions"]
-    ]
+    assertions = [plan.evaluate(output) for plan in plans]
     if executed:
         assertions.append(
             {
@@ -800,63 +1190,87 @@ def _run_case(
     }
 
 
-def _probe_results(
+def _probe_result(
     adapter: RuntimeAdapter,
-    probes: list[Mapping[str, Any]],
-    expected_results: list[Mapping[str, Any]],
+    probe: Mapping[str, Any],
+    expected: Mapping[str, Any] | None,
     *,
-    evaluated_at: str,
-) -> list[dict[str, Any]]:
-    expected_by_id = {item["probe_id"]: dict(item) for item in expected_results}
-    evaluation_time = _parse_datetime(evaluated_at, "evaluated_at")
-    results: list[dict[str, Any]] = []
-    for probe in probes:
-        try:
-            observed = dict(adapter.probe(probe))
-        except RuntimeAdapterError as exc:
-            raise EvaluationError(
-                f"adapter could not replay transcript probe {probe['probe_id']}: {exc}"
-            ) from exc
-        if observed.get("probe_id") != probe["probe_id"]:
-            raise EvaluationError(f"adapter returned mismatched probe id: {probe['probe_id']}")
-        if observed.get("capability") != probe["capability"]:
-            raise EvaluationError(
-                f"adapter returned mismatched capability for {probe['probe_id']}"
-            )
-        if observed != expected_by_id.get(probe["probe_id"]):
+    evaluation_time: datetime,
+) -> dict[str, Any]:
+    try:
+        observed = dict(adapter.probe(probe))
+    except RuntimeAdapterError as exc:
+        raise EvaluationError(
+            f"adapter could not replay transcript probe {probe['probe_id']}: {exc}"
+        ) from exc
+    if observed.get("probe_id") != probe["probe_id"]:
+        raise EvaluationError(f"adapter returned mismatched probe id: {probe['probe_id']}")
+    if observed.get("capability") != probe["capability"]:
+        raise EvaluationError(
+            f"adapter returned mismatched capability for {probe['probe_id']}"
+        )
+    if observed != expected:
+        raise EvaluationError(
+            f"adapter probe differs from referenced transcript: {probe['probe_id']}"
+        )
+    observed_at = observed.get("observed_at")
+    if observed_at is None:
+        age_seconds = None
+        fresh = False
+    else:
+        observation_time = _parse_datetime(
+            str(observed_at), f"probe {probe['probe_id']} observed_at"
+        )
+        age = evaluation_time - observation_time
+        if age.total_seconds() < 0:
             raise EvaluationError(
-                f"adapter probe differs from referenced transcript: {probe['probe_id']}"
-            )
-        observed_at = observed.get("observed_at")
-        if observed_at is None:
-            age_seconds = None
-            fresh = False
-        else:
-            observation_time = _parse_datetime(
-                str(observed_at), f"probe {probe['probe_id']} observed_at"
+                f"probe observation occurs after evaluation: {probe['probe_id']}"
             )
-            age = evaluation_time - observation_time
-            if age.total_seconds() < 0:
-                raise EvaluationError(
-                    f"probe observation occurs after evaluation: {probe['probe_id']}"
-                )
-            age_seconds = int(age.total_seconds())
-            fresh = age_seconds <= int(probe["validity_horizon_days"]) * 86400
-        evaluated = {
-            "probe_id": observed["probe_id"],
-            "capability": observed["capability"],
-            "outcome": observed["outcome"],
-            "observed_at": observed["observed_at"],
-            "evidence_kind": observed["evidence_kind"],
-            "evidence_summary": _observation(observed["evidence"]),
-            "constraints_count": len(observed["constraints"]),
-            "validity_horizon_days": int(probe["validity_horizon_days"]),
-            "observed_age_seconds": age_seconds,
-            "fresh": fresh,
-            "effective_outcome": observed["outcome"] if fresh else "stale",
-        }
-        results.append(evaluated)
-    return results
+        age_seconds = int(age.total_seconds())
+        fresh = age_seconds <= int(probe["validity_horizon_days"]) * 86400
+    return {
+        "probe_id": observed["probe_id"],
+        "capability": observed["capability"],
+        "outcome": observed["outcome"],
+        "observed_at": observed["observed_at"],
+        "evidence_kind": observed["evidence_kind"],
+        "evidence_summary": _observation(observed["evidence"]),
+        "constraints_count": len(observed["constraints"]),
+        "validity_horizon_days": int(probe["validity_horizon_days"]),
+        "observed_age_seconds": age_seconds,
+        "fresh": fresh,
+        "effective_outcome": observed["outcome"] if fresh else "stale",
+    }
+
+
+def _ordered_results(
+    calls: Iterable[tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any]]],
+    *,
+    executor: Executor | None,
+    limit: int,
+) -> Iterator[Any]:
+    """Yield each call's result in submission order.
+
+    With an executor, at most ``limit`` calls are in flight. Results (and the
+    first exception) surface in the same order as a sequential run, and calls
+    not yet started are cancelled once one fails.
+    """
+
+    if executor is None:
+        for function, args, kwargs in calls:
+            yield function(*args, **kwargs)
+        return
+    pending: deque[Future] = deque()
+    try:
+        for function, args, kwargs in calls:
+            if len(pending) >= limit:
+                yield pending.popleft().result()
+            pending.append(executor.submit(function, *args, **kwargs))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
 
 
 def _parse_datetime(value: str, label: str) -> datetime:
@@ -879,6 +1293,78 @@ def _runtime_ref(transcript: Mapping[str, Any]) -> dict[str, Any]:
     }
 
 
+def _check_runtime(
+    manifest: Mapping[str, Any],
+    label: str,
+    adapter: RuntimeAdapter,
+    transcript: Mapping[str, Any],
+) -> None:
+    if adapter.adapter_contract != manifest["adapter_contract"]:
+        raise EvaluationError(f"{label} adapter contract mismatch")
+    if adapter.probe_contract != manifest["probe_contract"]:
+        raise EvaluationError(f"{label} capability-probe contract mismatch")
+    if dict(adapter.describe()) != dict(transcript["runtime"]):
+        raise EvaluationError(f"{label} adapter metadata differs from transcript")
+    expected_probe_ids = {item["probe_id"] for item in manifest["capability_probes"]}
+    expected_case_ids = {item["case_id"] for item in manifest["cases"]}
+    transcript_probe_ids = {item["probe_id"] for item in transcript["capability_probes"]}
+    transcript_case_ids = {item["case_id"] for item in transcript["responses"]}
+    if transcript_probe_ids != expected_probe_ids:
+        raise EvaluationError(f"{label} transcript probe coverage differs from manifest")
+    if transcript_case_ids != expected_case_ids:
+        raise EvaluationError(f"{label} transcript case coverage differs from manifest")
+
+
+_Call = tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any]]
+
+
+def _runtime_calls(
+    manifest: Mapping[str, Any],
+    plans: Mapping[str, tuple[AssertionPlan, ...]],
+    adapter: RuntimeAdapter,
+    transcript: Mapping[str, Any],
+    *,
+    evaluation_time: datetime,
+) -> tuple[list[_Call], list[_Call]]:
+    """Return one runtime's probe calls and case calls, in manifest order."""
+
+    expected_by_id = {
+        item["probe_id"]: dict(item) for item in transcript["capability_probes"]
+    }
+    responses = {item["case_id"]: item for item in transcript["responses"]}
+    maximum_bytes = int(manifest["invocation_policy"]["maximum_response_bytes"])
+    probe_calls: list[_Call] = [
+        (
+            _probe_result,
+            (adapter, probe, expected_by_id.get(probe["probe_id"])),
+            {"evaluation_time": evaluation_time},
+        )
+        for probe in manifest["capability_probes"]
+    ]
+    case_calls: list[_Call] = [
+        (
+            _run_case,
+            (adapter, case),
+            {
+                "plans": plans[case["case_id"]],
+                "expected_response": responses[case["case_id"]],
+                "maximum_response_bytes": maximum_bytes,
+            },
+        )
+        for case in manifest["cases"]
+    ]
+    return probe_calls, case_calls
+
+
+def _concurrency_limit(manifest: Mapping[str, Any], calls: int) -> int:
+    return int(manifest["invocation_policy"].get("max_concurrency", max(calls, 1)))
+
+
+def _evaluation_time(evaluated_at: str | None) -> tuple[str, datetime]:
+    when = evaluated_at or datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    return when, _parse_datetime(when, "evaluated_at")
+
+
 def compare_runtime_transcripts(
     manifest: Mapping[str, Any],
     declaration: Mapping[str, Any],
@@ -889,63 +1375,79 @@ def compare_runtime_transcripts(
     *,
     evaluated_at: str | None = None,
     declaration_path: str | Path | None = None,
+    executor: Executor | None = None,
+    inputs_validated: bool = False,
 ) -> dict[str, Any]:
     """Compare two runtime observations under one stable declaration.
 
     The returned report is always pending human review. Machine gates can block a
     candidate, but they cannot establish behavioral equivalence or identity.
+
+    With ``executor`` (a thread or process pool), probes and cases for both
+    runtimes run concurrently, at most ``invocation_policy.max_concurrency``
+    at a time (only the executor's own limit when the manifest sets none). Results
+    are assembled in manifest order, so the sealed report is byte-identical to
+    a sequential run. A process pool requires picklable adapters.
+
+    Pass ``inputs_validated=True`` only when the caller has already run
+    :func:`validate_manifest` and :func:`validate_transcript` on these exact
+    objects; the declaration binding and every cross-check below still run.
     """
 
-    validate_manifest(manifest)
-    validate_transcript(baseline_transcript)
-    validate_transcript(candidate_transcript)
+    if not inputs_validated:
+        validate_manifest(manifest)
+        validate_transcript(baseline_transcript)
+        validate_transcript(candidate_transcript)
     verify_manifest_declaration(
         manifest, declaration, declaration_path=declaration_path
     )
-    if baseline_adapter.adapter_contract != manifest["adapter_contract"]:
-        raise EvaluationError("baseline adapter contract mismatch")
-    if candidate_adapter.adapter_contract != manifest["adapter_contract"]:
-        raise EvaluationError("candidate adapter contract mismatch")
-    if baseline_adapter.probe_contract != manifest["probe_contract"]:
-        raise EvaluationError("baseline capability-probe contract mismatch")
-    if candidate_adapter.probe_contract != manifest["probe_contract"]:
-        raise EvaluationError("candidate capability-probe contract mismatch")
-
-    if dict(baseline_adapter.describe()) != dict(baseline_transcript["runtime"]):
-        raise EvaluationError("baseline adapter metadata differs from transcript")
-    if dict(candidate_adapter.describe()) != dict(candidate_transcript["runtime"]):
-        raise EvaluationError("candidate adapter metadata differs from transcript")
-
-    expected_probe_ids = {item["probe_id"] for item in manifest["capability_probes"]}
-    expected_case_ids = {item["case_id"] for item in manifest["cases"]}
-    for label, transcript in (
-        ("baseline", baseline_transcript),
-        ("candidate", candidate_transcript),
-    ):
-        transcript_probe_ids = {
-            item["probe_id"] for item in transcript["capability_probes"]
-        }
-        transcript_case_ids = {item["case_id"] for item in transcript["responses"]}
-        if transcript_probe_ids != expected_probe_ids:
-            raise EvaluationError(f"{label} transcript probe coverage differs from manifest")
-        if transcript_case_ids != expected_case_ids:
-            raise EvaluationError(f"{label} transcript case coverage differs from manifest")
-
-    when = evaluated_at or datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-    _parse_datetime(when, "evaluated_at")
-    probes = list(manifest["capability_probes"])
-    baseline_probes = _probe_results(
-        baseline_adapter,
-        probes,
-        list(baseline_transcript["capability_probes"]),
-        evaluated_at=when,
+    _check_runtime(manifest, "baseline", baseline_adapter, baseline_transcript)
+    _check_runtime(manifest, "candidate", candidate_adapter, candidate_transcript)
+
+    when, evaluation_time = _evaluation_time(evaluated_at)
+    plans = compile_assertion_plans(manifest)
+    baseline_probe_calls, baseline_case_calls = _runtime_calls(
+        manifest, plans, baseline_adapter, baseline_transcript,
+        evaluation_time=evaluation_time,
+    )
+    candidate_probe_calls, candidate_case_calls = _runtime_calls(
+        manifest, plans, candidate_adapter, candidate_transcript,
+        evaluation_time=evaluation_time,
     )
-    candidate_probes = _probe_results(
-        candidate_adapter,
-        probes,
-        list(candidate_transcript["capability_probes"]),
-        evaluated_at=when,
+    calls = baseline_probe_calls + candidate_probe_calls
+    for pair in zip(baseline_case_calls, candidate_case_calls):
+        calls.extend(pair)
+    results = list(
+        _ordered_results(
+            calls, executor=executor, limit=_concurrency_limit(manifest, len(calls))
+        )
+    )
+    probe_count = len(baseline_probe_calls)
+    return _build_report(
+        manifest,
+        when,
+        _runtime_ref(baseline_transcript),
+        _runtime_ref(candidate_transcript),
+        baseline_probes=results[:probe_count],
+        candidate_probes=results[probe_count : 2 * probe_count],
+        baseline_cases=results[2 * probe_count :: 2],
+        candidate_cases=results[2 * probe_count + 1 :: 2],
     )
+
+
+def _build_report(
+    manifest: Mapping[str, Any],
+    when: str,
+    baseline_ref: dict[str, Any],
+    candidate_ref: dict[str, Any],
+    *,
+    baseline_probes: list[dict[str, Any]],
+    candidate_probes: list[dict[str, Any]],
+    baseline_cases: list[dict[str, Any]],
+    candidate_cases: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Assemble, seal and validate one report from both runtimes' results."""
+
     baseline_by_probe = {item["probe_id"]: item for item in baseline_probes}
     candidate_by_probe = {item["probe_id"]: item for item in candidate_probes}
 
@@ -978,7 +1480,6 @@ def compare_runtime_transcripts(
                 }
             )
 
-    maximum_bytes = int(manifest["invocation_policy"]["maximum_response_bytes"])
     case_results: list[dict[str, Any]] = []
     drift: dict[str, list[dict[str, Any]]] = {
         category: [] for category in DRIFT_CATEGORIES
@@ -987,26 +1488,9 @@ def compare_runtime_transcripts(
     candidate_failure_counts = {category: 0 for category in DRIFT_CATEGORIES}
     candidate_failure_counts["capability_failure"] = required_capability_failures
 
-    baseline_responses = {
-        item["case_id"]: item for item in baseline_transcript["responses"]
-    }
-    candidate_responses = {
-        item["case_id"]: item for item in candidate_transcript["responses"]
-    }
-
-    for case in manifest["cases"]:
-        baseline_result = _run_case(
-            baseline_adapter,
-            case,
-            expected_response=baseline_responses[case["case_id"]],
-            maximum_response_bytes=maximum_bytes,
-        )
-        candidate_result = _run_case(
-            candidate_adapter,
-            case,
-            expected_response=candidate_responses[case["case_id"]],
-            maximum_response_bytes=maximum_bytes,
-        )
+    for case, baseline_result, candidate_result in zip(
+        manifest["cases"], baseline_cases, candidate_cases
+    ):
         baseline_assertions = {
             item["assertion_id"]: item for item in baseline_result["assertions"]
         }
@@ -1067,8 +1551,6 @@ def compare_runtime_transcripts(
         if exceeded and rule["blocking"]:
             blocking_reasons.append(category)
 
-    baseline_ref = _runtime_ref(baseline_transcript)
-    candidate_ref = _runtime_ref(candidate_transcript)
     minimum_assurance = manifest["minimum_transcript_assurance"]
     assurance_satisfied = all(
         ASSURANCE_RANK[item["assurance"]] >= ASSURANCE_RANK[minimum_assurance]
@@ -1157,3 +1639,150 @@ def compare_runtime_transcripts(
     sealed = seal_report(report)
     validate_report(sealed, manifest=manifest)
     return sealed
+
+
+DISPOSITION_RANK = {
+    "eligible_for_human_review": 0,
+    "conformance_only": 1,
+    "blocked": 2,
+}
+
+
+def summarize_candidate_reports(reports: Sequence[Mapping[str, Any]]) -> dict[str, Any]:
+    """Rank sealed reports that share a manifest, baseline and ``evaluated_at``.
+
+    Candidates sort by machine disposition, then by their total required
+    failures, then by input order. The ranking is a shortlist aid only; each
+    report still requires its own human review.
+    """
+
+    if not reports:
+        raise EvaluationError("at least one candidate report is required")
+    first = reports[0]
+    shared = ("manifest", "evaluated_at", "baseline_runtime")
+    for report in reports[1:]:
+        for field in shared:
+            if report[field] != first[field]:
+                raise EvaluationError(f"candidate reports differ in {field}")
+    ranking = []
+    for index, report in enumerate(reports):
+        threshold = report["threshold_evaluation"]
+        ranking.append(
+            {
+                "candidate_index": index,
+                "report_id": report["report_id"],
+                "report_digest": report["integrity"]["digest"],
+                "configuration_id": report["candidate_runtime"]["runtime"][
+                    "configuration_id"
+                ],
+                "transcript_digest": report["candidate_runtime"]["transcript_digest"],
+                "machine_disposition": threshold["machine_disposition"],
+                "blocking_reasons": list(threshold["blocking_reasons"]),
+                "required_failures": sum(
+                    item["candidate_required_failures"]
+                    for item in threshold["category_results"].values()
+                ),
+            }
+        )
+    ranking.sort(
+        key=lambda item: (
+            DISPOSITION_RANK[item["machine_disposition"]],
+            item["required_failures"],
+            item["candidate_index"],
+        )
+    )
+    for rank, entry in enumerate(ranking, start=1):
+        entry["rank"] = rank
+    baseline = first["baseline_runtime"]
+    return {
+        "evaluated_at": first["evaluated_at"],
+        "manifest": copy.deepcopy(dict(first["manifest"])),
+        "baseline_runtime": {
+            "transcript_id": baseline["transcript_id"],
+            "transcript_digest": baseline["transcript_digest"],
+            "configuration_id": baseline["runtime"]["configuration_id"],
+        },
+        "candidate_count": len(reports),
+        "ranking": ranking,
+        "human_review_required": True,
+        "identity_proof": False,
+    }
+
+
+def compare_runtime_candidates(
+    manifest: Mapping[str, Any],
+    declaration: Mapping[str, Any],
+    baseline: tuple[Mapping[str, Any], RuntimeAdapter],
+    candidates: Sequence[tuple[Mapping[str, Any], RuntimeAdapter]],
+    *,
+    evaluated_at: str | None = None,
+    declaration_path: str | Path | None = None,
+    executor: Executor | None = None,
+    inputs_validated: bool = False,
+) -> dict[str, Any]:
+    """Compare one baseline against several candidates under one manifest.
+
+    ``baseline`` and each candidate are ``(transcript, adapter)`` pairs. The
+    manifest, declaration binding and baseline probes and cases are checked
+    and replayed once; every candidate then shares those results. With
+    ``executor``, candidate probes and cases, and then report sealing, run
+    concurrently within ``invocation_policy.max_concurrency``.
+
+    Returns ``{"reports": [...], "summary": {...}}``. Each report is
+    byte-identical to :func:`compare_runtime_transcripts` for that pair at
+    the same ``evaluated_at``; the summary comes from
+    :func:`summarize_candidate_reports`.
+    """
+
+    baseline_transcript, baseline_adapter = baseline
+    candidates = list(candidates)
+    if not candidates:
+        raise EvaluationError("at least one candidate is required")
+    if not inputs_validated:
+        validate_manifest(manifest)
+        validate_transcript(baseline_transcript)
+        for transcript, _ in candidates:
+            validate_transcript(transcript)
+    verify_manifest_declaration(
+        manifest, declaration, declaration_path=declaration_path
+    )
+    _check_runtime(manifest, "baseline", baseline_adapter, baseline_transcript)
+    for index, (transcript, adapter) in enumerate(candidates):
+        _check_runtime(manifest, f"candidate {index}", adapter, transcript)
+
+    when, evaluation_time = _evaluation_time(evaluated_at)
+    plans = compile_assertion_plans(manifest)
+    sides = [(baseline_adapter, baseline_transcript)] + [
+        (adapter, transcript) for transcript, adapter in candidates
+    ]
+    calls: list[_Call] = []
+    for adapter, transcript in sides:
+        probe_calls, case_calls = _runtime_calls(
+            manifest, plans, adapter, transcript, evaluation_time=evaluation_time
+        )
+        calls.extend(probe_calls + case_calls)
+    limit = _concurrency_limit(manifest, len(calls))
+    results = list(_ordered_results(calls, executor=executor, limit=limit))
+    probe_count = len(manifest["capability_probes"])
+    width = probe_count + len(manifest["cases"])
+    side_results = [
+        (results[start : start + probe_count], results[start + probe_count : start + width])
+        for start in range(0, len(results), width)
+    ]
+    baseline_probes, baseline_cases = side_results[0]
+    baseline_ref = _runtime_ref(baseline_transcript)
+    builds: list[_Call] = [
+        (
+            _build_report,
+            (manifest, when, baseline_ref, _runtime_ref(transcript)),
+            {
+                "baseline_probes": baseline_probes,
+                "candidate_probes": probes,
+                "baseline_cases": baseline_cases,
+                "candidate_cases": cases,
+            },
+        )
+        for (transcript, _), (probes, cases) in zip(candidates, side_results[1:])
+    ]
+    reports = list(_ordered_results(builds, executor=executor, limit=limit))
+    return {"reports": reports, "summary": summarize_candidate_reports(reports)}
@@ -6,10 +6,9 @@ import copy
 from pathlib import Path
 from typing import Any, Iterable, Mapping
 
-from jsonschema import Draft202012Validator, FormatChecker
 from jsonschema.exceptions import ValidationError
 
-from .provenance import load_json
+from .schema_cache import schema_validator
 
 
 REPOSITORY_ROOT = Path(__file__).resolve().parents[1]
@@ -21,8 +20,7 @@ def default_consensus() -> dict[str, Any]:
 
 
 def validate_message(message: Mapping[str, Any]) -> None:
-    schema = load_json(EEP_SCHEMA)
-    validator = Draft202012Validator(schema, format_checker=FormatChecker())
+    validator = schema_validator(EEP_SCHEMA)
     errors = sorted(validator.iter_errors(dict(message)), key=lambda error: list(error.path))
     if errors:
         details = "; ".join(
@@ -14,11 +14,10 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Collection, Iterable, Mapping, Sequence
 
-from jsonschema import Draft202012Validator, FormatChecker
 from jsonschema.exceptions import ValidationError
 
 from .identity import identity_digest, same_declared_identity
-from .provenance import load_json
+from .schema_cache import schema_validator
 
 
 REPOSITORY_ROOT = Path(__file__).resolve().parents[1]
@@ -596,15 +595,9 @@ def evaluate_approvals(
     }
 
 
-def _transition_validator() -> Draft202012Validator:
-    schema = load_json(TRANSITION_SCHEMA)
-    Draft202012Validator.check_schema(schema)
-    return Draft202012Validator(schema, format_checker=FormatChecker())
-
-
 def validate_transition(record: Mapping[str, Any]) -> None:
     errors = sorted(
-        _transition_validator().iter_errors(dict(record)),
+        schema_validator(TRANSITION_SCHEMA).iter_errors(dict(record)),
         key=lambda error: list(error.path),
     )
     if errors:
@@ -8,7 +8,6 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Mapping
 
-from jsonschema import Draft202012Validator, FormatChecker
 from jsonschema.exceptions import ValidationError
 
 from .governance import default_governance, validate_governance
@@ -22,20 +21,15 @@ from .provenance import (
     resolve_digest_profile,
     sha256_digest,
 )
+from .schema_cache import schema_validator
 
 
 REPOSITORY_ROOT = Path(__file__).resolve().parents[1]
 IDP_SCHEMA = REPOSITORY_ROOT / "schemas" / "idp-v2.0.schema.json"
 
 
-def _validator(schema_path: str | Path) -> Draft202012Validator:
-    schema = load_json(schema_path)
-    Draft202012Validator.check_schema(schema)
-    return Draft202012Validator(schema, format_checker=FormatChecker())
-
-
 def validate_idp(declaration: Mapping[str, Any]) -> None:
-    errors = sorted(_validator(IDP_SCHEMA).iter_errors(dict(declaration)), key=lambda error: list(error.path))
+    errors = sorted(schema_validator(IDP_SCHEMA).iter_errors(dict(declaration)), key=lambda error: list(error.path))
     if errors:
         details = "; ".join(
             f"{'/'.join(map(str, error.path)) or '<root>'}: {error.message}"
@@ -0,0 +1,131 @@
+"""Incremental reader for large UTF-8 JSON documents.
+
+``JSONStreamReader`` walks a document one token or value at a time and keeps
+only a window of undecoded text, so a caller can visit the members of a large
+top-level object, or the items of a large array, without holding the whole
+document. Values are decoded with :func:`cpas.provenance.raw_decode_json`
+and so reject duplicate keys and non-finite numbers like every other CPAS
+reader.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+from typing import Any, BinaryIO
+
+from .provenance import raw_decode_json
+
+
+_WHITESPACE = " \t\r\n"
+
+
+class JSONStreamReader:
+    """Pull-style reader over a binary file containing one JSON document.
+
+    The window grows only while a single value is incomplete, doubling its
+    read size each time, so memory tracks the largest value decoded at once
+    rather than the document. Syntax and encoding errors raise ``ValueError``.
+    """
+
+    def __init__(self, handle: BinaryIO, *, chunk_size: int = 64 * 1024):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self._handle = handle
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._index = 0
+        self._consumed = 0
+        # UTF-8 length of the document before ``_buffer[:self._mark]``.
+        self._mark = 0
+        self._consumed_bytes = 0
+        self._eof = False
+
+    @property
+    def offset(self) -> int:
+        """Character offset of the next unread position in the document."""
+
+        return self._consumed + self._index
+
+    @property
+    def byte_offset(self) -> int:
+        """Byte offset of the next unread position, for seeking the file later."""
+
+        self._advance_mark()
+        return self._consumed_bytes
+
+    def _advance_mark(self) -> None:
+        # Only text between successive calls is encoded, so tracking byte
+        # offsets stays linear in the document size.
+        self._consumed_bytes += len(
+            self._buffer[self._mark : self._index].encode("utf-8")
+        )
+        self._mark = self._index
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        if self._index:
+            self._advance_mark()
+            self._consumed += self._index
+            self._buffer = self._buffer[self._index :]
+            self._index = self._mark = 0
+        data = self._handle.read(max(self._chunk_size, len(self._buffer)))
+        try:
+            self._buffer += self._decoder.decode(data, final=not data)
+        except UnicodeDecodeError as exc:
+            raise ValueError(f"document is not UTF-8: {exc}") from exc
+        self._eof = not data
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character, or ``""`` at the end."""
+
+        while True:
+            buffer = self._buffer
+            index = self._index
+            while index < len(buffer) and buffer[index] in _WHITESPACE:
+                index += 1
+            self._index = index
+            if index < len(buffer):
+                return buffer[index]
+            if not self._fill():
+                return ""
+
+    def expect(self, token: str) -> None:
+        if self.peek() != token:
+            raise ValueError(f"expected {token!r} at offset {self.offset}")
+        self._index += 1
+
+    def accept(self, token: str) -> bool:
+        """Consume ``token`` if it is the next character."""
+
+        if self.peek() != token:
+            return False
+        self._index += 1
+        return True
+
+    def value(self) -> Any:
+        """Decode the complete JSON value at the current position."""
+
+        if not self.peek():
+            raise ValueError(f"expected a JSON value at offset {self.offset}")
+        while True:
+            try:
+                value, end = raw_decode_json(self._buffer, self._index)
+            except json.JSONDecodeError as exc:
+                if self._fill():
+                    continue
+                raise ValueError(f"invalid JSON at offset {self.offset}: {exc.msg}") from exc
+            # A number that ends the window may continue in the next read.
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._index = end
+            return value
+
+    def end(self) -> None:
+        """Require that nothing but whitespace follows."""
+
+        if self.peek():
+            raise ValueError(f"trailing data at offset {self.offset}")
@@ -9,11 +9,15 @@ share a digest.
 
 from __future__ import annotations
 
+import contextlib
 import copy
 import hashlib
+import importlib
 import json
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable, Mapping, Protocol
 
 import rfc8785
 
@@ -50,6 +54,29 @@ V2_DIGEST_PROFILES = frozenset(
 
 DIGEST_FRAME_MAGIC = b"CPAS-DIGEST-V2\x00"
 
+# Verifiers are named rather than imported: they live in modules that import
+# this one, and worker processes resolve them on first use.
+VERIFY_KINDS: dict[str, str] = {
+    "dka": "cpas.dka:verify_record_integrity",
+    "seed-token": "cpas.seed_token:verify_integrity",
+    "dka-store-event": "cpas.sqlite_dka_store:verify_event_integrity",
+    "file": "cpas.provenance:verify_file_digest",
+}
+_VERIFY_ITEM_ERRORS = (AttributeError, KeyError, TypeError, ValueError, OSError)
+
+
+class ByteSink(Protocol):
+    def write(self, data: bytes, /) -> Any: ...
+
+
+class _HashSink:
+    """Expose ``hash.update`` as ``write`` so the encoder feeds it directly."""
+
+    __slots__ = ("write",)
+
+    def __init__(self, digest: Any) -> None:
+        self.write = digest.update
+
 
 class DuplicateKeyError(ValueError):
     """Raised when JSON contains duplicate object members."""
@@ -64,17 +91,52 @@ def _reject_duplicates(pairs: Iterable[tuple[str, Any]]) -> dict[str, Any]:
     return result
 
 
+def _build_object(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
+    # dict() builds the object in C; only an object that lost a member to a
+    # duplicate key pays for the per-key walk that names the first duplicate.
+    result = dict(pairs)
+    if len(result) != len(pairs):
+        return _reject_duplicates(pairs)
+    return result
+
+
+def _reject_constant(value: str) -> None:
+    raise ValueError(f"non-finite JSON number: {value}")
+
+
+_DECODER = json.JSONDecoder(
+    object_pairs_hook=_build_object,
+    parse_constant=_reject_constant,
+)
+
+
 def loads_json(text: str) -> Any:
-    """Load JSON while rejecting duplicate keys and non-finite numbers."""
+    """Load JSON while rejecting duplicate keys and non-finite numbers.
 
-    def reject_constant(value: str) -> None:
-        raise ValueError(f"non-finite JSON number: {value}")
+    One shared decoder serves ordinary text; ``json.loads`` builds a decoder
+    per call, which dominates the cost of small documents such as audit
+    events and heads. Bytes and BOM-prefixed text keep ``json.loads``'s own
+    handling.
+    """
 
-    return json.loads(
-        text,
-        object_pairs_hook=_reject_duplicates,
-        parse_constant=reject_constant,
-    )
+    if not isinstance(text, str) or text.startswith("\ufeff"):
+        return json.loads(
+            text,
+            object_pairs_hook=_build_object,
+            parse_constant=_reject_constant,
+        )
+    return _DECODER.decode(text)
+
+
+def raw_decode_json(text: str, index: int = 0) -> tuple[Any, int]:
+    """Decode the JSON value starting exactly at ``text[index]``.
+
+    Applies the same duplicate-key and non-finite-number rejection as
+    :func:`loads_json` and returns the value with the index just past it, so
+    callers can walk a large document one member at a time.
+    """
+
+    return _DECODER.raw_decode(text, index)
 
 
 def load_json(path: str | Path) -> Any:
@@ -103,6 +165,22 @@ def canonicalize_json(value: Any, *, profile: str) -> bytes:
     ).encode("utf-8")
 
 
+def write_canonical_json(value: Any, sink: ByteSink, *, profile: str) -> None:
+    """Write the exact ``canonicalize_json`` bytes into ``sink``.
+
+    JCS output is streamed token by token and never held whole, so hashing a
+    large artifact does not copy it. The frozen legacy profile is written in
+    one piece: the standard library only streams it through its pure-Python
+    encoder, which is several times slower than building the bytes. Errors
+    match ``canonicalize_json``; the sink may already hold a prefix by then.
+    """
+
+    if profile == JCS_CANONICALIZATION:
+        rfc8785.dump(value, sink)
+        return
+    sink.write(canonicalize_json(value, profile=profile))
+
+
 def canonical_json(value: Any) -> bytes:
     """Serialize the frozen ``cpas-canonical-json-v1`` legacy profile.
 
@@ -144,16 +222,27 @@ def digest_preimage(
     resolved = resolve_digest_profile(canonicalization, digest_profile)
     if resolved == LEGACY_DIGEST_PROFILE:
         raise ValueError("legacy direct hashes do not use the CPAS v2 digest frame")
+    return _digest_frame(canonicalization, resolved) + canonicalize_json(
+        value, profile=canonicalization
+    )
+
+
+def _digest_frame(canonicalization: str, resolved: str) -> bytes:
     return (
         DIGEST_FRAME_MAGIC
         + resolved.encode("ascii")
         + b"\x00"
         + canonicalization.encode("ascii")
         + b"\x00"
-        + canonicalize_json(value, profile=canonicalization)
     )
 
 
+def _stream_sha256(value: Any, *, canonicalization: str, frame: bytes = b"") -> str:
+    digest = hashlib.sha256(frame)
+    write_canonical_json(value, _HashSink(digest), profile=canonicalization)
+    return "sha256:" + digest.hexdigest()
+
+
 def profiled_digest(
     value: Any,
     *,
@@ -165,7 +254,30 @@ def profiled_digest(
 
     A missing profile is accepted only for the frozen legacy canonicalization.
     ``expected_v2_profile`` prevents one artifact type from claiming another
-    artifact's domain.
+    artifact's domain. The framed preimage is hashed as it is serialized and
+    is never materialized; ``digest_preimage`` returns the same bytes.
+    """
+
+    digest = digest_hasher(
+        canonicalization=canonicalization,
+        digest_profile=digest_profile,
+        expected_v2_profile=expected_v2_profile,
+    )
+    write_canonical_json(value, _HashSink(digest), profile=canonicalization)
+    return "sha256:" + digest.hexdigest()
+
+
+def digest_hasher(
+    *,
+    canonicalization: str,
+    digest_profile: str | None,
+    expected_v2_profile: str | None = None,
+) -> Any:
+    """Return a SHA-256 object already fed the profile's digest frame.
+
+    Callers that assemble a canonical preimage piece by piece (for example
+    while streaming a large file) feed it the canonical bytes themselves;
+    ``"sha256:" + hexdigest()`` then equals :func:`profiled_digest`.
     """
 
     resolved = resolve_digest_profile(canonicalization, digest_profile)
@@ -178,20 +290,14 @@ def profiled_digest(
             f"{expected_v2_profile}"
         )
     if resolved == LEGACY_DIGEST_PROFILE:
-        preimage = canonicalize_json(value, profile=canonicalization)
-    else:
-        preimage = digest_preimage(
-            value,
-            canonicalization=canonicalization,
-            digest_profile=resolved,
-        )
-    return "sha256:" + hashlib.sha256(preimage).hexdigest()
+        return hashlib.sha256()
+    return hashlib.sha256(_digest_frame(canonicalization, resolved))
 
 
 def sha256_digest(value: Any) -> str:
     """Compute the frozen legacy direct SHA-256 digest."""
 
-    return "sha256:" + hashlib.sha256(canonical_json(value)).hexdigest()
+    return _stream_sha256(value, canonicalization=LEGACY_CANONICALIZATION)
 
 
 def file_sha256(path: str | Path) -> str:
@@ -202,6 +308,105 @@ def file_sha256(path: str | Path) -> str:
     return "sha256:" + digest.hexdigest()
 
 
+def omit_paths(value: Mapping[str, Any], paths: Iterable[tuple[str, ...]]) -> dict[str, Any]:
+    """Return a read-only projection of ``value`` with selected paths omitted.
+
+    Only the objects on an omitted path are shallow-copied; every other
+    subtree is shared with ``value``. The result is meant to be serialized or
+    hashed, not mutated; use ``without_paths`` for an independent copy.
+    """
+
+    result = dict(value)
+    copied = {id(result)}
+    for path in paths:
+        parent: dict[str, Any] = result
+        for part in path[:-1]:
+            child = parent.get(part)
+            if not isinstance(child, dict):
+                break
+            if id(child) not in copied:
+                child = dict(child)
+                copied.add(id(child))
+                parent[part] = child
+            parent = child
+        else:
+            parent.pop(path[-1], None)
+    return result
+
+
+def verify_file_digest(artifact: Mapping[str, Any]) -> bool:
+    """Check a ``{"path", "digest"}`` reference against the file's raw SHA-256."""
+
+    return file_sha256(artifact["path"]) == artifact["digest"]
+
+
+def _verifier(kind: str) -> Callable[[Any], bool]:
+    try:
+        target = VERIFY_KINDS[kind]
+    except KeyError:
+        raise ValueError(f"unsupported verification kind: {kind}") from None
+    module, _, name = target.partition(":")
+    return getattr(importlib.import_module(module), name)
+
+
+def _verify_chunk(kind: str, start: int, artifacts: list[Any]) -> list[dict[str, Any]]:
+    verifier = _verifier(kind)
+    results: list[dict[str, Any]] = []
+    for index, artifact in enumerate(artifacts, start=start):
+        try:
+            verified = bool(verifier(artifact))
+        except _VERIFY_ITEM_ERRORS as exc:
+            results.append(
+                {
+                    "index": index,
+                    "verified": False,
+                    "error": {"type": type(exc).__name__, "message": str(exc)},
+                }
+            )
+        else:
+            results.append({"index": index, "verified": verified})
+    return results
+
+
+def verify_many(
+    artifacts: Iterable[Any],
+    *,
+    kind: str,
+    workers: int = 1,
+    chunksize: int = 64,
+    executor: Executor | None = None,
+) -> list[dict[str, Any]]:
+    """Verify many artifacts of one ``VERIFY_KINDS`` kind, in input order.
+
+    Each result is ``{"index", "verified"}``; an artifact whose verifier
+    raised also carries ``error: {"type", "message"}`` instead of failing the
+    batch. With ``workers > 1`` chunks of ``chunksize`` artifacts are hashed
+    in a process pool, or in ``executor`` when the caller already owns one.
+    Artifacts must be picklable for process execution.
+    """
+
+    _verifier(kind)
+    for name, value in (("workers", workers), ("chunksize", chunksize)):
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            raise ValueError(f"{name} must be a positive integer")
+    items = list(artifacts)
+    starts = range(0, len(items), chunksize)
+    chunks = [items[start : start + chunksize] for start in starts]
+    if executor is None and (workers == 1 or len(chunks) < 2):
+        return [
+            result
+            for start, chunk in zip(starts, chunks)
+            for result in _verify_chunk(kind, start, chunk)
+        ]
+    with (
+        contextlib.nullcontext(executor)
+        if executor is not None
+        else ProcessPoolExecutor(max_workers=min(workers, len(chunks)))
+    ) as pool:
+        batches = pool.map(_verify_chunk, repeat(kind), starts, chunks)
+        return [result for batch in batches for result in batch]
+
+
 def without_paths(value: dict[str, Any], paths: Iterable[tuple[str, ...]]) -> dict[str, Any]:
     """Return a deep copy with selected object paths omitted."""
 
@@ -0,0 +1,144 @@
+"""Bounded cache of decoded, already-verified DKA-E snapshots.
+
+Snapshots are immutable and content-addressed, so a record that passed schema
+validation and digest verification once need not be re-parsed on every read.
+Entries are keyed by ``(digest_profile, digest)`` and remember the exact stored
+payload text; a lookup only hits when the payload presented by the store is
+identical, so a rewritten snapshot is never served from the cache. Callers
+always receive their own copy.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Mapping
+
+
+RecordKey = tuple[str, str]
+
+
+def json_copy(value: Any) -> Any:
+    """Copy a JSON-model value (dict/list/scalars) faster than ``deepcopy``."""
+
+    if isinstance(value, dict):
+        return {key: json_copy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [json_copy(item) for item in value]
+    return value
+
+
+@dataclass
+class _Entry:
+    payload: str
+    record: dict[str, Any]
+    size: int
+    locations: set[str] = field(default_factory=set)
+
+
+class VerifiedRecordCache:
+    """Thread-safe LRU of verified records limited by entries and payload bytes.
+
+    ``location`` aliases let a store that learns a snapshot's digest only after
+    decoding it (for example a file path read by revision) find the entry on
+    later reads. ``bytes`` counts UTF-8 payload length, not Python heap size.
+    """
+
+    def __init__(self, *, max_entries: int = 1_024, max_bytes: int = 16 * 1024 * 1024):
+        if not isinstance(max_entries, int) or max_entries < 1:
+            raise ValueError("max_entries must be a positive integer")
+        if not isinstance(max_bytes, int) or max_bytes < 1:
+            raise ValueError("max_bytes must be a positive integer")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[RecordKey, _Entry] = OrderedDict()
+        self._locations: dict[str, RecordKey] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._rejected = 0
+
+    def get(
+        self,
+        key: RecordKey | None,
+        payload: str,
+        *,
+        location: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Return a copy of the cached record if ``payload`` is unchanged."""
+
+        with self._lock:
+            if key is None and location is not None:
+                key = self._locations.get(location)
+            entry = self._entries.get(key) if key is not None else None
+            if entry is None or entry.payload != payload:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            record = entry.record
+        return json_copy(record)
+
+    def put(
+        self,
+        key: RecordKey,
+        payload: str,
+        record: Mapping[str, Any],
+        *,
+        location: str | None = None,
+    ) -> None:
+        """Remember a record the caller has fully verified against ``payload``."""
+
+        size = len(payload.encode("utf-8"))
+        if size > self.max_bytes:
+            with self._lock:
+                self._rejected += 1
+            return
+        stored = json_copy(dict(record))
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            entry = _Entry(payload, stored, size)
+            if previous is not None:
+                self._bytes -= previous.size
+                entry.locations = previous.locations
+            if location is not None:
+                stale = self._locations.get(location)
+                if stale is not None and stale in self._entries:
+                    self._entries[stale].locations.discard(location)
+                entry.locations.add(location)
+                self._locations[location] = key
+            self._entries[key] = entry
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self._forget_locations(evicted)
+                self._evictions += 1
+
+    def _forget_locations(self, entry: _Entry) -> None:
+        for location in entry.locations:
+            self._locations.pop(location, None)
+
+    def clear(self) -> int:
+        with self._lock:
+            removed = len(self._entries)
+            self._entries.clear()
+            self._locations.clear()
+            self._bytes = 0
+            return removed
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "rejected_oversize": self._rejected,
+            }
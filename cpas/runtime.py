@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import copy
+import os
+from pathlib import Path
 from typing import Any, Iterable, Mapping, Protocol, runtime_checkable
 
+from .json_stream import JSONStreamReader
 from .provenance import (
     CAPABILITY_PROFILE_DIGEST_PROFILE,
     JCS_CANONICALIZATION,
+    loads_json,
     profiled_digest,
     resolve_digest_profile,
 )
+from .record_cache import json_copy
 
 
 CAPABILITY_RANK = {
@@ -106,6 +111,174 @@ class TranscriptRuntimeAdapter:
             raise RuntimeAdapterError(f"missing transcript response: {case_id}") from exc
 
 
+def _read_only(*_: Any, **__: Any) -> None:
+    raise TypeError("transcript entries are read-only views")
+
+
+class ReadOnlyDict(dict):
+    """A ``dict`` that refuses mutation; copies of it are ordinary dicts."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[str, Any]:
+        return json_copy(self)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (ReadOnlyDict, (dict(self),))
+
+
+class ReadOnlyList(list):
+    """A ``list`` that refuses mutation; copies of it are ordinary lists."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __copy__(self) -> list[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list[Any]:
+        return json_copy(self)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (ReadOnlyList, (list(self),))
+
+
+def read_only_json(value: Any) -> Any:
+    """Wrap a decoded JSON value in read-only containers, recursively."""
+
+    if isinstance(value, dict):
+        return ReadOnlyDict(
+            (key, read_only_json(item)) for key, item in value.items()
+        )
+    if isinstance(value, list):
+        return ReadOnlyList(read_only_json(item) for item in value)
+    return value
+
+
+class IndexedTranscriptRuntimeAdapter:
+    """No-execution transcript replay that decodes entries on demand.
+
+    Opening the adapter streams the transcript file once and keeps only the
+    byte span of each probe and response (plus the small top-level members),
+    so the scan holds one read window and one decoded entry at a time.
+    ``probe`` and ``invoke`` read and decode just the requested entry and
+    return it as a :class:`ReadOnlyDict`, so nothing is deep-copied. The
+    file's size and modification time, taken from the open handle before
+    scanning, are checked on every read; a transcript rewritten after it was
+    opened is refused rather than replayed.
+    """
+
+    adapter_contract = RUNTIME_ADAPTER_CONTRACT
+    probe_contract = CAPABILITY_PROBE_CONTRACT
+    _INDEXED = {"capability_probes": "probe_id", "responses": "case_id"}
+
+    def __init__(self, path: str | Path, *, chunk_size: int = 64 * 1024):
+        self.path = Path(path)
+        with self.path.open("rb") as handle:
+            self._signature = self._stat(os.fstat(handle.fileno()))
+            reader = JSONStreamReader(handle, chunk_size=chunk_size)
+            try:
+                members, spans = self._scan(reader)
+            except ValueError as exc:  # malformed, truncated, duplicate keys, NaN
+                raise RuntimeAdapterError(
+                    f"transcript JSON at offset {reader.offset}: {exc}"
+                ) from exc
+        self._members = read_only_json(members)
+        self._probes = spans["capability_probes"]
+        self._responses = spans["responses"]
+        runtime = self._members.get("runtime")
+        if not isinstance(runtime, Mapping):
+            raise RuntimeAdapterError("transcript runtime metadata must be an object")
+        adapter = runtime.get("adapter")
+        if not isinstance(adapter, Mapping) or adapter.get("contract") != self.adapter_contract:
+            raise RuntimeAdapterError(
+                f"transcript adapter must declare {self.adapter_contract}"
+            )
+
+    @staticmethod
+    def _stat(result: os.stat_result) -> tuple[int, int]:
+        return (result.st_size, result.st_mtime_ns)
+
+    @classmethod
+    def _scan(
+        cls, reader: JSONStreamReader
+    ) -> tuple[dict[str, Any], dict[str, dict[str, tuple[int, int]]]]:
+        members: dict[str, Any] = {}
+        spans: dict[str, dict[str, tuple[int, int]]] = {}
+        reader.accept("\ufeff")
+        reader.expect("{")
+        first = True
+        while not reader.accept("}"):
+            if not first:
+                reader.expect(",")
+            first = False
+            key = reader.value()
+            if not isinstance(key, str) or key in members or key in spans:
+                raise RuntimeAdapterError(f"transcript JSON: bad or duplicate key {key!r}")
+            reader.expect(":")
+            if key in cls._INDEXED:
+                spans[key] = cls._scan_entries(reader, key)
+            else:
+                members[key] = reader.value()
+        reader.end()
+        for field in cls._INDEXED:
+            if field not in spans:
+                raise RuntimeAdapterError(f"transcript {field} must be an array")
+        return members, spans
+
+    @classmethod
+    def _scan_entries(
+        cls, reader: JSONStreamReader, field: str
+    ) -> dict[str, tuple[int, int]]:
+        key = cls._INDEXED[field]
+        if not reader.accept("["):
+            raise RuntimeAdapterError(f"transcript {field} must be an array")
+        entries: dict[str, tuple[int, int]] = {}
+        while not reader.accept("]"):
+            if entries:
+                reader.expect(",")
+            reader.peek()
+            start = reader.byte_offset
+            item = reader.value()
+            if not isinstance(item, Mapping) or not isinstance(item.get(key), str):
+                raise RuntimeAdapterError(f"transcript {field} entries require {key}")
+            identifier = item[key]
+            if identifier in entries:
+                raise RuntimeAdapterError(f"duplicate transcript {key}: {identifier}")
+            entries[identifier] = (start, reader.byte_offset)
+        return entries
+
+    def _entry(self, entries: dict[str, tuple[int, int]], identifier: str) -> ReadOnlyDict:
+        start, end = entries[identifier]
+        with self.path.open("rb") as handle:
+            if self._stat(os.fstat(handle.fileno())) != self._signature:
+                raise RuntimeAdapterError("transcript file changed after it was indexed")
+            handle.seek(start)
+            raw = handle.read(end - start)
+        return read_only_json(loads_json(raw.decode("utf-8")))
+
+    def describe(self) -> Mapping[str, Any]:
+        return self._members["runtime"]
+
+    def probe(self, probe: Mapping[str, Any]) -> Mapping[str, Any]:
+        probe_id = str(probe.get("probe_id", ""))
+        if probe_id not in self._probes:
+            raise RuntimeAdapterError(f"missing transcript probe: {probe_id}")
+        return self._entry(self._probes, probe_id)
+
+    def invoke(self, case: Mapping[str, Any]) -> Mapping[str, Any]:
+        case_id = str(case.get("case_id", ""))
+        if case_id not in self._responses:
+            raise RuntimeAdapterError(f"missing transcript response: {case_id}")
+        return self._entry(self._responses, case_id)
+
+
 def capability_profile(
     capabilities: Iterable[Mapping[str, Any]],
     *,
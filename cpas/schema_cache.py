@@ -0,0 +1,142 @@
+"""Process-wide cache of compiled CPAS JSON Schema validators.
+
+Schema files are read, checked against the 2020-12 metaschema, and compiled
+once per process. Each lookup re-stats the file; a changed stat signature
+forces a digest comparison, and a changed digest forces recompilation, so an
+edited schema is never served from a stale entry.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+from jsonschema import Draft202012Validator, FormatChecker
+
+from .provenance import loads_json
+
+
+REPOSITORY_ROOT = Path(__file__).resolve().parents[1]
+SCHEMA_DIRECTORY = REPOSITORY_ROOT / "schemas"
+
+
+@dataclass(frozen=True)
+class _Entry:
+    signature: tuple[int, int, int, int]
+    digest: str
+    validator: Draft202012Validator
+
+
+def _signature(path: Path) -> tuple[int, int, int, int]:
+    file_stat = os.stat(path)
+    return (
+        file_stat.st_dev,
+        file_stat.st_ino,
+        file_stat.st_size,
+        file_stat.st_mtime_ns,
+    )
+
+
+class SchemaValidatorCache:
+    """Thread-safe registry of compiled validators keyed by schema path.
+
+    ``hits`` counts lookups served without compiling, ``misses`` counts
+    compilations, and ``revalidations`` counts lookups whose stat signature
+    changed but whose content digest did not.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[Path, _Entry] = {}
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+        self._invalidations = 0
+
+    def validator(self, path: str | Path) -> Draft202012Validator:
+        key = Path(path).resolve()
+        signature = _signature(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.signature == signature:
+                self._hits += 1
+                return entry.validator
+        source = key.read_bytes()
+        digest = "sha256:" + hashlib.sha256(source).hexdigest()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.digest == digest:
+                self._entries[key] = _Entry(signature, digest, entry.validator)
+                self._hits += 1
+                self._revalidations += 1
+                return entry.validator
+        schema = loads_json(source.decode("utf-8"))
+        Draft202012Validator.check_schema(schema)
+        validator = Draft202012Validator(schema, format_checker=FormatChecker())
+        with self._lock:
+            self._entries[key] = _Entry(signature, digest, validator)
+            self._misses += 1
+        return validator
+
+    def warm(self, paths: Iterable[str | Path] | None = None) -> int:
+        selected = (
+            sorted(SCHEMA_DIRECTORY.glob("*.schema.json"))
+            if paths is None
+            else list(paths)
+        )
+        for path in selected:
+            self.validator(path)
+        return len(selected)
+
+    def invalidate(self, path: str | Path | None = None) -> int:
+        with self._lock:
+            if path is None:
+                removed = len(self._entries)
+                self._entries.clear()
+            else:
+                removed = int(
+                    self._entries.pop(Path(path).resolve(), None) is not None
+                )
+            self._invalidations += removed
+            return removed
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "revalidations": self._revalidations,
+                "invalidations": self._invalidations,
+                "schemas": {
+                    str(path): entry.digest
+                    for path, entry in sorted(self._entries.items())
+                },
+            }
+
+
+_CACHE = SchemaValidatorCache()
+
+
+def schema_validator(path: str | Path) -> Draft202012Validator:
+    """Return the shared compiled validator for ``path``."""
+
+    return _CACHE.validator(path)
+
+
+def warm_schema_validators(paths: Iterable[str | Path] | None = None) -> int:
+    """Compile the given schemas, or every repository schema, ahead of use."""
+
+    return _CACHE.warm(paths)
+
+
+def invalidate_schema_validators(path: str | Path | None = None) -> int:
+    return _CACHE.invalidate(path)
+
+
+def schema_validator_stats() -> dict[str, Any]:
+    return _CACHE.stats()
@@ -10,20 +10,18 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Mapping
 
-from jsonschema import Draft202012Validator, FormatChecker
-
 from .identity import identity_digest, identity_digest_spec
 from .provenance import (
     JCS_CANONICALIZATION,
     LEGACY_CANONICALIZATION,
     SEED_TOKEN_DIGEST_PROFILE,
     canonicalize_json,
-    load_json,
+    omit_paths,
     profiled_digest,
     resolve_digest_profile,
-    without_paths,
 )
 from .runtime import capability_profile
+from .schema_cache import schema_validator
 
 
 REPOSITORY_ROOT = Path(__file__).resolve().parents[1]
@@ -35,8 +33,7 @@ _UNSET = object()
 
 
 def _schema_errors(token: Mapping[str, Any]) -> list[str]:
-    schema = load_json(SEED_SCHEMA)
-    validator = Draft202012Validator(schema, format_checker=FormatChecker())
+    validator = schema_validator(SEED_SCHEMA)
     return [
         f"{'/'.join(map(str, error.path)) or '<root>'}: {error.message}"
         for error in sorted(validator.iter_errors(dict(token)), key=lambda item: list(item.path))
@@ -65,7 +62,7 @@ def seed_digest_spec(token: Mapping[str, Any]) -> tuple[str, str]:
 
 
 def seed_integrity_hash(token: Mapping[str, Any]) -> str:
-    payload = without_paths(dict(token), [("integrity", "digest"), ("authenticator",)])
+    payload = omit_paths(token, [("integrity", "digest"), ("authenticator",)])
     canonicalization, profile = seed_digest_spec(token)
     return profiled_digest(
         payload,
@@ -135,7 +132,7 @@ def verify_integrity(token: Mapping[str, Any]) -> bool:
 
 
 def _hmac_payload(token: Mapping[str, Any]) -> bytes:
-    payload = without_paths(dict(token), [("authenticator", "tag")])
+    payload = omit_paths(token, [("authenticator", "tag")])
     canonicalization, _ = seed_digest_spec(token)
     authenticator = token.get("authenticator", {})
     if not isinstance(authenticator, Mapping):
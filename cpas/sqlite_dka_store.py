@@ -1,6 +1,7 @@
 """SQLite rollback-journal profile for externally persistent DKA-E state.
 
-This adapter is intentionally scoped to a local filesystem on one host with
+An opt-in WAL variant is available on SQLite builds carrying the WAL-reset
+fix. This adapter is intentionally scoped to a local filesystem on one host with
 low or moderate writer concurrency. It is not a distributed database, an
 authenticator, an encryption system, or deployment certification.
 """
@@ -8,15 +9,20 @@ authenticator, an encryption system, or deployment certification.
 from __future__ import annotations
 
 import contextlib
-import copy
+import itertools
 import os
 import sqlite3
 import stat
 import tempfile
+import threading
+import time
 import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterator, Mapping
+from typing import Any, Iterable, Iterator, Mapping
+
+from jsonschema.exceptions import ValidationError
 
 from .dka import dka_digest_spec, seal_record, validate_record, verify_record_integrity
 from .dka_store import (
@@ -30,6 +36,8 @@ from .dka_store import (
     StoreBusy,
     StoreContext,
     assert_lineage,
+    lookup_result,
+    revision_bounds,
 )
 from .provenance import (
     DKA_STORE_EVENT_DIGEST_PROFILE,
@@ -38,15 +46,22 @@ from .provenance import (
     canonicalize_json,
     file_sha256,
     loads_json,
+    omit_paths,
     profiled_digest,
-    without_paths,
+    verify_many,
 )
+from .record_cache import VerifiedRecordCache, json_copy
 
 
 PROFILE_ID = "cpas-sqlite-rollback-single-host-v1"
+WAL_PROFILE_ID = "cpas-sqlite-wal-single-host-v1"
 PROFILE_VERSION = "1.0.0"
 SCHEMA_VERSION = "1"
 MINIMUM_SQLITE = (3, 31, 0)
+# SQLite builds carrying the WAL-reset corruption fix: 3.51.3 and later plus
+# the 3.50.7 and 3.44.6 backports.
+WAL_RESET_FIXED_SQLITE = ((3, 51, 3), (3, 50, 7), (3, 44, 6))
+WAL_CHECKPOINT_MODES = ("PASSIVE", "FULL", "RESTART", "TRUNCATE")
 
 READ = "dka:read"
 READ_SENSITIVE = "dka:read:sensitive"
@@ -57,6 +72,7 @@ MERGE = "dka:merge"
 LIFECYCLE = "dka:lifecycle"
 AUDIT = "dka:audit"
 VERIFY = "dka:verify"
+CHECKPOINT = "dka:checkpoint"
 BACKUP = "dka:backup"
 RESTORE = "dka:restore"
 RETENTION = "dka:retention"
@@ -72,6 +88,179 @@ _PUT_EVENT_TYPES = {
     "migration",
 }
 _ADMIN_EVENT_TYPES = {"backup", "restore", "purge"}
+_PROFILE_SETTINGS = {
+    PROFILE_ID: {"journal_mode": "delete", "synchronous": ("EXTRA", 3)},
+    WAL_PROFILE_ID: {"journal_mode": "wal", "synchronous": ("FULL", 2)},
+}
+_AUDIT_CHECKPOINT_KEYS = ("audit_checkpoint_sequence", "audit_checkpoint_digest")
+_AUDIT_COLUMNS = """
+    sequence, tenant_id, dka_id, event_type, event_digest,
+    previous_event_digest, recorded_at, event_json
+"""
+_VERIFY_BATCH_ROWS = 1_000
+# Four bound parameters per reference stays under SQLite's historical
+# 999-variable limit.
+_GET_MANY_CHUNK = 200
+# Snapshot rows per keyset page of ``iter_history``.
+_HISTORY_PAGE_ROWS = 64
+_MAX_REVISION = 2**63 - 1
+_BATCH_ITEM_ERRORS = (DKAStoreError, ValidationError, KeyError, TypeError, ValueError)
+
+
+class _StoreConnection(sqlite3.Connection):
+    """SQLite connection that remembers the audit-chain tail it last wrote.
+
+    ``audit_tail`` is ``(data_version, sequence, event_digest)`` after a
+    committed append; ``PRAGMA data_version`` changes only when another
+    connection commits, so an unchanged value proves the tail is current.
+    ``pending_audit_tail`` tracks appends inside the open write transaction.
+    """
+
+    audit_tail: tuple[int, int, str] | None = None
+    pending_audit_tail: tuple[int, int, str] | None = None
+
+
+class _BatchRejected(Exception):
+    """Internal signal that rolls back a ``put_many`` transaction."""
+
+
+class _ConnectionPool:
+    """Bounded pools of pre-configured reader and writer connections.
+
+    Connections are created lazily by the store's ``_connect`` factory and are
+    shared between threads one checkout at a time. ``reset`` closes every idle
+    connection and retires checked-out ones when they are returned; the store
+    calls it when the bound file identity no longer matches.
+    """
+
+    def __init__(self, *, read_size: int, write_size: int) -> None:
+        self._condition = threading.Condition()
+        self._limits = {True: read_size, False: write_size}
+        self._idle: dict[bool, list[sqlite3.Connection]] = {True: [], False: []}
+        self._open = {True: 0, False: 0}
+        self._generation = 0
+        self._checked_out: dict[int, int] = {}
+        self._metrics = {
+            "checkouts": 0,
+            "waits": 0,
+            "timeouts": 0,
+            "connections_created": 0,
+            "connections_reused": 0,
+            "connections_discarded": 0,
+            "identity_resets": 0,
+        }
+
+    def acquire(
+        self,
+        query_only: bool,
+        factory: Any,
+        *,
+        timeout: float,
+    ) -> sqlite3.Connection:
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            self._metrics["checkouts"] += 1
+            waited = False
+            while True:
+                if self._idle[query_only]:
+                    connection = self._idle[query_only].pop()
+                    self._metrics["connections_reused"] += 1
+                    self._checked_out[id(connection)] = self._generation
+                    return connection
+                if self._open[query_only] < self._limits[query_only]:
+                    self._open[query_only] += 1
+                    generation = self._generation
+                    break
+                if not waited:
+                    self._metrics["waits"] += 1
+                    waited = True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._metrics["timeouts"] += 1
+                    raise StoreBusy("SQLite connection pool exhausted")
+                self._condition.wait(remaining)
+        try:
+            connection = factory(query_only=query_only)
+        except BaseException:
+            with self._condition:
+                self._open[query_only] -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._metrics["connections_created"] += 1
+            self._checked_out[id(connection)] = generation
+        return connection
+
+    def release(
+        self, connection: sqlite3.Connection, query_only: bool, *, discard: bool = False
+    ) -> None:
+        with self._condition:
+            generation = self._checked_out.pop(id(connection), None)
+            stale = discard or generation != self._generation
+        if not stale and connection.in_transaction:
+            try:
+                connection.execute("ROLLBACK")
+            except sqlite3.Error:
+                stale = True
+        if stale:
+            connection.close()
+        with self._condition:
+            if stale:
+                self._open[query_only] -= 1
+                self._metrics["connections_discarded"] += 1
+            else:
+                self._idle[query_only].append(connection)
+            self._condition.notify()
+
+    def reset(self, *, identity_changed: bool = False) -> None:
+        with self._condition:
+            self._generation += 1
+            idle = self._idle[True] + self._idle[False]
+            for query_only in (True, False):
+                self._open[query_only] -= len(self._idle[query_only])
+                self._idle[query_only] = []
+            self._metrics["connections_discarded"] += len(idle)
+            if identity_changed:
+                self._metrics["identity_resets"] += 1
+            self._condition.notify_all()
+        for connection in idle:
+            connection.close()
+
+    def status(self) -> dict[str, Any]:
+        with self._condition:
+            return {
+                **self._metrics,
+                "read_pool_size": self._limits[True],
+                "write_pool_size": self._limits[False],
+                "open_readers": self._open[True],
+                "open_writers": self._open[False],
+                "idle_readers": len(self._idle[True]),
+                "idle_writers": len(self._idle[False]),
+            }
+
+
+def _wal_reset_fixed(version: tuple[int, ...]) -> bool:
+    for fixed in WAL_RESET_FIXED_SQLITE:
+        if version >= fixed and (
+            fixed == WAL_RESET_FIXED_SQLITE[0] or version[:2] == fixed[:2]
+        ):
+            return True
+    return False
+
+
+def _require_profile_support(profile_id: str) -> None:
+    if profile_id not in _PROFILE_SETTINGS:
+        raise ProfileViolation(
+            f"unknown SQLite store profile {profile_id!r}; expected one of "
+            f"{sorted(_PROFILE_SETTINGS)!r}"
+        )
+    if profile_id == WAL_PROFILE_ID and not _wal_reset_fixed(
+        sqlite3.sqlite_version_info
+    ):
+        raise ProfileViolation(
+            f"{WAL_PROFILE_ID} requires an SQLite build with the WAL-reset fix "
+            f"(3.51.3+, 3.50.7+, or 3.44.6+ in its series); found {sqlite3.sqlite_version}"
+        )
 
 
 def _utc_now() -> str:
@@ -86,15 +275,60 @@ def _safe_identifier(value: str, *, name: str) -> str:
     return value
 
 
+def _rejected_item(index: int, exc: Exception) -> dict[str, Any]:
+    if isinstance(exc, DKAStoreError):
+        error = exc.as_dict()
+    else:
+        error = {"code": "invalid_record", "message": str(exc), "retryable": False}
+    return {"index": index, "status": "rejected", "error": error}
+
+
+def _verify_partition(
+    settings: Mapping[str, Any],
+    dka_range: tuple[str | None, str | None],
+    verified_through: int,
+) -> dict[str, int]:
+    """Process-pool entry point that verifies one DKA-ID range."""
+
+    store = SQLiteDKAStore(
+        settings["path"],
+        tenant_id=settings["tenant_id"],
+        local_filesystem=True,
+        busy_timeout_ms=settings["busy_timeout_ms"],
+        read_pool_size=1,
+        profile_id=settings["profile_id"],
+        wal_autocheckpoint=settings["wal_autocheckpoint"],
+    )
+    connection = store._acquire(query_only=True)
+    try:
+        store._assert_dkas_have_events(connection, dka_range)
+        return store._verify_dkas(
+            connection,
+            store._iter_dka_ids(connection, dka_range=dka_range),
+            verified_through,
+        )
+    except sqlite3.Error as exc:
+        raise store._translate_error(exc) from exc
+    finally:
+        store._release(connection, query_only=True)
+        store.close()
+
+
 def _event_digest(event: Mapping[str, Any]) -> str:
     return profiled_digest(
-        without_paths(dict(event), [("integrity", "digest")]),
+        omit_paths(event, [("integrity", "digest")]),
         canonicalization=JCS_CANONICALIZATION,
         digest_profile=DKA_STORE_EVENT_DIGEST_PROFILE,
         expected_v2_profile=DKA_STORE_EVENT_DIGEST_PROFILE,
     )
 
 
+def verify_event_integrity(event: Mapping[str, Any]) -> bool:
+    """Check an audit event's own digest; chain links are checked separately."""
+
+    return event.get("integrity", {}).get("digest") == _event_digest(event)
+
+
 class SQLiteDKAStore:
     """Production-oriented, single-host SQLite DKA-E store profile.
 
@@ -114,6 +348,11 @@ class SQLiteDKAStore:
         tenant_id: str,
         local_filesystem: bool,
         busy_timeout_ms: int = 5_000,
+        read_pool_size: int = 4,
+        write_pool_size: int = 1,
+        profile_id: str = PROFILE_ID,
+        wal_autocheckpoint: int = 1_000,
+        record_cache: VerifiedRecordCache | None = None,
     ):
         if os.name != "posix":
             raise ProfileViolation(
@@ -130,9 +369,26 @@ class SQLiteDKAStore:
             )
         if not isinstance(busy_timeout_ms, int) or busy_timeout_ms < 0:
             raise ValueError("busy_timeout_ms must be a non-negative integer")
+        for name, size in (
+            ("read_pool_size", read_pool_size),
+            ("write_pool_size", write_pool_size),
+        ):
+            if not isinstance(size, int) or size < 1:
+                raise ValueError(f"{name} must be a positive integer")
+        if not isinstance(wal_autocheckpoint, int) or wal_autocheckpoint < 0:
+            raise ValueError("wal_autocheckpoint must be a non-negative integer")
+        _require_profile_support(profile_id)
+        self.profile_id = profile_id
+        self.wal_autocheckpoint = wal_autocheckpoint
+        self.record_cache = record_cache
         self.path = Path(path)
         self.tenant_id = _safe_identifier(tenant_id, name="tenant_id")
         self.busy_timeout_ms = busy_timeout_ms
+        self._pool = _ConnectionPool(
+            read_size=read_pool_size, write_size=write_pool_size
+        )
+        self._audit_lock = threading.Lock()
+        self._audit_verified: tuple[int, str] | None = None
         is_empty = self._prepare_database_file(self.path)
         self._file_identity = self._path_identity(self.path)
         if is_empty:
@@ -246,6 +502,35 @@ class SQLiteDKAStore:
                 f"verified destination exists at {target}, but directory sync failed"
             ) from exc
 
+    @classmethod
+    def _convert_copy_profile(cls, path: Path, profile_id: str) -> None:
+        """Switch an unpublished copy's journal mode and profile metadata."""
+
+        required_mode = _PROFILE_SETTINGS[profile_id]["journal_mode"]
+        connection = sqlite3.connect(path, isolation_level=None)
+        try:
+            journal_mode = connection.execute(
+                f"PRAGMA journal_mode={required_mode.upper()}"
+            ).fetchone()[0]
+            if str(journal_mode).lower() != required_mode:
+                raise RecoveryError(
+                    f"SQLite refused {required_mode.upper()} journal mode for {profile_id}"
+                )
+            connection.execute("BEGIN IMMEDIATE")
+            updated = connection.execute(
+                "UPDATE metadata SET value=? WHERE key='profile_id'", (profile_id,)
+            ).rowcount
+            if updated != 1:
+                connection.execute("ROLLBACK")
+                raise RecoveryError("copy has no profile_id metadata to convert")
+            connection.execute("COMMIT")
+        except sqlite3.Error as exc:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise RecoveryError(str(cls._translate_error(exc))) from exc
+        finally:
+            connection.close()
+
     def _connect(self, *, query_only: bool = False) -> sqlite3.Connection:
         self._assert_bound_path()
         connection: sqlite3.Connection | None = None
@@ -254,6 +539,9 @@ class SQLiteDKAStore:
                 self.path,
                 timeout=self.busy_timeout_ms / 1000,
                 isolation_level=None,
+                check_same_thread=False,
+                cached_statements=256,
+                factory=_StoreConnection,
             )
             connection.row_factory = sqlite3.Row
             connection.execute(f"PRAGMA busy_timeout={self.busy_timeout_ms}")
@@ -261,7 +549,11 @@ class SQLiteDKAStore:
             connection.execute("PRAGMA trusted_schema=OFF")
             connection.execute("PRAGMA secure_delete=ON")
             connection.execute("PRAGMA temp_store=MEMORY")
-            connection.execute("PRAGMA synchronous=EXTRA")
+            connection.execute(
+                f"PRAGMA synchronous={_PROFILE_SETTINGS[self.profile_id]['synchronous'][0]}"
+            )
+            if self.profile_id == WAL_PROFILE_ID and not query_only:
+                connection.execute(f"PRAGMA wal_autocheckpoint={self.wal_autocheckpoint}")
             if query_only:
                 connection.execute("PRAGMA query_only=ON")
             self._assert_bound_path()
@@ -275,6 +567,37 @@ class SQLiteDKAStore:
                 connection.close()
             raise
 
+    def _acquire(self, *, query_only: bool = False) -> sqlite3.Connection:
+        """Check out a pooled connection after one bound-file identity check."""
+
+        connection = self._pool.acquire(
+            query_only, self._connect, timeout=self.busy_timeout_ms / 1000
+        )
+        try:
+            self._assert_bound_path()
+        except ProfileViolation:
+            self._pool.release(connection, query_only, discard=True)
+            self._pool.reset(identity_changed=True)
+            raise
+        except BaseException:
+            self._pool.release(connection, query_only, discard=True)
+            raise
+        return connection
+
+    def _release(
+        self, connection: sqlite3.Connection, *, query_only: bool = False
+    ) -> None:
+        self._pool.release(connection, query_only)
+
+    def pool_status(self, *, context: StoreContext | None = None) -> dict[str, Any]:
+        self._require(context, VERIFY)
+        return self._pool.status()
+
+    def close(self) -> None:
+        """Close idle pooled connections; later operations reconnect lazily."""
+
+        self._pool.reset()
+
     @staticmethod
     def _translate_error(exc: sqlite3.Error) -> DKAStoreError:
         name = getattr(exc, "sqlite_errorname", "")
@@ -286,11 +609,13 @@ class SQLiteDKAStore:
 
     @contextlib.contextmanager
     def _write_transaction(self) -> Iterator[sqlite3.Connection]:
-        connection = self._connect()
+        connection = self._acquire()
         try:
             connection.execute("BEGIN IMMEDIATE")
             yield connection
             connection.execute("COMMIT")
+            if connection.pending_audit_tail is not None:
+                connection.audit_tail = connection.pending_audit_tail
         except sqlite3.Error as exc:
             if connection.in_transaction:
                 connection.execute("ROLLBACK")
@@ -300,16 +625,22 @@ class SQLiteDKAStore:
                 connection.execute("ROLLBACK")
             raise
         finally:
-            connection.close()
+            connection.pending_audit_tail = None
+            self._release(connection)
 
     def _initialize(self) -> None:
         connection = self._connect()
         try:
-            journal_mode = connection.execute("PRAGMA journal_mode=DELETE").fetchone()[0]
-            if str(journal_mode).lower() != "delete":
-                raise ProfileViolation("SQLite refused required DELETE journal mode")
+            required_mode = _PROFILE_SETTINGS[self.profile_id]["journal_mode"]
+            journal_mode = connection.execute(
+                f"PRAGMA journal_mode={required_mode.upper()}"
+            ).fetchone()[0]
+            if str(journal_mode).lower() != required_mode:
+                raise ProfileViolation(
+                    f"SQLite refused required {required_mode.upper()} journal mode"
+                )
             values = {
-                "profile_id": PROFILE_ID,
+                "profile_id": self.profile_id,
                 "profile_version": PROFILE_VERSION,
                 "schema_version": SCHEMA_VERSION,
                 "tenant_id": self.tenant_id,
@@ -409,7 +740,7 @@ class SQLiteDKAStore:
         try:
             metadata = self._metadata(connection)
             expected = {
-                "profile_id": PROFILE_ID,
+                "profile_id": self.profile_id,
                 "profile_version": PROFILE_VERSION,
                 "schema_version": SCHEMA_VERSION,
                 "tenant_id": self.tenant_id,
@@ -419,10 +750,12 @@ class SQLiteDKAStore:
                     raise ProfileViolation(
                         f"database {key} mismatch: expected {value!r}, found {metadata.get(key)!r}"
                     )
+            required_mode = _PROFILE_SETTINGS[self.profile_id]["journal_mode"]
             journal_mode = str(connection.execute("PRAGMA journal_mode").fetchone()[0])
-            if journal_mode.lower() != "delete":
+            if journal_mode.lower() != required_mode:
                 raise ProfileViolation(
-                    f"{PROFILE_ID} requires DELETE journal mode, found {journal_mode}"
+                    f"{self.profile_id} requires {required_mode.upper()} journal mode, "
+                    f"found {journal_mode}"
                 )
         finally:
             connection.close()
@@ -493,7 +826,7 @@ class SQLiteDKAStore:
         request = self._require(context, READ)
         _safe_identifier(dka_id, name="dka_id")
         _safe_identifier(branch, name="branch")
-        connection = self._connect(query_only=True)
+        connection = self._acquire(query_only=True)
         try:
             head = self._read_head(connection, dka_id, branch)
             if head is None:
@@ -523,7 +856,7 @@ class SQLiteDKAStore:
         except sqlite3.Error as exc:
             raise self._translate_error(exc) from exc
         finally:
-            connection.close()
+            self._release(connection, query_only=True)
 
     def _append_event(
         self,
@@ -537,17 +870,15 @@ class SQLiteDKAStore:
         previous_head: Mapping[str, Any] | None,
         detail: Mapping[str, Any] | None = None,
     ) -> dict[str, Any]:
-        last = connection.execute(
-            "SELECT sequence, event_digest FROM audit_events ORDER BY sequence DESC LIMIT 1"
-        ).fetchone()
-        sequence = int(last["sequence"]) + 1 if last else 1
-        previous_event_digest = str(last["event_digest"]) if last else None
+        data_version, last = self._audit_tail(connection)
+        sequence = last[0] + 1 if last else 1
+        previous_event_digest = last[1] if last else None
         recorded_at = _utc_now()
         event: dict[str, Any] = {
             "event_version": "1.0",
             "event_id": str(uuid.uuid4()),
             "sequence": sequence,
-            "profile_id": PROFILE_ID,
+            "profile_id": self.profile_id,
             "tenant_id": self.tenant_id,
             "event_type": event_type,
             "actor": {
@@ -594,11 +925,41 @@ class SQLiteDKAStore:
                 serialized,
             ),
         )
+        connection.pending_audit_tail = (
+            data_version,
+            sequence,
+            event["integrity"]["digest"],
+        )
         return event
 
-    def _assert_parents_exist(
-        self, connection: sqlite3.Connection, candidate: Mapping[str, Any]
-    ) -> None:
+    @staticmethod
+    def _audit_tail(
+        connection: sqlite3.Connection,
+    ) -> tuple[int, tuple[int, str] | None]:
+        """Return ``(data_version, (sequence, digest) | None)`` for the chain tail.
+
+        Must be called inside the write transaction. The cached tail is reused
+        while no other connection has committed; otherwise the last row is read.
+        """
+
+        pending = getattr(connection, "pending_audit_tail", None)
+        if pending is not None:
+            return pending[0], pending[1:]
+        data_version = int(connection.execute("PRAGMA data_version").fetchone()[0])
+        cached = getattr(connection, "audit_tail", None)
+        if cached is not None and cached[0] == data_version:
+            return data_version, cached[1:]
+        last = connection.execute(
+            "SELECT sequence, event_digest FROM audit_events ORDER BY sequence DESC LIMIT 1"
+        ).fetchone()
+        if last is None:
+            return data_version, None
+        return data_version, (int(last["sequence"]), str(last["event_digest"]))
+
+    @staticmethod
+    def _parent_references(
+        candidate: Mapping[str, Any],
+    ) -> list[tuple[str, str, str]]:
         evolution = candidate["evolution"]
         references: list[tuple[str, str, str]] = []
         parent_digest = evolution.get("parent_digest")
@@ -618,7 +979,12 @@ class SQLiteDKAStore:
             ("merge parent", digest, merge_profiles[index])
             for index, digest in enumerate(merge_digests)
         )
-        for kind, digest, profile in references:
+        return references
+
+    def _assert_parents_exist(
+        self, connection: sqlite3.Connection, candidate: Mapping[str, Any]
+    ) -> None:
+        for kind, digest, profile in self._parent_references(candidate):
             row = connection.execute(
                 """
                 SELECT 1 FROM snapshots
@@ -632,17 +998,14 @@ class SQLiteDKAStore:
                     f"{kind} tuple ({digest!r}, {profile!r}) does not resolve in this tenant/DKA"
                 )
 
-    def put(
+    def _prepare_put(
         self,
+        request: StoreContext,
         record: Mapping[str, Any],
         *,
-        expected_head: str | None,
-        expected_head_profile: str | None = None,
-        event_type: str = "commit",
-        actor: str = "unspecified",
-        context: StoreContext | None = None,
+        event_type: str,
+        actor: str,
     ) -> dict[str, Any]:
-        request = self._require(context, WRITE)
         if event_type not in _PUT_EVENT_TYPES:
             raise ProfileViolation(
                 f"put event_type must be one of {sorted(_PUT_EVENT_TYPES)!r}"
@@ -657,158 +1020,288 @@ class SQLiteDKAStore:
             self._require(request, LIFECYCLE)
         if actor not in {"unspecified", request.principal_id}:
             raise AccessDenied("event actor must match the authenticated principal context")
-        candidate = copy.deepcopy(dict(record))
+        candidate = json_copy(dict(record))
         validate_record(candidate)
         if not verify_record_integrity(candidate):
             raise CorruptionDetected("record integrity verification failed before commit")
         self._authorize_record(request, candidate, operation="write")
-        dka_id = _safe_identifier(candidate["dka_id"], name="dka_id")
-        branch = _safe_identifier(candidate["branch"], name="branch")
-        revision = int(candidate["revision"])
-        digest = candidate["integrity"]["digest"]
-        digest_profile = dka_digest_spec(candidate)[1]
-        classification = self._classification(candidate)
-        serialized = canonicalize_json(
-            candidate, profile=candidate["integrity"]["canonicalization"]
-        ).decode("utf-8")
+        return {
+            "candidate": candidate,
+            "event_type": event_type,
+            "dka_id": _safe_identifier(candidate["dka_id"], name="dka_id"),
+            "branch": _safe_identifier(candidate["branch"], name="branch"),
+            "revision": int(candidate["revision"]),
+            "digest": candidate["integrity"]["digest"],
+            "digest_profile": dka_digest_spec(candidate)[1],
+            "classification": self._classification(candidate),
+            "serialized": canonicalize_json(
+                candidate, profile=candidate["integrity"]["canonicalization"]
+            ).decode("utf-8"),
+        }
 
-        with self._write_transaction() as connection:
-            tombstone = connection.execute(
-                "SELECT 1 FROM tombstones WHERE tenant_id=? AND dka_id=?",
-                (self.tenant_id, dka_id),
-            ).fetchone()
-            if tombstone:
-                raise ProfileViolation(f"DKA has been tombstoned and cannot be recreated: {dka_id}")
-            current = self._read_head(connection, dka_id, branch)
-            actual = current["digest"] if current else None
-            actual_profile = (
-                current.get("digest_profile", LEGACY_DIGEST_PROFILE) if current else None
+    def _apply_put(
+        self,
+        connection: sqlite3.Connection,
+        request: StoreContext,
+        prepared: Mapping[str, Any],
+        *,
+        expected_head: str | None,
+        expected_head_profile: str | None,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        candidate = prepared["candidate"]
+        event_type = prepared["event_type"]
+        dka_id = prepared["dka_id"]
+        branch = prepared["branch"]
+        revision = prepared["revision"]
+        digest = prepared["digest"]
+        digest_profile = prepared["digest_profile"]
+        tombstone = connection.execute(
+            "SELECT 1 FROM tombstones WHERE tenant_id=? AND dka_id=?",
+            (self.tenant_id, dka_id),
+        ).fetchone()
+        if tombstone:
+            raise ProfileViolation(f"DKA has been tombstoned and cannot be recreated: {dka_id}")
+        current = self._read_head(connection, dka_id, branch)
+        actual = current["digest"] if current else None
+        actual_profile = (
+            current.get("digest_profile", LEGACY_DIGEST_PROFILE) if current else None
+        )
+        if actual != expected_head or (
+            expected_head_profile is not None
+            and actual_profile != expected_head_profile
+        ):
+            raise HeadConflict(
+                "expected head tuple "
+                f"({expected_head!r}, {expected_head_profile!r}), found "
+                f"({actual!r}, {actual_profile!r})"
             )
-            if actual != expected_head or (
-                expected_head_profile is not None
-                and actual_profile != expected_head_profile
-            ):
-                raise HeadConflict(
-                    "expected head tuple "
-                    f"({expected_head!r}, {expected_head_profile!r}), found "
-                    f"({actual!r}, {actual_profile!r})"
-                )
-            assert_lineage(candidate, current)
-            self._assert_parents_exist(connection, candidate)
-            merge_parents = candidate["evolution"].get("merge_parents", [])
-            parent_digest = candidate["evolution"].get("parent_digest")
-            validity_status = candidate["validity"]["status"]
-            if event_type == "branch" and (
-                current is not None or not parent_digest or merge_parents
-            ):
-                raise ProfileViolation(
-                    "branch events require an absent target head, one parent, and no merge parents"
-                )
-            if event_type == "merge" and len(merge_parents) != 2:
-                raise ProfileViolation("merge events require exactly two merge parents")
-            if merge_parents and event_type not in {"merge", "migration"}:
-                raise ProfileViolation(
-                    "records with merge parents require a merge or migration event"
-                )
-            if event_type == "invalidation" and validity_status != "invalidated":
-                raise ProfileViolation(
-                    "invalidation events require validity.status=invalidated"
-                )
-            if event_type == "supersede" and validity_status != "superseded":
-                raise ProfileViolation(
-                    "supersede events require validity.status=superseded"
-                )
-            try:
-                connection.execute(
-                    """
-                    INSERT INTO snapshots(
-                        tenant_id, dka_id, branch, revision, digest,
-                        digest_profile, classification, updated_at, payload_json
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        self.tenant_id,
-                        dka_id,
-                        branch,
-                        revision,
-                        digest,
-                        digest_profile,
-                        classification,
-                        candidate["provenance"]["updated_at"],
-                        serialized,
-                    ),
-                )
-            except sqlite3.IntegrityError as exc:
-                raise ProfileViolation(
-                    f"immutable snapshot already exists or violates storage constraints: "
-                    f"{dka_id}/{branch}/{revision}"
-                ) from exc
-            head = {
-                "dka_id": dka_id,
-                "branch": branch,
-                "revision": revision,
-                "digest": digest,
-                "digest_profile": digest_profile,
-                "updated_at": candidate["provenance"]["updated_at"],
-            }
-            if current is None:
-                connection.execute(
-                    """
-                    INSERT INTO heads(
-                        tenant_id, dka_id, branch, revision, digest,
-                        digest_profile, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        self.tenant_id,
-                        dka_id,
-                        branch,
-                        revision,
-                        digest,
-                        digest_profile,
-                        head["updated_at"],
-                    ),
-                )
-            else:
-                changed = connection.execute(
-                    """
-                    UPDATE heads SET revision=?, digest=?, digest_profile=?, updated_at=?
-                    WHERE tenant_id=? AND dka_id=? AND branch=?
-                      AND digest=? AND digest_profile=?
-                    """,
-                    (
-                        revision,
-                        digest,
-                        digest_profile,
-                        head["updated_at"],
-                        self.tenant_id,
-                        dka_id,
-                        branch,
-                        actual,
-                        actual_profile,
-                    ),
-                ).rowcount
-                if changed != 1:
-                    raise HeadConflict("branch head changed during compare-and-swap")
-            self._append_event(
+        assert_lineage(candidate, current)
+        self._assert_parents_exist(connection, candidate)
+        merge_parents = candidate["evolution"].get("merge_parents", [])
+        parent_digest = candidate["evolution"].get("parent_digest")
+        validity_status = candidate["validity"]["status"]
+        if event_type == "branch" and (
+            current is not None or not parent_digest or merge_parents
+        ):
+            raise ProfileViolation(
+                "branch events require an absent target head, one parent, and no merge parents"
+            )
+        if event_type == "merge" and len(merge_parents) != 2:
+            raise ProfileViolation("merge events require exactly two merge parents")
+        if merge_parents and event_type not in {"merge", "migration"}:
+            raise ProfileViolation(
+                "records with merge parents require a merge or migration event"
+            )
+        if event_type == "invalidation" and validity_status != "invalidated":
+            raise ProfileViolation(
+                "invalidation events require validity.status=invalidated"
+            )
+        if event_type == "supersede" and validity_status != "superseded":
+            raise ProfileViolation(
+                "supersede events require validity.status=superseded"
+            )
+        try:
+            connection.execute(
+                """
+                INSERT INTO snapshots(
+                    tenant_id, dka_id, branch, revision, digest,
+                    digest_profile, classification, updated_at, payload_json
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    self.tenant_id,
+                    dka_id,
+                    branch,
+                    revision,
+                    digest,
+                    digest_profile,
+                    prepared["classification"],
+                    candidate["provenance"]["updated_at"],
+                    prepared["serialized"],
+                ),
+            )
+        except sqlite3.IntegrityError as exc:
+            raise ProfileViolation(
+                f"immutable snapshot already exists or violates storage constraints: "
+                f"{dka_id}/{branch}/{revision}"
+            ) from exc
+        head = {
+            "dka_id": dka_id,
+            "branch": branch,
+            "revision": revision,
+            "digest": digest,
+            "digest_profile": digest_profile,
+            "updated_at": candidate["provenance"]["updated_at"],
+        }
+        if current is None:
+            connection.execute(
+                """
+                INSERT INTO heads(
+                    tenant_id, dka_id, branch, revision, digest,
+                    digest_profile, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    self.tenant_id,
+                    dka_id,
+                    branch,
+                    revision,
+                    digest,
+                    digest_profile,
+                    head["updated_at"],
+                ),
+            )
+        else:
+            changed = connection.execute(
+                """
+                UPDATE heads SET revision=?, digest=?, digest_profile=?, updated_at=?
+                WHERE tenant_id=? AND dka_id=? AND branch=?
+                  AND digest=? AND digest_profile=?
+                """,
+                (
+                    revision,
+                    digest,
+                    digest_profile,
+                    head["updated_at"],
+                    self.tenant_id,
+                    dka_id,
+                    branch,
+                    actual,
+                    actual_profile,
+                ),
+            ).rowcount
+            if changed != 1:
+                raise HeadConflict("branch head changed during compare-and-swap")
+        event = self._append_event(
+            connection,
+            context=request,
+            event_type=event_type,
+            dka_id=dka_id,
+            branch=branch,
+            result_head=head,
+            previous_head=current,
+        )
+        return head, event
+
+    def put(
+        self,
+        record: Mapping[str, Any],
+        *,
+        expected_head: str | None,
+        expected_head_profile: str | None = None,
+        event_type: str = "commit",
+        actor: str = "unspecified",
+        context: StoreContext | None = None,
+    ) -> dict[str, Any]:
+        request = self._require(context, WRITE)
+        prepared = self._prepare_put(
+            request, record, event_type=event_type, actor=actor
+        )
+        with self._write_transaction() as connection:
+            head, _ = self._apply_put(
                 connection,
-                context=request,
-                event_type=event_type,
-                dka_id=dka_id,
-                branch=branch,
-                result_head=head,
-                previous_head=current,
+                request,
+                prepared,
+                expected_head=expected_head,
+                expected_head_profile=expected_head_profile,
             )
             return head
 
-    def _decode_record(self, row: sqlite3.Row) -> dict[str, Any]:
+    def put_many(
+        self,
+        items: Iterable[Mapping[str, Any]],
+        *,
+        event_type: str = "commit",
+        actor: str = "unspecified",
+        context: StoreContext | None = None,
+    ) -> dict[str, Any]:
+        """Commit an ordered batch of snapshots in one write transaction.
+
+        Each item is a mapping with ``record`` and ``expected_head`` and may
+        override ``expected_head_profile`` and ``event_type``. Items are
+        applied in order, so later items may extend a branch written earlier
+        in the same batch. The batch is all-or-nothing: the first rejected
+        item rolls back every earlier item and the report identifies it.
+        Host-level failures such as ``StoreBusy`` still raise.
+        """
+
+        request = self._require(context, WRITE)
+        batch = list(items)
+        results: list[dict[str, Any]] = [
+            {"index": index, "status": "not_attempted"}
+            for index in range(len(batch))
+        ]
+        prepared: list[dict[str, Any]] = []
+        for index, item in enumerate(batch):
+            try:
+                if not isinstance(item, Mapping) or not isinstance(
+                    item.get("record"), Mapping
+                ):
+                    raise ValueError("batch items must be objects with a record object")
+                if "expected_head" not in item:
+                    raise ValueError("batch items must state expected_head explicitly")
+                prepared.append(
+                    self._prepare_put(
+                        request,
+                        item["record"],
+                        event_type=str(item.get("event_type", event_type)),
+                        actor=actor,
+                    )
+                )
+            except _BATCH_ITEM_ERRORS as exc:
+                results[index] = _rejected_item(index, exc)
+        report = {
+            "committed": False,
+            "count": len(batch),
+            "items": results,
+            "audit_sequences": None,
+        }
+        if any(result["status"] == "rejected" for result in results) or not batch:
+            report["committed"] = not batch
+            return report
+
+        sequences: list[int] = []
+        try:
+            with self._write_transaction() as connection:
+                for index, (item, entry) in enumerate(zip(batch, prepared)):
+                    try:
+                        head, event = self._apply_put(
+                            connection,
+                            request,
+                            entry,
+                            expected_head=item["expected_head"],
+                            expected_head_profile=item.get("expected_head_profile"),
+                        )
+                    except _BATCH_ITEM_ERRORS as exc:
+                        results[index] = _rejected_item(index, exc)
+                        for previous in results[:index]:
+                            previous["status"] = "rolled_back"
+                            previous.pop("head", None)
+                        raise _BatchRejected from exc
+                    results[index] = {"index": index, "status": "committed", "head": head}
+                    sequences.append(int(event["sequence"]))
+        except _BatchRejected:
+            return report
+        report["committed"] = True
+        report["audit_sequences"] = {"first": sequences[0], "last": sequences[-1]}
+        return report
+
+    def _decode_record(
+        self, row: sqlite3.Row, *, use_cache: bool = True
+    ) -> dict[str, Any]:
+        payload = str(row["payload_json"])
+        key = (str(row["digest_profile"]), str(row["digest"]))
+        cache = self.record_cache if use_cache else None
+        cached = cache.get(key, payload) if cache is not None else None
         try:
-            record = loads_json(str(row["payload_json"]))
-            if not isinstance(record, dict):
-                raise TypeError("snapshot payload is not an object")
-            validate_record(record)
-            if not verify_record_integrity(record):
-                raise ValueError("snapshot digest verification failed")
+            record = cached
+            if record is None:
+                record = loads_json(payload)
+                if not isinstance(record, dict):
+                    raise TypeError("snapshot payload is not an object")
+                validate_record(record)
+                if not verify_record_integrity(record):
+                    raise ValueError("snapshot digest verification failed")
             expected = {
                 "dka_id": row["dka_id"],
                 "branch": row["branch"],
@@ -831,6 +1324,8 @@ class SQLiteDKAStore:
                 raise ValueError(
                     f"snapshot index/payload mismatch: expected {expected!r}, found {actual!r}"
                 )
+            if cached is None and cache is not None:
+                cache.put(key, payload, record)
             return record
         except (KeyError, TypeError, ValueError) as exc:
             raise CorruptionDetected(str(exc)) from exc
@@ -848,7 +1343,7 @@ class SQLiteDKAStore:
         _safe_identifier(branch, name="branch")
         if revision is not None and (not isinstance(revision, int) or revision < 1):
             raise ValueError("revision must be a positive integer")
-        connection = self._connect(query_only=True)
+        connection = self._acquire(query_only=True)
         try:
             selected_revision = revision
             expected_head: dict[str, Any] | None = None
@@ -883,48 +1378,224 @@ class SQLiteDKAStore:
         except sqlite3.Error as exc:
             raise self._translate_error(exc) from exc
         finally:
-            connection.close()
+            self._release(connection, query_only=True)
 
-    def history(
+    def get_many(
         self,
-        dka_id: str,
-        branch: str = "main",
+        refs: Iterable[Mapping[str, Any]],
         *,
         context: StoreContext | None = None,
     ) -> list[dict[str, Any]]:
+        """Fetch several refs on one connection with one joined query per chunk.
+
+        Each ref is ``{"dka_id", "branch"?, "revision"?}``. Results keep the
+        input order; a missing, unauthorized, or corrupt ref becomes an
+        ``error`` entry instead of failing the other refs.
+        """
+
         request = self._require(context, READ)
-        _safe_identifier(dka_id, name="dka_id")
-        _safe_identifier(branch, name="branch")
-        connection = self._connect(query_only=True)
-        try:
-            rows = connection.execute(
-                """
-                SELECT dka_id, branch, revision, digest, digest_profile,
-                       classification, updated_at, payload_json
-                FROM snapshots
-                WHERE tenant_id=? AND dka_id=? AND branch=?
-                ORDER BY revision
-                """,
-                (self.tenant_id, dka_id, branch),
-            ).fetchall()
+        items = list(refs)
+        results: list[dict[str, Any] | None] = [None] * len(items)
+        wanted: list[tuple[int, str, str, int | None]] = []
+        for index, ref in enumerate(items):
+            try:
+                dka_id = _safe_identifier(ref["dka_id"], name="dka_id")
+                branch = _safe_identifier(ref.get("branch", "main"), name="branch")
+                revision = ref.get("revision")
+                if revision is not None and (
+                    not isinstance(revision, int) or revision < 1
+                ):
+                    raise ValueError("revision must be a positive integer")
+            except (KeyError, TypeError, ValueError) as exc:
+                results[index] = lookup_result(index, exc)
+            else:
+                wanted.append((index, dka_id, branch, revision))
+        connection = self._acquire(query_only=True)
+        try:
+            connection.execute("BEGIN")
+            for start in range(0, len(wanted), _GET_MANY_CHUNK):
+                chunk = wanted[start : start + _GET_MANY_CHUNK]
+                values = ", ".join("(?, ?, ?, ?)" for _ in chunk)
+                rows = connection.execute(
+                    f"""
+                    WITH wanted(position, dka_id, branch, revision) AS (VALUES {values})
+                    SELECT w.position, w.dka_id AS wanted_dka_id,
+                           w.branch AS wanted_branch, w.revision AS wanted_revision,
+                           h.revision AS head_revision, h.digest AS head_digest,
+                           h.digest_profile AS head_digest_profile,
+                           s.dka_id, s.branch, s.revision, s.digest, s.digest_profile,
+                           s.classification, s.updated_at, s.payload_json,
+                           length(CAST(s.payload_json AS BLOB)) AS payload_bytes
+                    FROM wanted w
+                    LEFT JOIN heads h
+                        ON w.revision IS NULL AND h.tenant_id=?
+                        AND h.dka_id=w.dka_id AND h.branch=w.branch
+                    LEFT JOIN snapshots s
+                        ON s.tenant_id=? AND s.dka_id=w.dka_id AND s.branch=w.branch
+                        AND s.revision=COALESCE(w.revision, h.revision)
+                    """,
+                    (
+                        *(value for item in chunk for value in item),
+                        self.tenant_id,
+                        self.tenant_id,
+                    ),
+                ).fetchall()
+                for row in rows:
+                    index = int(row["position"])
+                    try:
+                        results[index] = {
+                            **lookup_result(
+                                index, self._record_from_lookup(request, row)
+                            ),
+                            "canonical_bytes": int(row["payload_bytes"]),
+                        }
+                    except DKAStoreError as exc:
+                        results[index] = lookup_result(index, exc)
+        except sqlite3.Error as exc:
+            raise self._translate_error(exc) from exc
+        finally:
+            self._release(connection, query_only=True)
+        return [result for result in results if result is not None]
+
+    def _record_from_lookup(
+        self, request: StoreContext, row: sqlite3.Row
+    ) -> dict[str, Any]:
+        dka_id, branch = row["wanted_dka_id"], row["wanted_branch"]
+        if row["wanted_revision"] is None and row["head_revision"] is None:
+            raise RecordNotFound(f"no head for {dka_id}/{branch}")
+        if row["payload_json"] is None:
+            revision = row["wanted_revision"] or row["head_revision"]
+            raise RecordNotFound(f"no snapshot for {dka_id}/{branch}/{revision}")
+        self._authorize_classification(
+            request, str(row["classification"]), operation="read"
+        )
+        record = self._decode_record(row)
+        if row["wanted_revision"] is None and (
+            record["integrity"]["digest"] != row["head_digest"]
+            or dka_digest_spec(record)[1] != row["head_digest_profile"]
+        ):
+            raise CorruptionDetected("head tuple does not match its snapshot")
+        return record
+
+    def history(
+        self,
+        dka_id: str,
+        branch: str = "main",
+        *,
+        context: StoreContext | None = None,
+    ) -> list[dict[str, Any]]:
+        return list(self.iter_history(dka_id, branch, context=context))
+
+    def iter_history(
+        self,
+        dka_id: str,
+        branch: str = "main",
+        *,
+        since_revision: int | None = None,
+        until_revision: int | None = None,
+        newest_first: bool = False,
+        context: StoreContext | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream revisions in an inclusive range in keyset-paged reads.
+
+        Arguments and the READ permission are checked immediately. Each page
+        is read on its own pooled connection, which is released before any of
+        its rows are yielded, so a paused iterator holds neither a reader nor
+        a read lock. Each row is authorized, decoded, and verified only when
+        the caller advances the iterator. Stored revisions are immutable, so
+        rows never change between pages; a revision committed while an
+        open-ended iterator is paused appears in a later page.
+        """
+
+        request = self._require(context, READ)
+        _safe_identifier(dka_id, name="dka_id")
+        _safe_identifier(branch, name="branch")
+        low, high = revision_bounds(since_revision, until_revision)
+        return self._iter_history_rows(
+            request, dka_id, branch, low, high, newest_first
+        )
+
+    def _iter_history_rows(
+        self,
+        request: StoreContext,
+        dka_id: str,
+        branch: str,
+        low: int,
+        high: int | None,
+        newest_first: bool,
+    ) -> Iterator[dict[str, Any]]:
+        order = "DESC" if newest_first else "ASC"
+        high = high or _MAX_REVISION
+        while low <= high:
+            connection = self._acquire(query_only=True)
+            try:
+                rows = connection.execute(
+                    f"""
+                    SELECT dka_id, branch, revision, digest, digest_profile,
+                           classification, updated_at, payload_json
+                    FROM snapshots
+                    WHERE tenant_id=? AND dka_id=? AND branch=?
+                      AND revision BETWEEN ? AND ?
+                    ORDER BY revision {order} LIMIT ?
+                    """,
+                    (
+                        self.tenant_id,
+                        dka_id,
+                        branch,
+                        low,
+                        high,
+                        _HISTORY_PAGE_ROWS,
+                    ),
+                ).fetchall()
+            except sqlite3.Error as exc:
+                raise self._translate_error(exc) from exc
+            finally:
+                self._release(connection, query_only=True)
             for row in rows:
                 self._authorize_classification(
                     request, str(row["classification"]), operation="read"
                 )
-            return [self._decode_record(row) for row in rows]
-        except sqlite3.Error as exc:
-            raise self._translate_error(exc) from exc
-        finally:
-            connection.close()
+                yield self._decode_record(row)
+            if len(rows) < _HISTORY_PAGE_ROWS:
+                return
+            if newest_first:
+                high = int(rows[-1]["revision"]) - 1
+            else:
+                low = int(rows[-1]["revision"]) + 1
+
+    def _validate_audit_rows(
+        self,
+        rows: Iterable[sqlite3.Row],
+        *,
+        start_sequence: int = 1,
+        previous: str | None = None,
+    ) -> list[dict[str, Any]]:
+        return list(
+            self._iter_audit_rows(
+                rows, start_sequence=start_sequence, previous=previous
+            )
+        )
+
+    def _iter_audit_rows(
+        self,
+        rows: Iterable[sqlite3.Row],
+        *,
+        start_sequence: int = 1,
+        previous: str | None = None,
+        executor: Executor | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Validate audit rows one at a time, holding only event IDs.
+
+        With an ``executor``, event digests are precomputed per batch through
+        ``verify_many``; chain links are still checked in sequence order.
+        """
 
-    def _validate_audit_rows(self, rows: list[sqlite3.Row]) -> list[dict[str, Any]]:
-        events: list[dict[str, Any]] = []
         event_ids: set[str] = set()
-        previous: str | None = None
-        expected_sequence = 1
-        for row in rows:
+        expected_sequence = start_sequence
+        for row, event, digest_verified in self._audit_digest_checks(rows, executor):
             try:
-                event = loads_json(str(row["event_json"]))
+                if event is None:
+                    event = loads_json(str(row["event_json"]))
                 if not isinstance(event, dict):
                     raise TypeError("audit event is not an object")
                 if int(row["sequence"]) != expected_sequence:
@@ -940,7 +1611,7 @@ class SQLiteDKAStore:
                 if event_id in event_ids:
                     raise ValueError("duplicate audit event ID")
                 event_ids.add(event_id)
-                if event.get("profile_id") != PROFILE_ID:
+                if event.get("profile_id") not in _PROFILE_SETTINGS:
                     raise ValueError("audit event profile mismatch")
                 if event.get("tenant_id") != self.tenant_id:
                     raise ValueError("audit event tenant mismatch")
@@ -1043,16 +1714,45 @@ class SQLiteDKAStore:
                 if event.get("previous_event_digest") != previous:
                     raise ValueError("audit event chain predecessor mismatch")
                 digest = event.get("integrity", {}).get("digest")
-                if digest != row["event_digest"] or digest != _event_digest(event):
+                if digest != row["event_digest"] or not (
+                    digest == _event_digest(event)
+                    if digest_verified is None
+                    else digest_verified
+                ):
                     raise ValueError("audit event digest mismatch")
                 if row["previous_event_digest"] != previous:
                     raise ValueError("audit event index predecessor mismatch")
-                events.append(event)
                 previous = digest
                 expected_sequence += 1
             except (KeyError, TypeError, ValueError) as exc:
                 raise CorruptionDetected(str(exc)) from exc
-        return events
+            yield event
+
+    @staticmethod
+    def _audit_digest_checks(
+        rows: Iterable[sqlite3.Row], executor: Executor | None
+    ) -> Iterator[tuple[sqlite3.Row, Any, bool | None]]:
+        """Pair rows with parsed events and digest results when fanning out."""
+
+        if executor is None:
+            for row in rows:
+                yield row, None, None
+            return
+        iterator = iter(rows)
+        while batch := list(itertools.islice(iterator, _VERIFY_BATCH_ROWS)):
+            events: list[Any] = []
+            for row in batch:
+                try:
+                    events.append(loads_json(str(row["event_json"])))
+                except ValueError:
+                    events.append(None)
+            results = verify_many(
+                [event if isinstance(event, dict) else {} for event in events],
+                kind="dka-store-event",
+                executor=executor,
+            )
+            for row, event, result in zip(batch, events, results):
+                yield row, event, result["verified"] if event is not None else None
 
     def audit_events(
         self,
@@ -1060,29 +1760,198 @@ class SQLiteDKAStore:
         context: StoreContext | None = None,
         dka_id: str | None = None,
     ) -> list[dict[str, Any]]:
+        """Return validated audit events, optionally only those for ``dka_id``.
+
+        The full listing re-validates the whole chain. A per-DKA listing
+        validates the chain only after the last verified checkpoint and reads
+        older events for that DKA through the ``audit_events_dka`` index,
+        checking each one's digest and its link to the following event.
+        """
+
         self._require(context, AUDIT)
-        connection = self._connect(query_only=True)
+        connection = self._acquire(query_only=True)
         try:
-            rows = connection.execute(
-                """
-                SELECT sequence, tenant_id, dka_id, event_type, event_digest,
-                       previous_event_digest, recorded_at, event_json
-                FROM audit_events WHERE tenant_id=? ORDER BY sequence
-                """,
-                (self.tenant_id,),
-            ).fetchall()
-            events = self._validate_audit_rows(rows)
+            connection.execute("BEGIN")
             if dka_id is None:
+                rows = connection.execute(
+                    f"SELECT {_AUDIT_COLUMNS} FROM audit_events "
+                    "WHERE tenant_id=? ORDER BY sequence",
+                    (self.tenant_id,),
+                ).fetchall()
+                events = self._validate_audit_rows(rows)
+                self._check_audit_checkpoint(connection)
+                self._advance_audit_verified(events)
                 return events
-            return [
+            checkpoint = self._audit_checkpoint(connection)
+            start, previous = (checkpoint[0] + 1, checkpoint[1]) if checkpoint else (1, None)
+            prior_rows = (
+                connection.execute(
+                    f"SELECT {_AUDIT_COLUMNS} FROM audit_events "
+                    "WHERE tenant_id=? AND dka_id=? AND sequence<? ORDER BY sequence",
+                    (self.tenant_id, dka_id, start),
+                ).fetchall()
+                if checkpoint
+                else []
+            )
+            prior = [
+                self._validate_checkpointed_row(connection, row, checkpoint)
+                for row in prior_rows
+            ]
+            suffix = self._validate_audit_rows(
+                connection.execute(
+                    f"SELECT {_AUDIT_COLUMNS} FROM audit_events "
+                    "WHERE tenant_id=? AND sequence>=? ORDER BY sequence",
+                    (self.tenant_id, start),
+                ).fetchall(),
+                start_sequence=start,
+                previous=previous,
+            )
+            self._advance_audit_verified(suffix)
+            return prior + [
                 event
-                for event in events
+                for event in suffix
                 if (event.get("dka_ref") or {}).get("dka_id") == dka_id
             ]
         except sqlite3.Error as exc:
             raise self._translate_error(exc) from exc
         finally:
-            connection.close()
+            self._release(connection, query_only=True)
+
+    def _audit_checkpoint(
+        self, connection: sqlite3.Connection
+    ) -> tuple[int, str] | None:
+        """Return the newest verified ``(sequence, digest)`` after checking it."""
+
+        persisted = self._check_audit_checkpoint(connection)
+        with self._audit_lock:
+            verified = self._audit_verified
+        if verified is None or (persisted and persisted[0] >= verified[0]):
+            return persisted
+        row = connection.execute(
+            "SELECT event_digest FROM audit_events WHERE tenant_id=? AND sequence=?",
+            (self.tenant_id, verified[0]),
+        ).fetchone()
+        if row is None or row["event_digest"] != verified[1]:
+            raise CorruptionDetected("audit chain changed behind a verified position")
+        return verified
+
+    def _check_audit_checkpoint(
+        self, connection: sqlite3.Connection
+    ) -> tuple[int, str] | None:
+        metadata = self._metadata(connection)
+        sequence_text, digest = (metadata.get(key) for key in _AUDIT_CHECKPOINT_KEYS)
+        if sequence_text is None and digest is None:
+            return None
+        try:
+            sequence = int(str(sequence_text))
+        except ValueError as exc:
+            raise CorruptionDetected("audit checkpoint sequence is malformed") from exc
+        row = connection.execute(
+            "SELECT event_digest FROM audit_events WHERE tenant_id=? AND sequence=?",
+            (self.tenant_id, sequence),
+        ).fetchone()
+        if row is None or row["event_digest"] != digest:
+            raise CorruptionDetected("audit checkpoint does not match the stored chain")
+        return sequence, str(digest)
+
+    def _validate_checkpointed_row(
+        self,
+        connection: sqlite3.Connection,
+        row: sqlite3.Row,
+        checkpoint: tuple[int, str],
+    ) -> dict[str, Any]:
+        sequence = int(row["sequence"])
+        [event] = self._validate_audit_rows(
+            [row],
+            start_sequence=sequence,
+            previous=row["previous_event_digest"] if sequence > 1 else None,
+        )
+        if sequence == checkpoint[0]:
+            linked = row["event_digest"] == checkpoint[1]
+        else:
+            successor = connection.execute(
+                "SELECT previous_event_digest FROM audit_events "
+                "WHERE tenant_id=? AND sequence=?",
+                (self.tenant_id, sequence + 1),
+            ).fetchone()
+            linked = (
+                successor is not None
+                and successor["previous_event_digest"] == row["event_digest"]
+            )
+        if not linked:
+            raise CorruptionDetected(
+                f"audit event {sequence} is not linked to its verified successor"
+            )
+        return event
+
+    def _advance_audit_verified(self, events: list[dict[str, Any]]) -> None:
+        if not events:
+            return
+        tail = (int(events[-1]["sequence"]), str(events[-1]["integrity"]["digest"]))
+        with self._audit_lock:
+            if self._audit_verified is None or self._audit_verified[0] < tail[0]:
+                self._audit_verified = tail
+
+    def record_audit_checkpoint(
+        self, *, context: StoreContext | None = None
+    ) -> dict[str, Any] | None:
+        """Validate the chain after the last checkpoint and persist its tail.
+
+        Moving the checkpoint changes which events per-DKA reads re-validate,
+        so it requires ``dka:checkpoint`` in addition to ``dka:verify``.
+        """
+
+        self._require(context, VERIFY)
+        self._require(context, CHECKPOINT)
+        connection = self._acquire(query_only=True)
+        try:
+            connection.execute("BEGIN")
+            checkpoint = self._check_audit_checkpoint(connection)
+            start, previous = (checkpoint[0] + 1, checkpoint[1]) if checkpoint else (1, None)
+            suffix = self._validate_audit_rows(
+                connection.execute(
+                    f"SELECT {_AUDIT_COLUMNS} FROM audit_events "
+                    "WHERE tenant_id=? AND sequence>=? ORDER BY sequence",
+                    (self.tenant_id, start),
+                ).fetchall(),
+                start_sequence=start,
+                previous=previous,
+            )
+        except sqlite3.Error as exc:
+            raise self._translate_error(exc) from exc
+        finally:
+            self._release(connection, query_only=True)
+        self._advance_audit_verified(suffix)
+        if not suffix:
+            return (
+                {"sequence": checkpoint[0], "digest": checkpoint[1]}
+                if checkpoint
+                else None
+            )
+        return self._store_audit_checkpoint(
+            int(suffix[-1]["sequence"]), str(suffix[-1]["integrity"]["digest"])
+        )
+
+    def _store_audit_checkpoint(self, sequence: int, digest: str) -> dict[str, Any]:
+        with self._write_transaction() as connection:
+            current = self._check_audit_checkpoint(connection)
+            row = connection.execute(
+                "SELECT event_digest FROM audit_events WHERE tenant_id=? AND sequence=?",
+                (self.tenant_id, sequence),
+            ).fetchone()
+            if row is None or row["event_digest"] != digest:
+                raise CorruptionDetected("audit chain changed before checkpointing")
+            if current is None or current[0] < sequence:
+                connection.executemany(
+                    """
+                    INSERT INTO metadata(key, value) VALUES (?, ?)
+                    ON CONFLICT(key) DO UPDATE SET value=excluded.value
+                    """,
+                    zip(_AUDIT_CHECKPOINT_KEYS, (str(sequence), digest)),
+                )
+            else:
+                sequence, digest = current
+        return {"sequence": sequence, "digest": digest}
 
     def events(
         self,
@@ -1112,7 +1981,8 @@ class SQLiteDKAStore:
             raise HeadConflict(f"target branch already exists: {target_branch}")
         source = self.get(dka_id, source_branch, context=request)
         self._authorize_record(request, source, operation="write")
-        branched = copy.deepcopy(source)
+        # ``get`` returns a private copy and ``seal_record`` copies again.
+        branched = dict(source)
         branched["branch"] = target_branch
         branched["revision"] = 1
         branched["evolution"] = {
@@ -1138,7 +2008,8 @@ class SQLiteDKAStore:
         self, *, context: StoreContext | None = None
     ) -> dict[str, Any]:
         self._require(context, VERIFY)
-        connection = self._connect(query_only=True)
+        settings = _PROFILE_SETTINGS[self.profile_id]
+        connection = self._acquire(query_only=True)
         try:
             metadata = self._metadata(connection)
             file_stat = self.path.lstat()
@@ -1166,14 +2037,25 @@ class SQLiteDKAStore:
                 ),
                 "deployment_scope": "single-host-local-filesystem",
             }
+            wal_checks: tuple[bool, ...] = ()
+            if self.profile_id == WAL_PROFILE_ID:
+                status["wal_autocheckpoint"] = self.wal_autocheckpoint
+                status["wal_reset_fixed_build"] = _wal_reset_fixed(
+                    sqlite3.sqlite_version_info
+                )
+                status["wal_sidecars_private"] = self._sidecars_private()
+                wal_checks = (
+                    status["wal_reset_fixed_build"] is True,
+                    status["wal_sidecars_private"] is True,
+                )
             status["conformant"] = all(
                 (
-                    status["profile_id"] == PROFILE_ID,
+                    status["profile_id"] == self.profile_id,
                     status["profile_version"] == PROFILE_VERSION,
                     status["schema_version"] == SCHEMA_VERSION,
                     status["tenant_id"] == self.tenant_id,
-                    status["journal_mode"] == "delete",
-                    status["synchronous"] == 3,
+                    status["journal_mode"] == settings["journal_mode"],
+                    status["synchronous"] == settings["synchronous"][1],
                     status["foreign_keys"] is True,
                     status["trusted_schema"] is False,
                     status["secure_delete"] is True,
@@ -1182,191 +2064,541 @@ class SQLiteDKAStore:
                     status["service_owned"] is True,
                     status["hard_links"] == 1,
                     status["file_identity_bound"] is True,
+                    *wal_checks,
                 )
             )
             return status
         finally:
-            connection.close()
+            self._release(connection, query_only=True)
 
-    def _verify_internal(self) -> dict[str, Any]:
-        connection = self._connect(query_only=True)
+    def _sidecars_private(self) -> bool:
+        for suffix in ("-wal", "-shm"):
+            sidecar = self.path.with_name(self.path.name + suffix)
+            try:
+                sidecar_stat = sidecar.lstat()
+            except FileNotFoundError:
+                continue
+            if (
+                not stat.S_ISREG(sidecar_stat.st_mode)
+                or sidecar_stat.st_nlink != 1
+                or sidecar_stat.st_uid != os.geteuid()
+                or sidecar_stat.st_mode & 0o777 != 0o600
+            ):
+                return False
+        return True
+
+    def checkpoint(
+        self, mode: str = "PASSIVE", *, context: StoreContext | None = None
+    ) -> dict[str, Any]:
+        """Run an explicit WAL checkpoint on the WAL profile variant."""
+
+        self._require(context, WRITE)
+        if self.profile_id != WAL_PROFILE_ID:
+            raise ProfileViolation(f"checkpoints are defined only for {WAL_PROFILE_ID}")
+        if mode not in WAL_CHECKPOINT_MODES:
+            raise ValueError(f"checkpoint mode must be one of {list(WAL_CHECKPOINT_MODES)!r}")
+        connection = self._acquire()
         try:
-            integrity_rows = [
-                str(row[0]) for row in connection.execute("PRAGMA integrity_check")
-            ]
-            if integrity_rows != ["ok"]:
-                raise CorruptionDetected("SQLite integrity_check: " + "; ".join(integrity_rows))
-            foreign_key_rows = list(connection.execute("PRAGMA foreign_key_check"))
-            if foreign_key_rows:
-                raise CorruptionDetected("SQLite foreign_key_check reported violations")
-            snapshot_rows = connection.execute(
-                """
-                SELECT dka_id, branch, revision, digest, digest_profile,
-                       classification, updated_at, payload_json
-                FROM snapshots WHERE tenant_id=?
-                ORDER BY dka_id, branch, revision
-                """,
-                (self.tenant_id,),
-            ).fetchall()
-            grouped: dict[tuple[str, str], list[dict[str, Any]]] = {}
-            for row in snapshot_rows:
-                record = self._decode_record(row)
-                try:
-                    self._assert_parents_exist(connection, record)
-                except DKAStoreError as exc:
-                    raise CorruptionDetected(str(exc)) from exc
-                grouped.setdefault((record["dka_id"], record["branch"]), []).append(
-                    record
+            busy, wal_frames, checkpointed = connection.execute(
+                f"PRAGMA wal_checkpoint({mode})"
+            ).fetchone()
+        except sqlite3.Error as exc:
+            raise self._translate_error(exc) from exc
+        finally:
+            self._release(connection)
+        return {
+            "mode": mode,
+            "completed": not busy,
+            "wal_frames": int(wal_frames),
+            "checkpointed_frames": int(checkpointed),
+        }
+
+    def _verify_internal(
+        self,
+        *,
+        incremental: bool = False,
+        dka_range: tuple[str | None, str | None] | None = None,
+        workers: int = 1,
+    ) -> dict[str, Any]:
+        """Stream-verify the database without holding decoded history in memory.
+
+        Snapshots are walked per DKA in key order, so memory is bounded by one
+        DKA's history plus the audit event-ID set. ``incremental`` verifies the
+        audit chain after the stored checkpoint and only the DKAs it touched.
+        ``dka_range`` verifies one half-open ``[low, high)`` DKA-ID partition
+        without the global audit chain. ``workers`` gives a full verification
+        one process pool that hashes audit events through ``verify_many`` and
+        then splits the DKA pass.
+        """
+
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("workers must be a positive integer")
+        if dka_range is not None and (incremental or workers > 1):
+            raise ValueError("dka_range cannot be combined with incremental or workers")
+        if incremental and workers > 1:
+            raise ValueError("workers applies only to full verification")
+        started = time.perf_counter()
+        executor: ProcessPoolExecutor | None = None
+        stack = contextlib.ExitStack()
+        connection = self._acquire(query_only=True)
+        try:
+            checkpoint = self._check_audit_checkpoint(connection)
+            since = checkpoint[0] if incremental and checkpoint else None
+            if dka_range is not None:
+                mode = "range"
+            elif since is not None:
+                mode = "incremental"
+            else:
+                mode = "full"
+            report: dict[str, Any] = {"passed": True, "mode": mode}
+            if mode == "full":
+                integrity_rows = [
+                    str(row[0]) for row in connection.execute("PRAGMA integrity_check")
+                ]
+                if integrity_rows != ["ok"]:
+                    raise CorruptionDetected(
+                        "SQLite integrity_check: " + "; ".join(integrity_rows)
+                    )
+                if list(connection.execute("PRAGMA foreign_key_check")):
+                    raise CorruptionDetected("SQLite foreign_key_check reported violations")
+                report["sqlite_integrity"] = report["foreign_keys"] = "ok"
+            else:
+                report["sqlite_integrity"] = report["foreign_keys"] = "not-run"
+            chain_events = 0
+            tail: tuple[int, str] | None = None
+            if workers > 1:
+                executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            if mode != "range":
+                start, previous = (
+                    (since + 1, checkpoint[1]) if since is not None and checkpoint else (1, None)
                 )
-            for key, records in grouped.items():
-                records.sort(key=lambda item: int(item["revision"]))
-                for previous, candidate in zip(records, records[1:]):
-                    previous_head = {
-                        "revision": previous["revision"],
-                        "digest": previous["integrity"]["digest"],
-                        "digest_profile": dka_digest_spec(previous)[1],
-                    }
-                    try:
-                        assert_lineage(candidate, previous_head)
-                    except DKAStoreError as exc:
-                        raise CorruptionDetected(
-                            f"branch lineage failure for {key!r}: {exc}"
-                        ) from exc
-            head_rows = connection.execute(
-                """
-                SELECT h.dka_id, h.branch, h.revision, h.digest, h.digest_profile,
-                       h.updated_at, s.digest AS snapshot_digest,
-                       s.digest_profile AS snapshot_profile,
-                       s.updated_at AS snapshot_updated_at
-                FROM heads h
-                JOIN snapshots s ON s.tenant_id=h.tenant_id AND s.dka_id=h.dka_id
-                    AND s.branch=h.branch AND s.revision=h.revision
-                WHERE h.tenant_id=?
-                """,
-                (self.tenant_id,),
-            ).fetchall()
-            for row in head_rows:
-                if (
-                    row["digest"] != row["snapshot_digest"]
-                    or row["digest_profile"] != row["snapshot_profile"]
-                    or row["updated_at"] != row["snapshot_updated_at"]
+                for event in self._iter_audit_rows(
+                    self._iter_audit_batches(connection, start),
+                    start_sequence=start,
+                    previous=previous,
+                    executor=executor,
                 ):
-                    raise CorruptionDetected("head tuple does not match indexed snapshot")
-            indexed_heads = {
-                (row["dka_id"], row["branch"]): int(row["revision"])
-                for row in head_rows
-            }
-            latest_revisions = {
-                key: int(records[-1]["revision"]) for key, records in grouped.items()
-            }
-            if indexed_heads != latest_revisions:
-                raise CorruptionDetected(
-                    "branch heads do not exactly identify every latest snapshot: "
-                    f"expected {latest_revisions!r}, found {indexed_heads!r}"
+                    chain_events += 1
+                    tail = (int(event["sequence"]), str(event["integrity"]["digest"]))
+                if tail is None:
+                    tail = checkpoint
+                report["audit_chain"] = "ok"
+            else:
+                report["audit_chain"] = "not-run"
+            verified_through = tail[0] if tail else 0
+            if mode != "incremental":
+                self._assert_dkas_have_events(connection, dka_range)
+            if workers > 1:
+                totals = self._verify_dkas_in_processes(
+                    self._verification_ranges(connection, workers),
+                    verified_through,
+                    executor,
                 )
-            event_rows = connection.execute(
-                """
-                SELECT sequence, tenant_id, dka_id, event_type, event_digest,
-                       previous_event_digest, recorded_at, event_json
-                FROM audit_events WHERE tenant_id=? ORDER BY sequence
-                """,
-                (self.tenant_id,),
-            ).fetchall()
-            events = self._validate_audit_rows(event_rows)
-            tombstone_rows = connection.execute(
-                """
-                SELECT dka_id, deleted_at, deleted_by, reason
-                FROM tombstones WHERE tenant_id=? ORDER BY dka_id
-                """,
-                (self.tenant_id,),
+            else:
+                totals = self._verify_dkas(
+                    connection,
+                    self._iter_dka_ids(connection, dka_range=dka_range, since=since),
+                    verified_through,
+                )
+            elapsed = time.perf_counter() - started
+            rows = totals["snapshots"] + totals["events"] + chain_events
+            report.update(
+                {
+                    "snapshots": totals["snapshots"],
+                    "heads": totals["heads"],
+                    "events": chain_events if mode != "range" else totals["events"],
+                    "dkas": totals["dkas"],
+                    "tombstones": totals["tombstones"],
+                    "snapshot_event_correlation": "ok",
+                    "audit_tail": (
+                        {"sequence": tail[0], "digest": tail[1]} if tail else None
+                    ),
+                    "dka_range": list(dka_range) if dka_range is not None else None,
+                    "workers": workers,
+                    "rows": rows,
+                    "elapsed_seconds": round(elapsed, 6),
+                    "rows_per_second": round(rows / elapsed, 1) if elapsed else None,
+                }
+            )
+            return report
+        except sqlite3.Error as exc:
+            raise self._translate_error(exc) from exc
+        finally:
+            stack.close()
+            self._release(connection, query_only=True)
+
+    def _iter_audit_batches(
+        self, connection: sqlite3.Connection, start: int
+    ) -> Iterator[sqlite3.Row]:
+        """Yield audit rows from ``start`` in short keyset-paged statements."""
+
+        while True:
+            rows = connection.execute(
+                f"SELECT {_AUDIT_COLUMNS} FROM audit_events "
+                "WHERE tenant_id=? AND sequence>=? ORDER BY sequence LIMIT ?",
+                (self.tenant_id, start, _VERIFY_BATCH_ROWS),
             ).fetchall()
-            tombstones = {str(row["dka_id"]): row for row in tombstone_rows}
-            orphaned = connection.execute(
-                """
-                SELECT COUNT(*) FROM tombstones t
-                WHERE t.tenant_id=? AND EXISTS (
-                    SELECT 1 FROM snapshots s
-                    WHERE s.tenant_id=t.tenant_id AND s.dka_id=t.dka_id
+            yield from rows
+            if len(rows) < _VERIFY_BATCH_ROWS:
+                return
+            start = int(rows[-1]["sequence"]) + 1
+
+    def _iter_dka_ids(
+        self,
+        connection: sqlite3.Connection,
+        *,
+        dka_range: tuple[str | None, str | None] | None = None,
+        since: int | None = None,
+    ) -> Iterator[str]:
+        low, high = dka_range or (None, None)
+        after: str | None = None
+        while True:
+            clauses = ["tenant_id=?", "dka_id IS NOT NULL"]
+            parameters: list[Any] = [self.tenant_id]
+            if after is not None:
+                clauses.append("dka_id>?")
+                parameters.append(after)
+            elif low is not None:
+                clauses.append("dka_id>=?")
+                parameters.append(low)
+            if high is not None:
+                clauses.append("dka_id<?")
+                parameters.append(high)
+            if since is not None:
+                clauses.append("sequence>?")
+                parameters.append(since)
+            batch = [
+                str(row[0])
+                for row in connection.execute(
+                    "SELECT DISTINCT dka_id FROM audit_events WHERE "
+                    + " AND ".join(clauses)
+                    + " ORDER BY dka_id LIMIT ?",
+                    (*parameters, _VERIFY_BATCH_ROWS),
                 )
+            ]
+            yield from batch
+            if len(batch) < _VERIFY_BATCH_ROWS:
+                return
+            after = batch[-1]
+
+    def _assert_dkas_have_events(
+        self,
+        connection: sqlite3.Connection,
+        dka_range: tuple[str | None, str | None] | None,
+    ) -> None:
+        """Set-based check that every stored DKA is reachable from the audit log."""
+
+        low, high = dka_range or (None, None)
+        bounds = ""
+        parameters: list[Any] = [self.tenant_id]
+        if low is not None:
+            bounds += " AND t.dka_id>=?"
+            parameters.append(low)
+        if high is not None:
+            bounds += " AND t.dka_id<?"
+            parameters.append(high)
+        for table, message in (
+            ("snapshots", "active snapshot/audit result tuples differ: snapshots without audit events"),
+            ("heads", "branch heads do not exactly identify every latest snapshot: heads without audit events"),
+            ("tombstones", "purge events and tombstones do not identify the same DKAs"),
+        ):
+            orphan = connection.execute(
+                f"""
+                SELECT t.dka_id FROM {table} t
+                WHERE t.tenant_id=?{bounds} AND NOT EXISTS (
+                    SELECT 1 FROM audit_events e
+                    WHERE e.tenant_id=t.tenant_id AND e.dka_id=t.dka_id
+                )
+                LIMIT 1
                 """,
-                (self.tenant_id,),
-            ).fetchone()[0]
-            if orphaned:
-                raise CorruptionDetected("tombstoned DKAs still have canonical snapshots")
-            snapshot_tuples = {
+                parameters,
+            ).fetchone()
+            if orphan is not None:
+                raise CorruptionDetected(f"{message} ({orphan[0]!r})")
+
+    def _verify_dkas(
+        self,
+        connection: sqlite3.Connection,
+        dka_ids: Iterable[str],
+        verified_through: int,
+    ) -> dict[str, int]:
+        totals = {"dkas": 0, "snapshots": 0, "heads": 0, "events": 0, "tombstones": 0}
+        for dka_id in dka_ids:
+            connection.execute("BEGIN")
+            counts = self._verify_dka(connection, dka_id, verified_through)
+            connection.execute("COMMIT")
+            totals["dkas"] += 1
+            for key, value in counts.items():
+                totals[key] += value
+        return totals
+
+    def _verify_dka(
+        self,
+        connection: sqlite3.Connection,
+        dka_id: str,
+        verified_through: int,
+    ) -> dict[str, int]:
+        """Verify one DKA's snapshots, lineage, parents, heads, and events.
+
+        Events at or below ``verified_through`` were already validated by the
+        chain pass and are only decoded; newer ones are validated individually.
+        """
+
+        snapshot_tuples: set[tuple[str, str, int, str, str]] = set()
+        stored_digests: set[tuple[str, str]] = set()
+        references: list[tuple[str, str, str]] = []
+        latest: dict[str, sqlite3.Row] = {}
+        previous: dict[str, Any] | None = None
+        snapshot_count = 0
+        for row in connection.execute(
+            """
+            SELECT dka_id, branch, revision, digest, digest_profile,
+                   classification, updated_at, payload_json
+            FROM snapshots WHERE tenant_id=? AND dka_id=?
+            ORDER BY branch, revision
+            """,
+            (self.tenant_id, dka_id),
+        ):
+            record = self._decode_record(row, use_cache=False)
+            snapshot_count += 1
+            branch = record["branch"]
+            if previous is not None and previous["branch"] == branch:
+                previous_head = {
+                    "revision": previous["revision"],
+                    "digest": previous["integrity"]["digest"],
+                    "digest_profile": dka_digest_spec(previous)[1],
+                }
+                try:
+                    assert_lineage(record, previous_head)
+                except DKAStoreError as exc:
+                    raise CorruptionDetected(
+                        f"branch lineage failure for {(dka_id, branch)!r}: {exc}"
+                    ) from exc
+            digest_profile = dka_digest_spec(record)[1]
+            stored_digests.add((record["integrity"]["digest"], digest_profile))
+            references.extend(self._parent_references(record))
+            snapshot_tuples.add(
                 (
-                    record["dka_id"],
-                    record["branch"],
+                    dka_id,
+                    branch,
                     int(record["revision"]),
                     record["integrity"]["digest"],
-                    dka_digest_spec(record)[1],
+                    digest_profile,
                 )
-                for records in grouped.values()
-                for record in records
-            }
-            active_event_tuples: set[tuple[str, str, int, str, str]] = set()
-            purge_events: dict[str, dict[str, Any]] = {}
-            for event in events:
-                event_type = event["event_type"]
-                dka_ref = event.get("dka_ref") or {}
-                dka_id = dka_ref.get("dka_id")
-                if event_type in _PUT_EVENT_TYPES and dka_id not in tombstones:
-                    result = event["result_head"]
-                    active_event_tuples.add(
-                        (
-                            result["dka_id"],
-                            result["branch"],
-                            int(result["revision"]),
-                            result["digest"],
-                            result["digest_profile"],
-                        )
-                    )
-                elif event_type == "purge":
-                    if dka_id in purge_events:
-                        raise CorruptionDetected("multiple purge events for one tombstone")
-                    purge_events[str(dka_id)] = event
-            if active_event_tuples != snapshot_tuples:
+            )
+            latest[branch] = row
+            previous = record
+        for kind, digest, profile in references:
+            if (digest, profile) not in stored_digests:
                 raise CorruptionDetected(
-                    "active snapshot/audit result tuples differ: "
-                    f"snapshots_only={sorted(snapshot_tuples - active_event_tuples)!r}, "
-                    f"events_only={sorted(active_event_tuples - snapshot_tuples)!r}"
+                    f"{kind} tuple ({digest!r}, {profile!r}) does not resolve in this tenant/DKA"
                 )
-            if set(purge_events) != set(tombstones):
-                raise CorruptionDetected(
-                    "purge events and tombstones do not identify the same DKAs"
+
+        head_rows = connection.execute(
+            """
+            SELECT branch, revision, digest, digest_profile, updated_at
+            FROM heads WHERE tenant_id=? AND dka_id=?
+            """,
+            (self.tenant_id, dka_id),
+        ).fetchall()
+        for row in head_rows:
+            snapshot = latest.get(row["branch"])
+            if (
+                snapshot is not None
+                and int(snapshot["revision"]) == int(row["revision"])
+                and (
+                    row["digest"] != snapshot["digest"]
+                    or row["digest_profile"] != snapshot["digest_profile"]
+                    or row["updated_at"] != snapshot["updated_at"]
                 )
-            for dka_id, row in tombstones.items():
-                event = purge_events[dka_id]
-                if (
-                    event["detail"].get("deleted_at") != row["deleted_at"]
-                    or event["detail"].get("reason") != row["reason"]
-                    or event["actor"]["principal_id"] != row["deleted_by"]
-                ):
-                    raise CorruptionDetected(
-                        f"purge event/tombstone metadata mismatch for {dka_id}"
+            ):
+                raise CorruptionDetected("head tuple does not match indexed snapshot")
+        indexed_heads = {row["branch"]: int(row["revision"]) for row in head_rows}
+        latest_revisions = {
+            branch: int(row["revision"]) for branch, row in latest.items()
+        }
+        if indexed_heads != latest_revisions:
+            raise CorruptionDetected(
+                f"branch heads do not exactly identify every latest snapshot of {dka_id!r}: "
+                f"expected {latest_revisions!r}, found {indexed_heads!r}"
+            )
+
+        tombstone = connection.execute(
+            """
+            SELECT deleted_at, deleted_by, reason
+            FROM tombstones WHERE tenant_id=? AND dka_id=?
+            """,
+            (self.tenant_id, dka_id),
+        ).fetchone()
+        if tombstone is not None and snapshot_count:
+            raise CorruptionDetected("tombstoned DKAs still have canonical snapshots")
+        active_event_tuples: set[tuple[str, str, int, str, str]] = set()
+        purge_events: list[dict[str, Any]] = []
+        event_count = 0
+        for row in connection.execute(
+            f"SELECT {_AUDIT_COLUMNS} FROM audit_events "
+            "WHERE tenant_id=? AND dka_id=? ORDER BY sequence",
+            (self.tenant_id, dka_id),
+        ):
+            sequence = int(row["sequence"])
+            if sequence > verified_through:
+                [event] = self._validate_audit_rows(
+                    [row],
+                    start_sequence=sequence,
+                    previous=row["previous_event_digest"] if sequence > 1 else None,
+                )
+            else:
+                try:
+                    event = loads_json(str(row["event_json"]))
+                except ValueError as exc:
+                    raise CorruptionDetected(str(exc)) from exc
+            event_count += 1
+            if event["event_type"] in _PUT_EVENT_TYPES and tombstone is None:
+                result = event["result_head"]
+                active_event_tuples.add(
+                    (
+                        result["dka_id"],
+                        result["branch"],
+                        int(result["revision"]),
+                        result["digest"],
+                        result["digest_profile"],
                     )
-            return {
-                "passed": True,
-                "snapshots": len(snapshot_rows),
-                "heads": len(head_rows),
-                "events": len(event_rows),
-                "sqlite_integrity": "ok",
-                "foreign_keys": "ok",
-                "audit_chain": "ok",
-                "snapshot_event_correlation": "ok",
-                "tombstones": len(tombstones),
-            }
+                )
+            elif event["event_type"] == "purge":
+                purge_events.append(event)
+        if active_event_tuples != snapshot_tuples:
+            raise CorruptionDetected(
+                "active snapshot/audit result tuples differ: "
+                f"snapshots_only={sorted(snapshot_tuples - active_event_tuples)!r}, "
+                f"events_only={sorted(active_event_tuples - snapshot_tuples)!r}"
+            )
+        if len(purge_events) > 1:
+            raise CorruptionDetected("multiple purge events for one tombstone")
+        if bool(purge_events) != (tombstone is not None):
+            raise CorruptionDetected(
+                "purge events and tombstones do not identify the same DKAs"
+            )
+        if tombstone is not None:
+            event = purge_events[0]
+            if (
+                event["detail"].get("deleted_at") != tombstone["deleted_at"]
+                or event["detail"].get("reason") != tombstone["reason"]
+                or event["actor"]["principal_id"] != tombstone["deleted_by"]
+            ):
+                raise CorruptionDetected(
+                    f"purge event/tombstone metadata mismatch for {dka_id}"
+                )
+        return {
+            "snapshots": snapshot_count,
+            "heads": len(head_rows),
+            "events": event_count,
+            "tombstones": int(tombstone is not None),
+        }
+
+    def verification_ranges(
+        self, count: int, *, context: StoreContext | None = None
+    ) -> list[tuple[str | None, str | None]]:
+        """Split stored DKA IDs into ``count`` disjoint ``[low, high)`` ranges.
+
+        Each range may be passed to ``verify(dka_range=...)`` by a separate
+        process; together with one chain verification they cover the store.
+        """
+
+        self._require(context, VERIFY)
+        connection = self._acquire(query_only=True)
+        try:
+            return self._verification_ranges(connection, count)
         except sqlite3.Error as exc:
             raise self._translate_error(exc) from exc
         finally:
-            connection.close()
+            self._release(connection, query_only=True)
 
-    def verify(self, *, context: StoreContext | None = None) -> dict[str, Any]:
-        self._require(context, VERIFY)
-        report = self._verify_internal()
+    def _verification_ranges(
+        self, connection: sqlite3.Connection, count: int
+    ) -> list[tuple[str | None, str | None]]:
+        if not isinstance(count, int) or count < 1:
+            raise ValueError("count must be a positive integer")
+        total = int(
+            connection.execute(
+                """
+                SELECT COUNT(DISTINCT dka_id) FROM audit_events
+                WHERE tenant_id=? AND dka_id IS NOT NULL
+                """,
+                (self.tenant_id,),
+            ).fetchone()[0]
+        )
+        bounds: list[str] = []
+        for index in range(1, count):
+            row = connection.execute(
+                """
+                SELECT DISTINCT dka_id FROM audit_events
+                WHERE tenant_id=? AND dka_id IS NOT NULL
+                ORDER BY dka_id LIMIT 1 OFFSET ?
+                """,
+                (self.tenant_id, total * index // count),
+            ).fetchone()
+            if row is not None and (not bounds or str(row[0]) > bounds[-1]):
+                bounds.append(str(row[0]))
+        edges: list[str | None] = [None, *bounds, None]
+        return list(zip(edges, edges[1:]))
+
+    def _verify_dkas_in_processes(
+        self,
+        ranges: list[tuple[str | None, str | None]],
+        verified_through: int,
+        executor: Executor,
+    ) -> dict[str, int]:
+        settings = {
+            "path": str(self.path),
+            "tenant_id": self.tenant_id,
+            "busy_timeout_ms": self.busy_timeout_ms,
+            "profile_id": self.profile_id,
+            "wal_autocheckpoint": self.wal_autocheckpoint,
+        }
+        totals = {"dkas": 0, "snapshots": 0, "heads": 0, "events": 0, "tombstones": 0}
+        for counts in executor.map(
+            _verify_partition,
+            [settings] * len(ranges),
+            ranges,
+            [verified_through] * len(ranges),
+        ):
+            for key, value in counts.items():
+                totals[key] += value
+        return totals
+
+    def verify(
+        self,
+        *,
+        context: StoreContext | None = None,
+        incremental: bool = False,
+        dka_range: tuple[str | None, str | None] | None = None,
+        workers: int = 1,
+        checkpoint: bool = False,
+    ) -> dict[str, Any]:
+        """Verify the store without changing it.
+
+        See ``_verify_internal`` for the ``incremental``, ``dka_range`` and
+        ``workers`` modes. ``audit_tail`` reports the last verified event.
+        With ``checkpoint`` (which also requires ``dka:checkpoint``) a
+        verified audit chain is persisted as the new checkpoint; a range
+        verification never moves it.
+        """
+
+        request = self._require(context, VERIFY)
+        if checkpoint:
+            self._require(request, CHECKPOINT)
+        report = self._verify_internal(
+            incremental=incremental, dka_range=dka_range, workers=workers
+        )
         report["profile"] = self.profile_status(context=context)
         if not report["profile"]["conformant"]:
             raise ProfileViolation("database settings do not conform to the selected profile")
+        tail = report["audit_tail"]
+        report["audit_checkpoint"] = (
+            self._store_audit_checkpoint(tail["sequence"], tail["digest"])
+            if checkpoint and tail and report["audit_chain"] == "ok"
+            else None
+        )
         return report
 
     def backup(
@@ -1374,12 +2606,15 @@ class SQLiteDKAStore:
         destination: str | Path,
         *,
         context: StoreContext | None = None,
+        profile_id: str | None = None,
     ) -> dict[str, Any]:
         request = self._require(context, BACKUP)
+        target_profile = profile_id or self.profile_id
+        _require_profile_support(target_profile)
         target = Path(destination)
         temporary = self._temporary_destination(target)
         try:
-            source = self._connect(query_only=True)
+            source = self._acquire(query_only=True)
             destination_connection: sqlite3.Connection | None = None
             try:
                 destination_connection = sqlite3.connect(
@@ -1392,7 +2627,9 @@ class SQLiteDKAStore:
             finally:
                 if destination_connection is not None:
                     destination_connection.close()
-                source.close()
+                self._release(source, query_only=True)
+            if target_profile != self.profile_id:
+                self._convert_copy_profile(temporary, target_profile)
             descriptor = os.open(temporary, os.O_RDONLY)
             try:
                 os.fsync(descriptor)
@@ -1403,8 +2640,12 @@ class SQLiteDKAStore:
                 tenant_id=self.tenant_id,
                 local_filesystem=True,
                 busy_timeout_ms=self.busy_timeout_ms,
+                profile_id=target_profile,
             )
-            verification = backup_store._verify_internal()
+            try:
+                verification = backup_store._verify_internal()
+            finally:
+                backup_store.close()
             digest = file_sha256(temporary)
             self._publish_new_file(temporary, target)
         except Exception:
@@ -1420,7 +2661,20 @@ class SQLiteDKAStore:
                     branch=None,
                     result_head=None,
                     previous_head=None,
-                    detail={"backup_digest": digest, "verification": "passed"},
+                    detail={
+                        "backup_digest": digest,
+                        "verification": "passed",
+                        **(
+                            {
+                                "profile_conversion": {
+                                    "from": self.profile_id,
+                                    "to": target_profile,
+                                }
+                            }
+                            if target_profile != self.profile_id
+                            else {}
+                        ),
+                    },
                 )
         except DKAStoreError as exc:
             raise RecoveryError(
@@ -1428,7 +2682,7 @@ class SQLiteDKAStore:
                 "audit event failed: {exc}"
             ) from exc
         return {
-            "profile_id": PROFILE_ID,
+            "profile_id": target_profile,
             "tenant_id": self.tenant_id,
             "backup_digest": digest,
             "verification": verification,
@@ -1445,6 +2699,8 @@ class SQLiteDKAStore:
         local_filesystem: bool,
         context: StoreContext,
         busy_timeout_ms: int = 5_000,
+        profile_id: str = PROFILE_ID,
+        source_profile_id: str | None = None,
     ) -> "SQLiteDKAStore":
         if context.tenant_id != tenant_id or not context.allows(RESTORE):
             raise AccessDenied("restore requires matching tenant and dka:restore")
@@ -1452,17 +2708,24 @@ class SQLiteDKAStore:
         target = Path(destination)
         if not source_path.is_file():
             raise RecoveryError("backup source does not exist")
+        _require_profile_support(profile_id)
+        source_profile = source_profile_id or profile_id
         source_store = cls(
             source_path,
             tenant_id=tenant_id,
             local_filesystem=local_filesystem,
             busy_timeout_ms=busy_timeout_ms,
+            profile_id=source_profile,
         )
-        source_store._verify_internal()
-        source_digest = file_sha256(source_path)
-        temporary = cls._temporary_destination(target)
         try:
-            source = source_store._connect(query_only=True)
+            source_store._verify_internal()
+            source_digest = file_sha256(source_path)
+            temporary = cls._temporary_destination(target)
+        except Exception:
+            source_store.close()
+            raise
+        try:
+            source = source_store._acquire(query_only=True)
             restored: sqlite3.Connection | None = None
             try:
                 restored = sqlite3.connect(temporary, isolation_level=None)
@@ -1472,28 +2735,40 @@ class SQLiteDKAStore:
             finally:
                 if restored is not None:
                     restored.close()
-                source.close()
+                source_store._release(source, query_only=True)
+                source_store.close()
             if file_sha256(source_path) != source_digest:
                 raise RecoveryError("backup source changed during restore")
+            detail: dict[str, Any] = {"source_backup_digest": source_digest}
+            if source_profile != profile_id:
+                cls._convert_copy_profile(temporary, profile_id)
+                detail["profile_conversion"] = {
+                    "from": source_profile,
+                    "to": profile_id,
+                }
             temporary_store = cls(
                 temporary,
                 tenant_id=tenant_id,
                 local_filesystem=local_filesystem,
                 busy_timeout_ms=busy_timeout_ms,
+                profile_id=profile_id,
             )
-            temporary_store._verify_internal()
-            with temporary_store._write_transaction() as connection:
-                temporary_store._append_event(
-                    connection,
-                    context=context,
-                    event_type="restore",
-                    dka_id=None,
-                    branch=None,
-                    result_head=None,
-                    previous_head=None,
-                    detail={"source_backup_digest": source_digest},
-                )
-            temporary_store._verify_internal()
+            try:
+                temporary_store._verify_internal()
+                with temporary_store._write_transaction() as connection:
+                    temporary_store._append_event(
+                        connection,
+                        context=context,
+                        event_type="restore",
+                        dka_id=None,
+                        branch=None,
+                        result_head=None,
+                        previous_head=None,
+                        detail=detail,
+                    )
+                temporary_store._verify_internal()
+            finally:
+                temporary_store.close()
             cls._publish_new_file(temporary, target)
         except Exception:
             temporary.unlink(missing_ok=True)
@@ -1503,6 +2778,7 @@ class SQLiteDKAStore:
             tenant_id=tenant_id,
             local_filesystem=local_filesystem,
             busy_timeout_ms=busy_timeout_ms,
+            profile_id=profile_id,
         )
 
     def purge(
@@ -1580,13 +2856,15 @@ class SQLiteDKAStore:
         self, *, context: StoreContext | None = None
     ) -> dict[str, Any]:
         self._require(context, RETENTION)
-        connection = self._connect()
+        connection = self._acquire()
         try:
             connection.execute("VACUUM")
+            if self.profile_id == WAL_PROFILE_ID:
+                connection.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
         except sqlite3.Error as exc:
             raise self._translate_error(exc) from exc
         finally:
-            connection.close()
+            self._release(connection)
         return {
             "completed": True,
             "sqlite_secure_delete": True,
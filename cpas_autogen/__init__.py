@@ -8,6 +8,8 @@ from .metrics_monitor import periodic_metrics_check
 from .drift_monitor import latest_metrics
 from .mixins import EpistemicAgentMixin
 from .eep_utils import (
+    EEPClient,
+    MessageBatcher,
     broadcast_state,
     request_validation,
     start_collab_session,
@@ -39,6 +41,8 @@ __all__ = [
     'periodic_metrics_check',
     'latest_metrics',
     'EpistemicAgentMixin',
+    'EEPClient',
+    'MessageBatcher',
     'broadcast_state',
     'request_validation',
     'start_collab_session',
@@ -2,18 +2,338 @@ from __future__ import annotations
 
 """Helper utilities for the Epistemic Exchange Protocol (EEP)."""
 
+from concurrent.futures import Future
 from typing import Any, Sequence
+import atexit
 import logging
+import queue
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError
+
+
+API_URL = "http://localhost:5000/api/v1/messages"
+BATCH_URL = API_URL + ":batch"
+
+
+class MessageBatcher:
+    """Coalesce T-BEEP messages submitted within ``window`` seconds.
+
+    The first message of a batch starts a timer; when it fires, or when
+    ``max_batch`` messages are waiting, everything pending is sent in one
+    ``POST /api/v1/messages:batch``. :meth:`submit` returns a future that
+    resolves to the item's result from the API (``{"index", "status"}``), or
+    to ``{"status": "error", "error": ...}`` if the request itself failed.
+    Use the batcher as a context manager, or call :meth:`close`, so the last
+    batch is not left waiting.
+    """
+
+    def __init__(self, batch_url: str = BATCH_URL, *, window: float = 0.05,
+                 max_batch: int = 100, timeout: float = 5,
+                 session: Any = None) -> None:
+        if window < 0:
+            raise ValueError("window must not be negative")
+        if max_batch < 1:
+            raise ValueError("max_batch must be a positive integer")
+        self.batch_url = batch_url
+        self.window = window
+        self.max_batch = max_batch
+        self.timeout = timeout
+        self.session = session or requests
+        self._lock = threading.Lock()
+        self._pending: list[tuple[dict, Future]] = []
+        self._timer: threading.Timer | None = None
+
+    def submit(self, message: dict) -> Future:
+        future: Future = Future()
+        with self._lock:
+            self._pending.append((message, future))
+            full = len(self._pending) >= self.max_batch
+            if not full and self._timer is None:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush()
+        return future
+
+    def flush(self) -> int:
+        """Send every pending message now; return how many were sent."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not batch:
+            return 0
+        try:
+            res = self.session.post(
+                self.batch_url,
+                json=[message for message, _ in batch],
+                timeout=self.timeout,
+            )
+            results = res.json()["results"]
+            if len(results) != len(batch):
+                raise ValueError("batch response does not match the request")
+        except Exception as exc:  # pragma: no cover - network issues
+            logging.warning("Failed to send message batch: %s", exc)
+            results = [{"status": "error", "error": str(exc)} for _ in batch]
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+        return len(batch)
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "MessageBatcher":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+# Answers sent before the API touched the store. Message POSTs are not
+# idempotent, so a timeout or other 5xx, after which the messages may
+# already be stored, is never retried.
+_RETRY_STATUSES = frozenset({429, 503})
+_STOP = object()
+
+
+def _not_sent(exc: requests.RequestException) -> bool:
+    """Whether ``exc`` means no connection was made, so nothing was sent."""
+    if isinstance(exc, requests.ConnectTimeout):
+        return True
+    cause = exc.args[0] if exc.args else None
+    return isinstance(getattr(cause, "reason", None), ConnectTimeoutError)
+
+
+class EEPClient:
+    """Send T-BEEP messages over pooled connections from a background thread.
+
+    :meth:`submit` only puts the message on a bounded queue and returns, so
+    callers never wait on the network; when the queue is full the message is
+    dropped and counted. A worker thread drains the queue, sending one message
+    with ``POST api_url`` and several with the ``:batch`` endpoint, through a
+    single ``requests.Session``. Failures to connect and 429/503 answers are
+    retried ``retries`` times with exponential backoff starting at
+    ``backoff`` seconds. Read timeouts, dropped connections and other error
+    answers are not, since the API may already have stored the messages and
+    a retry would store them twice. Pending messages are flushed when the
+    interpreter exits, for at most ``exit_timeout`` seconds.
+    """
+
+    def __init__(self, api_url: str = API_URL, *, session: Any = None,
+                 queue_size: int = 1000, max_batch: int = 100,
+                 timeout: float = 5, retries: int = 3, backoff: float = 0.25,
+                 max_backoff: float = 4.0, exit_timeout: float = 5.0) -> None:
+        if queue_size < 1:
+            raise ValueError("queue_size must be a positive integer")
+        if max_batch < 1:
+            raise ValueError("max_batch must be a positive integer")
+        if retries < 0:
+            raise ValueError("retries must not be negative")
+        self.api_url = api_url
+        self.batch_url = api_url + ":batch"
+        self.max_batch = max_batch
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.exit_timeout = exit_timeout
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._closed = False
+        self._stats = {"sent": 0, "failed": 0, "dropped": 0, "retried": 0}
+        atexit.register(self._close_at_exit)
+
+    def submit(self, message: dict) -> bool:
+        """Queue ``message``; return ``False`` if it was dropped."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("EEPClient is closed")
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="eep-client", daemon=True
+                )
+                self._worker.start()
+            # Enqueue under the lock so nothing can follow close()'s _STOP.
+            try:
+                self._queue.put_nowait(message)
+                return True
+            except queue.Full:
+                pass
+        self._count("dropped")
+        logging.warning("EEP client queue full; dropping message")
+        return False
+
+    def send(self, message: dict) -> bool:
+        """Send ``message`` now on the calling thread, with retries."""
+        return self._deliver([message]) == 1
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued message has been handled.
+
+        Returns ``False`` if ``timeout`` seconds pass first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Flush, stop the worker and release the connection pool."""
+        with self._lock:
+            if self._closed:
+                return True
+            self._closed = True
+        flushed = self.flush(timeout)
+        atexit.unregister(self._close_at_exit)
+        if self._worker is not None:
+            try:
+                self._queue.put_nowait(_STOP)
+            except queue.Full:  # unflushed messages remain; the daemon dies with us
+                pass
+        self.session.close()
+        return flushed
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {**self._stats, "queued": self._queue.qsize()}
+
+    def __enter__(self) -> "EEPClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _close_at_exit(self) -> None:
+        if not self.close(self.exit_timeout):
+            logging.warning("EEP client exited with %d unsent messages",
+                            self._queue.qsize())
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[key] += amount
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if any(item is _STOP for item in batch):
+                stops = len(batch)
+                batch = [item for item in batch if item is not _STOP]
+                for _ in range(stops - len(batch)):
+                    self._queue.task_done()
+                stopping = True
+            if not batch:
+                continue
+            try:
+                self._deliver(batch)
+            except Exception as exc:  # pragma: no cover - defensive
+                logging.warning("EEP client failed to send messages: %s", exc)
+                self._count("failed", len(batch))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _deliver(self, batch: list[dict]) -> int:
+        """Send ``batch`` with retries and return how many messages were stored."""
+        url, body = (
+            (self.api_url, batch[0]) if len(batch) == 1 else (self.batch_url, batch)
+        )
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self._count("retried")
+                time.sleep(min(self.backoff * 2 ** (attempt - 1), self.max_backoff))
+            try:
+                res = self.session.post(url, json=body, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                error = str(exc)
+                if _not_sent(exc):
+                    continue
+                break
+            if res.status_code in _RETRY_STATUSES:
+                error = f"HTTP {res.status_code}"
+                continue
+            if len(batch) == 1:
+                stored = int(200 <= res.status_code < 300)
+            else:
+                try:
+                    stored = res.json()["stored"]
+                except Exception:
+                    stored = 0
+            if stored < len(batch):
+                logging.warning("T-BEEP API rejected %d of %d messages (HTTP %s)",
+                                len(batch) - stored, len(batch), res.status_code)
+            self._count("sent", stored)
+            self._count("failed", len(batch) - stored)
+            return stored
+        logging.warning("Failed to send %d messages after %d attempts: %s",
+                        len(batch), attempt + 1, error)
+        self._count("failed", len(batch))
+        return 0
+
+
+_DEFAULT_CLIENTS: dict[str, EEPClient] = {}
+_DEFAULT_CLIENTS_LOCK = threading.Lock()
+
+
+def default_client(api_url: str = API_URL) -> EEPClient:
+    """Return the process-wide :class:`EEPClient` for ``api_url``."""
+    with _DEFAULT_CLIENTS_LOCK:
+        client = _DEFAULT_CLIENTS.get(api_url)
+        if client is None or client._closed:
+            client = _DEFAULT_CLIENTS[api_url] = EEPClient(api_url)
+        return client
+
+
+def _send(agent: Any, payload: dict, *, api_url: str,
+          batcher: MessageBatcher | None, client: EEPClient | None) -> bool:
+    """Hand ``payload`` to a batcher or a background client.
+
+    ``batcher`` / ``agent.eep_batcher`` take precedence, then ``client`` /
+    ``agent.eep_client``, then the shared :func:`default_client` for
+    ``api_url``. The result says whether the message was accepted for
+    delivery, not whether the API stored it.
+    """
+    batcher = batcher or getattr(agent, "eep_batcher", None)
+    if batcher is not None:
+        batcher.submit(payload)
+        return True
+    client = client or getattr(agent, "eep_client", None) or default_client(api_url)
+    return client.submit(payload)
 
 
 def broadcast_state(agent: Any, state: dict, *, thread_token: str,
                     digest: dict | None = None,
-                    api_url: str = "http://localhost:5000/api/v1/messages") -> bool:
+                    api_url: str = API_URL,
+                    batcher: MessageBatcher | None = None,
+                    client: EEPClient | None = None) -> bool:
     """Broadcast ``state`` to other instances via the T-BEEP API.
 
     When ``digest`` is provided, it is included in the payload for recipients
-    interested in DKA persistence.
+    interested in DKA persistence. Like the other helpers, this returns once
+    the message is queued: on ``batcher`` (or the agent's ``eep_batcher``)
+    when one is set, otherwise on ``client``, the agent's ``eep_client`` or
+    the shared :func:`default_client`.
     """
     payload = {
         "threadToken": thread_token,
@@ -23,17 +343,13 @@ def broadcast_state(agent: Any, state: dict, *, thread_token: str,
         "state": state,
         "digest": digest,
     }
-    try:
-        res = requests.post(api_url, json=payload, timeout=5)
-        res.raise_for_status()
-        return True
-    except Exception as exc:  # pragma: no cover - network issues
-        logging.warning("Failed to broadcast state: %s", exc)
-        return False
+    return _send(agent, payload, api_url=api_url, batcher=batcher, client=client)
 
 
 def request_validation(agent: Any, claim: str, *, thread_token: str, target: str = "",
-                        api_url: str = "http://localhost:5000/api/v1/messages") -> bool:
+                        api_url: str = API_URL,
+                        batcher: MessageBatcher | None = None,
+                        client: EEPClient | None = None) -> bool:
     """Request cross-instance validation for ``claim``."""
     payload = {
         "threadToken": thread_token,
@@ -43,18 +359,14 @@ def request_validation(agent: Any, claim: str, *, thread_token: str, target: str
         "target": target,
         "seedToken": getattr(agent, "seed_token", None) and agent.seed_token.to_dict(),
     }
-    try:
-        res = requests.post(api_url, json=payload, timeout=5)
-        res.raise_for_status()
-        return True
-    except Exception as exc:  # pragma: no cover - network issues
-        logging.warning("Failed to request validation: %s", exc)
-        return False
+    return _send(agent, payload, api_url=api_url, batcher=batcher, client=client)
 
 
 def start_collab_session(agent: Any, participants: Sequence[str], *, thread_token: str,
                           topic: str = "",
-                          api_url: str = "http://localhost:5000/api/v1/messages") -> bool:
+                          api_url: str = API_URL,
+                          batcher: MessageBatcher | None = None,
+                          client: EEPClient | None = None) -> bool:
     """Announce a collaborative reasoning session with ``participants``."""
     payload = {
         "threadToken": thread_token,
@@ -64,16 +376,13 @@ def start_collab_session(agent: Any, participants: Sequence[str], *, thread_toke
         "topic": topic,
         "seedToken": getattr(agent, "seed_token", None) and agent.seed_token.to_dict(),
     }
-    try:
-        res = requests.post(api_url, json=payload, timeout=5)
-        res.raise_for_status()
-        return True
-    except Exception as exc:  # pragma: no cover - network issues
-        logging.warning("Failed to start collaboration session: %s", exc)
-        return False
+    return _send(agent, payload, api_url=api_url, batcher=batcher, client=client)
 
 
 __all__ = [
+    "EEPClient",
+    "MessageBatcher",
+    "default_client",
     "broadcast_state",
     "request_validation",
     "start_collab_session",
@@ -157,6 +157,58 @@ def _dependencies(record: Mapping[str, Any]) -> set[tuple[str, str]]:
     return result
 
 
+def _ingest_plan(
+    groups: Mapping[tuple[str, str], list[dict[str, Any]]],
+) -> list[dict[str, Any]]:
+    """Order snapshots so every parent precedes its children."""
+
+    positions = {key: 0 for key in groups}
+    imported: dict[str, set[tuple[str, str]]] = {}
+    heads: dict[tuple[str, str], tuple[str, str]] = {}
+    plan: list[dict[str, Any]] = []
+    total = sum(len(records) for records in groups.values())
+    while len(plan) < total:
+        progressed = False
+        for key in sorted(groups):
+            position = positions[key]
+            records = groups[key]
+            if position >= len(records):
+                continue
+            candidate = records[position]
+            known = imported.setdefault(candidate["dka_id"], set())
+            if not _dependencies(candidate).issubset(known):
+                continue
+            current = heads.get(key)
+            plan.append(
+                {
+                    "record": candidate,
+                    "expected_head": current[0] if current else None,
+                    "expected_head_profile": current[1] if current else None,
+                }
+            )
+            head = (candidate["integrity"]["digest"], dka_digest_spec(candidate)[1])
+            heads[key] = head
+            known.add(head)
+            positions[key] += 1
+            progressed = True
+        if not progressed:
+            unresolved = [
+                {
+                    "dka_id": key[0],
+                    "branch": key[1],
+                    "revision": groups[key][positions[key]]["revision"],
+                    "dependencies": sorted(_dependencies(groups[key][positions[key]])),
+                }
+                for key in sorted(groups)
+                if positions[key] < len(groups[key])
+            ]
+            raise MigrationError(
+                "unresolvable/cyclic source lineage: "
+                + json.dumps(unresolved, sort_keys=True)
+            )
+    return plan
+
+
 def migrate(
     source: str | Path,
     destination: str | Path,
@@ -175,6 +227,7 @@ def migrate(
     groups = _load_source_records(source_path)
     source_heads = _load_source_heads(source_path)
     _validate_source_heads(groups, source_heads)
+    plan = _ingest_plan(groups)
     source_event_count = _count_source_events(source_path)
     source_digest = _tree_digest(source_path)
     if source_digest != source_digest_before:
@@ -203,52 +256,23 @@ def migrate(
             tenant_id=tenant_id,
             local_filesystem=local_filesystem,
         )
-        positions = {key: 0 for key in groups}
-        imported: dict[str, set[tuple[str, str]]] = {}
-        imported_heads: dict[tuple[str, str], dict[str, Any]] = {}
-        imported_count = 0
-        while imported_count < sum(len(records) for records in groups.values()):
-            progressed = False
-            for key in sorted(groups):
-                position = positions[key]
-                records = groups[key]
-                if position >= len(records):
-                    continue
-                candidate = records[position]
-                known = imported.setdefault(candidate["dka_id"], set())
-                if not _dependencies(candidate).issubset(known):
-                    continue
-                current = imported_heads.get(key)
-                head = store.put(
-                    candidate,
-                    expected_head=current["digest"] if current else None,
-                    expected_head_profile=(
-                        current["digest_profile"] if current else None
-                    ),
-                    event_type="migration",
-                    actor=context.principal_id,
-                    context=context,
-                )
-                imported_heads[key] = head
-                known.add((head["digest"], head["digest_profile"]))
-                positions[key] += 1
-                imported_count += 1
-                progressed = True
-            if not progressed:
-                unresolved = [
-                    {
-                        "dka_id": key[0],
-                        "branch": key[1],
-                        "revision": groups[key][positions[key]]["revision"],
-                        "dependencies": sorted(_dependencies(groups[key][positions[key]])),
-                    }
-                    for key in sorted(groups)
-                    if positions[key] < len(groups[key])
-                ]
-                raise MigrationError(
-                    "unresolvable/cyclic source lineage: "
-                    + json.dumps(unresolved, sort_keys=True)
-                )
+        batch = store.put_many(
+            plan,
+            event_type="migration",
+            actor=context.principal_id,
+            context=context,
+        )
+        if not batch["committed"]:
+            failure = next(
+                item for item in batch["items"] if item["status"] == "rejected"
+            )
+            record = plan[failure["index"]]["record"]
+            raise MigrationError(
+                "destination rejected source snapshot "
+                f"{(record['dka_id'], record['branch'], record['revision'])!r}: "
+                f"{failure['error']['message']}"
+            )
+        imported_count = len(plan)
 
         for key, expected in source_heads.items():
             actual = store.head(key[0], key[1], context=context)
@@ -282,6 +306,7 @@ def migrate(
             "destination": str(destination_path.resolve()),
             "tenant_id": tenant_id,
             "snapshots_imported": imported_count,
+            "write_transactions": 1,
             "branches_imported": len(groups),
             "source_events_observed": source_event_count,
             "source_events_replayed_as_authority": False,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import copy
+import hashlib
 import json
 import shutil
 import subprocess
@@ -8,6 +9,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
+import rfc8785
 from jsonschema.exceptions import ValidationError
 
 from cpas.dka import seal_record, validate_record, verify_record_integrity
@@ -21,7 +23,11 @@ from cpas.provenance import (
     LEGACY_CANONICALIZATION,
     LEGACY_DIGEST_PROFILE,
     canonicalize_json,
+    digest_preimage,
+    omit_paths,
     profiled_digest,
+    without_paths,
+    write_canonical_json,
 )
 from cpas.seed_token import seal_token, validate_token, verify_integrity
 from tools.verify_canonicalization_vectors import verify_vectors
@@ -154,3 +160,69 @@ def test_jcs_artifacts_fail_closed_when_required_profiles_are_missing():
     )
     assert not result.valid
     assert any("digest_profile" in error for error in result.errors)
+
+
+def test_streamed_digests_match_materialized_preimages():
+    value = {
+        "records": [
+            {"id": index, "text": "caf\u00e9 \U0001f600" * 20, "ratio": index / 7}
+            for index in range(2_000)
+        ],
+        "empty": {},
+        "flags": [True, False, None],
+    }
+    preimage = digest_preimage(
+        value,
+        canonicalization=JCS_CANONICALIZATION,
+        digest_profile=DKA_SNAPSHOT_DIGEST_PROFILE,
+    )
+    assert profiled_digest(
+        value,
+        canonicalization=JCS_CANONICALIZATION,
+        digest_profile=DKA_SNAPSHOT_DIGEST_PROFILE,
+    ) == "sha256:" + hashlib.sha256(preimage).hexdigest()
+    assert profiled_digest(
+        value,
+        canonicalization=LEGACY_CANONICALIZATION,
+        digest_profile=None,
+    ) == "sha256:" + hashlib.sha256(
+        canonicalize_json(value, profile=LEGACY_CANONICALIZATION)
+    ).hexdigest()
+
+    chunks: list[bytes] = []
+
+    class Collector:
+        write = chunks.append
+
+    write_canonical_json(value, Collector(), profile=JCS_CANONICALIZATION)
+    assert len(chunks) > 1
+    assert b"".join(chunks) == canonicalize_json(value, profile=JCS_CANONICALIZATION)
+
+    with pytest.raises(rfc8785.IntegerDomainError):
+        profiled_digest(
+            {"too_large": 2**53},
+            canonicalization=JCS_CANONICALIZATION,
+            digest_profile=DKA_SNAPSHOT_DIGEST_PROFILE,
+        )
+    with pytest.raises(ValueError, match="unsupported"):
+        write_canonical_json({}, Collector(), profile="unknown-profile")
+
+
+def test_omit_paths_shares_untouched_subtrees_and_matches_without_paths():
+    value = {
+        "integrity": {"digest": "sha256:" + "0" * 64, "algorithm": "sha-256"},
+        "authenticator": {"tag": "secret", "key_id": "k1"},
+        "body": {"items": [1, 2, 3]},
+        "scalar": "kept",
+    }
+    original = copy.deepcopy(value)
+    paths = [("integrity", "digest"), ("authenticator", "tag"), ("missing", "x"), ("scalar", "x")]
+    projected = omit_paths(value, paths)
+    assert projected == without_paths(value, paths)
+    assert value == original
+    assert projected["body"] is value["body"]
+    assert projected["integrity"] is not value["integrity"]
+    assert "digest" not in projected["integrity"]
+    assert canonicalize_json(projected, profile=JCS_CANONICALIZATION) == canonicalize_json(
+        without_paths(value, paths), profile=JCS_CANONICALIZATION
+    )
@@ -105,6 +105,15 @@ def test_file_store_round_trip_cas_history_and_events(tmp_path):
         actor="unit-test",
     )
     assert [item["revision"] for item in store.history(record["dka_id"])] == [1, 2]
+    assert [
+        item["revision"]
+        for item in store.iter_history(record["dka_id"], newest_first=True)
+    ] == [2, 1]
+    assert list(store.iter_history(record["dka_id"], since_revision=2)) == [revised]
+    assert list(store.iter_history(record["dka_id"], until_revision=1)) == [record]
+    assert list(store.iter_history("missing-dka")) == []
+    with pytest.raises(ValueError, match="until_revision"):
+        store.iter_history(record["dka_id"], until_revision=0)
 
 
 def test_file_store_detects_snapshot_tampering(tmp_path):
@@ -119,6 +128,38 @@ def test_file_store_detects_snapshot_tampering(tmp_path):
         store.get(record["dka_id"])
 
 
+def test_file_store_put_ignores_caller_mutation_while_waiting_for_the_lock(tmp_path):
+    store = FileDKAStore(tmp_path / "store")
+    record = example()
+    expected = copy.deepcopy(record)
+    locked = store._lock
+
+    def mutate_then_lock(dka_id, branch):
+        record["provenance"]["created_by"] = "changed after verification"
+        record["epistemic_state"].clear()
+        return locked(dka_id, branch)
+
+    store._lock = mutate_then_lock
+    store.put(record, expected_head=None)
+    assert store.get(expected["dka_id"]) == expected
+
+
+def test_file_store_get_many_keeps_order_and_per_ref_errors(tmp_path):
+    store = FileDKAStore(tmp_path / "store")
+    record = example()
+    store.put(record, expected_head=None)
+    results = store.get_many(
+        [
+            {"dka_id": record["dka_id"]},
+            {"dka_id": record["dka_id"], "revision": 2},
+            {"dka_id": ".."},
+        ]
+    )
+    assert results[0] == {"index": 0, "status": "found", "record": record}
+    assert results[1]["error"]["code"] == "record_not_found"
+    assert results[2]["error"]["code"] == "invalid_reference"
+
+
 def test_file_store_rejects_a_lineage_digest_with_the_wrong_profile(tmp_path):
     store = FileDKAStore(tmp_path / "store")
     record = example()
@@ -130,6 +130,18 @@ def test_v1_migration_is_conservative_and_valid():
 def test_duplicate_json_members_are_rejected():
     with pytest.raises(DuplicateKeyError):
         loads_json('{"instance_id":"first","instance_id":"replacement"}')
+    with pytest.raises(DuplicateKeyError, match="duplicate JSON key: b$"):
+        loads_json('[{"a":1},{"outer":{"b":1,"c":2,"b":1}}]')
+    with pytest.raises(DuplicateKeyError):
+        loads_json(b'{"a":1,"a":1}')
+    with pytest.raises(ValueError, match="non-finite JSON number: NaN"):
+        loads_json('{"a":[NaN]}')
+    with pytest.raises(ValueError, match="BOM"):
+        loads_json('\ufeff{}')
+    assert loads_json('{"a":{"b":[1,{"c":null}]},"d":"e"}') == {
+        "a": {"b": [1, {"c": None}]},
+        "d": "e",
+    }
 
 
 def test_v1_migration_can_emit_an_explicit_legacy_compatibility_draft():
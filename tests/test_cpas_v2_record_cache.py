@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from cpas.dka import revise_record
+from cpas.dka_store import CorruptionDetected, DKAStoreError, FileDKAStore, StoreContext
+from cpas.record_cache import VerifiedRecordCache
+from cpas.rehydrate import rehydrate
+from cpas.sqlite_dka_store import SQLiteDKAStore
+
+
+ROOT = Path(__file__).resolve().parents[1]
+TENANT = "tenant-record-cache"
+
+
+def example() -> dict:
+    return json.loads(
+        (ROOT / "examples/v2/dka-e-v2.example.json").read_text(encoding="utf-8")
+    )
+
+
+def admin() -> StoreContext:
+    return StoreContext(
+        tenant_id=TENANT,
+        principal_id="cache-operator",
+        permissions=frozenset({"dka:*"}),
+        authentication_ref="test-authn",
+        authorization_ref="test-authz",
+        request_id="request-cache",
+    )
+
+
+def test_file_store_serves_copies_and_rejects_rewritten_snapshots(tmp_path: Path):
+    cache = VerifiedRecordCache()
+    store = FileDKAStore(tmp_path / "store", record_cache=cache)
+    record = example()
+    store.put(record, expected_head=None)
+
+    first = store.get(record["dka_id"])
+    first["claim"] = "mutated by a caller"
+    assert store.get(record["dka_id"]) == record
+    assert store.history(record["dka_id"]) == [record]
+    stats = cache.stats()
+    assert (stats["entries"], stats["misses"], stats["hits"]) == (1, 1, 2)
+
+    snapshot = tmp_path / "store/snapshots" / record["dka_id"] / "main/1.json"
+    tampered = json.loads(snapshot.read_text(encoding="utf-8"))
+    tampered["claim"] = "rewritten on disk"
+    snapshot.write_text(json.dumps(tampered), encoding="utf-8")
+    with pytest.raises(DKAStoreError, match="digest"):
+        store.get(record["dka_id"])
+
+
+def test_sqlite_store_cache_is_shared_by_reads_and_rehydration(tmp_path: Path):
+    cache = VerifiedRecordCache()
+    store = SQLiteDKAStore(
+        tmp_path / "tenant.db",
+        tenant_id=TENANT,
+        local_filesystem=True,
+        record_cache=cache,
+    )
+    context = admin()
+    record = example()
+    store.put(record, expected_head=None, context=context)
+    for _ in range(3):
+        assert store.get(record["dka_id"], context=context) == record
+    rehydrate(
+        store,
+        [{"dka_id": record["dka_id"]}],
+        context=context,
+        authorize=lambda _: True,
+    )
+    assert cache.stats()["hits"] == 3
+    assert store.verify(context=context)["passed"] is True
+    assert cache.stats()["hits"] == 3
+
+    connection = sqlite3.connect(store.path)
+    payload = json.loads(
+        connection.execute("SELECT payload_json FROM snapshots").fetchone()[0]
+    )
+    payload["claim"] = "tampered without resealing"
+    connection.execute("UPDATE snapshots SET payload_json=?", (json.dumps(payload),))
+    connection.commit()
+    connection.close()
+    with pytest.raises(CorruptionDetected, match="digest"):
+        store.get(record["dka_id"], context=context)
+
+
+def test_cache_evicts_least_recently_used_entries_within_its_limits():
+    record = example()
+    payload = json.dumps(record)
+    revised = revise_record(
+        record,
+        {"claim": "Second cached revision."},
+        actor="cache-test",
+        updated_at="2026-08-13T00:00:00Z",
+        change_summary="cache eviction fixture",
+    )
+    cache = VerifiedRecordCache(max_entries=1)
+    cache.put(("profile", "first"), payload, record)
+    cache.put(("profile", "second"), json.dumps(revised), revised)
+    assert cache.get(("profile", "first"), payload) is None
+    assert cache.get(("profile", "second"), json.dumps(revised)) == revised
+    assert cache.stats()["evictions"] == 1
+
+    small = VerifiedRecordCache(max_bytes=len(payload) - 1)
+    small.put(("profile", "first"), payload, record)
+    assert small.stats()["entries"] == 0
+    assert small.stats()["rejected_oversize"] == 1
+    with pytest.raises(ValueError, match="max_entries"):
+        VerifiedRecordCache(max_entries=0)
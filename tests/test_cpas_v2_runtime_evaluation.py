@@ -2,23 +2,37 @@ from __future__ import annotations
 
 import copy
 import json
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
+from jsonschema.exceptions import ValidationError
 
 from cpas.evaluation import (
     EvaluationError,
+    compare_runtime_candidates,
     compare_runtime_transcripts,
+    compile_assertion,
+    compile_assertion_plans,
     evaluate_assertion,
+    load_transcript,
     seal_manifest,
     seal_report,
     seal_transcript,
     validate_manifest,
     validate_report,
     validate_transcript,
+    validate_transcript_file,
 )
 from cpas.provenance import load_json
-from cpas.runtime import RuntimeAdapter, TranscriptRuntimeAdapter
+from cpas.runtime import (
+    IndexedTranscriptRuntimeAdapter,
+    RuntimeAdapter,
+    RuntimeAdapterError,
+    TranscriptRuntimeAdapter,
+)
 from tools.evaluate_runtime_replacement import run
 
 
@@ -302,6 +316,39 @@ def test_assertion_operators_are_deterministic_and_missing_is_explicit():
     assert missing["observation"] == {"present": False, "type": "missing"}
 
 
+def test_compiled_assertion_plans_are_shared_and_match_direct_evaluation():
+    manifest, _, baseline, candidate = inputs()
+    plans = compile_assertion_plans(manifest)
+    assert compile_assertion_plans(copy.deepcopy(manifest)) is plans
+    assert list(plans) == [case["case_id"] for case in manifest["cases"]]
+    for transcript in (baseline, candidate):
+        outputs = {
+            response["case_id"]: response.get("output", {})
+            for response in transcript["responses"]
+        }
+        for case in manifest["cases"]:
+            output = outputs[case["case_id"]]
+            assert [plan.evaluate(output) for plan in plans[case["case_id"]]] == [
+                evaluate_assertion(output, assertion)
+                for assertion in case["machine_assertions"]
+            ]
+
+    escaped = compile_assertion(
+        {
+            "assertion_id": "escaped",
+            "path": "/a~1b/~0c/1",
+            "operator": "min_items",
+            "expected": 1,
+            "severity": "required",
+            "drift_category": "task_performance_change",
+        }
+    )
+    assert escaped.tokens == ("a/b", "~c", "1")
+    assert escaped.evaluate({"a/b": {"~c": [0, ["x"]]}})["passed"] is True
+    with pytest.raises(EvaluationError, match="unsupported assertion operator"):
+        compile_assertion({**escaped.__dict__, "operator": "matches"})
+
+
 def test_response_budget_failure_is_reported_not_silently_truncated():
     manifest, declaration, baseline, candidate = inputs()
     constrained = copy.deepcopy(manifest)
@@ -422,3 +469,371 @@ def test_manifest_cannot_weaken_required_policy_or_capability_gates():
     manifest = seal_manifest(manifest)
     with pytest.raises(EvaluationError, match="zero-tolerance"):
         validate_manifest(manifest)
+
+
+class _CountingAdapter(TranscriptRuntimeAdapter):
+    def __init__(self, transcript, counter):
+        super().__init__(transcript)
+        self._counter = counter
+
+    def invoke(self, case):
+        with self._counter["lock"]:
+            self._counter["active"] += 1
+            self._counter["peak"] = max(self._counter["peak"], self._counter["active"])
+        time.sleep(0.01)
+        with self._counter["lock"]:
+            self._counter["active"] -= 1
+        return super().invoke(case)
+
+
+def test_executor_runs_concurrently_within_policy_and_seals_identically():
+    manifest, declaration, baseline, candidate = inputs()
+    sequential = compare()
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        in_processes = compare_runtime_transcripts(
+            manifest,
+            declaration,
+            baseline,
+            candidate,
+            TranscriptRuntimeAdapter(baseline),
+            TranscriptRuntimeAdapter(candidate),
+            evaluated_at=EVALUATED_AT,
+            declaration_path=DECLARATION,
+            executor=pool,
+        )
+    assert in_processes == sequential
+
+    limited = copy.deepcopy(manifest)
+    limited["invocation_policy"]["max_concurrency"] = 2
+    limited = seal_manifest(limited)
+    counter = {"lock": threading.Lock(), "active": 0, "peak": 0}
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        threaded = compare_runtime_transcripts(
+            limited,
+            declaration,
+            baseline,
+            candidate,
+            _CountingAdapter(baseline, counter),
+            _CountingAdapter(candidate, counter),
+            evaluated_at=EVALUATED_AT,
+            declaration_path=DECLARATION,
+            executor=pool,
+        )
+    assert 1 < counter["peak"] <= 2
+    expected = compare(limited, declaration, baseline, candidate)
+    assert json.dumps(threaded, sort_keys=True) == json.dumps(expected, sort_keys=True)
+
+    broken = copy.deepcopy(candidate)
+    broken["responses"][0]["output"] = {"tampered": True}
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        with pytest.raises(EvaluationError, match="differs from referenced transcript"):
+            compare_runtime_transcripts(
+                manifest,
+                declaration,
+                baseline,
+                candidate,
+                TranscriptRuntimeAdapter(baseline),
+                TranscriptRuntimeAdapter(broken),
+                evaluated_at=EVALUATED_AT,
+                declaration_path=DECLARATION,
+                executor=pool,
+            )
+
+
+class _InvocationLog(TranscriptRuntimeAdapter):
+    def __init__(self, transcript, log):
+        super().__init__(transcript)
+        self._log = log
+
+    def invoke(self, case):
+        self._log.append(case["case_id"])
+        return super().invoke(case)
+
+
+def test_candidate_mode_replays_the_baseline_once_and_ranks_dispositions(
+    tmp_path, capsys
+):
+    manifest, declaration, baseline, candidate = inputs()
+    changed = copy.deepcopy(candidate)
+    changed["capability_probes"][0]["outcome"] = "unsupported"
+    changed = seal_transcript(changed)
+    shortlist = [candidate, baseline, changed]
+    baseline_calls: list[str] = []
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        result = compare_runtime_candidates(
+            manifest,
+            declaration,
+            (baseline, _InvocationLog(baseline, baseline_calls)),
+            [(item, TranscriptRuntimeAdapter(item)) for item in shortlist],
+            evaluated_at=EVALUATED_AT,
+            declaration_path=DECLARATION,
+            executor=pool,
+        )
+    assert baseline_calls == [case["case_id"] for case in manifest["cases"]]
+    assert result["reports"] == [
+        compare(manifest, declaration, baseline, item) for item in shortlist
+    ]
+    ranking = result["summary"]["ranking"]
+    assert [(item["rank"], item["candidate_index"]) for item in ranking] == [
+        (1, 1),
+        (2, 0),
+        (3, 2),
+    ]
+    assert ranking[0]["machine_disposition"] == "conformance_only"
+    assert ranking[2]["blocking_reasons"] == ["capability_failure", "policy_violation"]
+    assert result["summary"]["human_review_required"] is True
+    with pytest.raises(EvaluationError, match="at least one candidate"):
+        compare_runtime_candidates(
+            manifest, declaration, (baseline, TranscriptRuntimeAdapter(baseline)), []
+        )
+
+    output_dir = tmp_path / "reports"
+    output_dir.mkdir()
+    arguments = [
+        "--manifest",
+        str(FIXTURES / "manifest.json"),
+        "--baseline",
+        str(FIXTURES / "baseline-transcript.json"),
+        "--candidate",
+        str(FIXTURES / "candidate-transcript.json"),
+        "--candidate",
+        str(FIXTURES / "baseline-transcript.json"),
+        "--declaration",
+        str(DECLARATION),
+        "--evaluated-at",
+        EVALUATED_AT,
+        "--cache-dir",
+        str(tmp_path / "cache"),
+        "--output-dir",
+        str(output_dir),
+    ]
+    assert run(arguments) == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert summary == load_json(output_dir / "summary.json")
+    assert [item["cache"] for item in summary["ranking"]] == ["miss", "miss"]
+    first, second = summary["ranking"]
+    assert load_json(Path(second["output"])) == result["reports"][0]
+    assert first["output"].endswith("01-baseline-transcript.json")
+    assert second["report_digest"] == fixture("expected-summary.json")["report_digest"]
+    with pytest.raises(FileExistsError):
+        run(arguments)
+    assert run([*arguments, "--overwrite"]) == 0
+    rerun = json.loads(capsys.readouterr().out)
+    assert [item["cache"] for item in rerun["ranking"]] == ["hit", "hit"]
+    with pytest.raises(ValueError, match="--output-dir"):
+        run(arguments[: arguments.index("--output-dir")])
+
+
+def test_streaming_transcript_reader_matches_whole_document_validation(tmp_path):
+    candidate = fixture("candidate-transcript.json")
+    path = tmp_path / "transcript.json"
+    reordered = dict(reversed(list(candidate.items())))
+    for document in (candidate, reordered):
+        path.write_text(json.dumps(document, indent=1), encoding="utf-8")
+        assert load_transcript(path, chunk_size=7) == candidate
+        header = validate_transcript_file(path, chunk_size=3)
+        assert "responses" not in header and "capability_probes" not in header
+        assert header["integrity"] == candidate["integrity"]
+
+    def rejected(document: dict) -> str:
+        with pytest.raises((ValidationError, EvaluationError)) as whole:
+            validate_transcript(document)
+        path.write_text(json.dumps(document), encoding="utf-8")
+        with pytest.raises(type(whole.value)) as streamed:
+            validate_transcript_file(path, chunk_size=16)
+        assert str(streamed.value) == str(whole.value)
+        return str(whole.value)
+
+    extra = copy.deepcopy(candidate)
+    extra["responses"][1]["unexpected"] = True
+    assert "responses/1" in rejected(extra)
+    tampered = copy.deepcopy(candidate)
+    tampered["responses"][0]["output"] = {"tampered": True}
+    assert rejected(tampered) == "transcript integrity digest mismatch"
+    duplicated = copy.deepcopy(candidate)
+    duplicated["responses"].append(copy.deepcopy(duplicated["responses"][0]))
+    assert "must be unique" in rejected(seal_transcript(duplicated))
+    empty = copy.deepcopy(candidate)
+    empty["responses"] = []
+    rejected(empty)
+    missing = copy.deepcopy(candidate)
+    del missing["capability_probes"]
+    rejected(missing)
+
+    path.write_text(json.dumps(candidate)[:-5], encoding="utf-8")
+    with pytest.raises(EvaluationError, match="invalid JSON"):
+        validate_transcript_file(path)
+    path.write_text(
+        json.dumps(candidate).replace('"assurance"', '"assurance": 1, "assurance"', 1),
+        encoding="utf-8",
+    )
+    with pytest.raises(EvaluationError, match="duplicate JSON key"):
+        load_transcript(path)
+
+
+def test_indexed_adapter_replays_read_only_entries_from_byte_offsets(tmp_path):
+    manifest, declaration, baseline, candidate = inputs()
+    indexed = compare_runtime_transcripts(
+        manifest,
+        declaration,
+        baseline,
+        candidate,
+        IndexedTranscriptRuntimeAdapter(FIXTURES / "baseline-transcript.json"),
+        IndexedTranscriptRuntimeAdapter(FIXTURES / "candidate-transcript.json"),
+        evaluated_at=EVALUATED_AT,
+        declaration_path=DECLARATION,
+    )
+    assert indexed == compare()
+
+    unicode = copy.deepcopy(candidate)
+    unicode["responses"][0]["output"]["answer"] = "Geprüft — ✓ \U0001f9ed"
+    path = tmp_path / "transcript.json"
+    path.write_text(json.dumps(unicode, indent=1, ensure_ascii=False), encoding="utf-8")
+    adapter = IndexedTranscriptRuntimeAdapter(path)
+    eager = TranscriptRuntimeAdapter(unicode)
+    for response in unicode["responses"]:
+        assert adapter.invoke(response) == eager.invoke(response)
+    for probe in unicode["capability_probes"]:
+        assert adapter.probe(probe) == eager.probe(probe)
+    bom = tmp_path / "bom-transcript.json"
+    bom.write_bytes(b"\xef\xbb\xbf" + path.read_bytes())
+    small_windows = IndexedTranscriptRuntimeAdapter(bom, chunk_size=7)
+    for response in unicode["responses"]:
+        assert small_windows.invoke(response) == eager.invoke(response)
+
+    entry = adapter.invoke(unicode["responses"][0])
+    with pytest.raises(TypeError):
+        entry["output"]["answer"] = "rewritten"
+    with pytest.raises(TypeError):
+        entry["tool_events"].append({})
+    with pytest.raises(TypeError):
+        adapter.describe()["adapter"].clear()
+    thawed = copy.deepcopy(entry)
+    thawed["output"]["answer"] = "copies are mutable"
+    assert adapter.invoke(unicode["responses"][0]) == entry
+    with pytest.raises(RuntimeAdapterError, match="missing transcript response"):
+        adapter.invoke({"case_id": "not-recorded"})
+
+    path.write_text(json.dumps(candidate), encoding="utf-8")
+    with pytest.raises(RuntimeAdapterError, match="changed after it was indexed"):
+        adapter.invoke(unicode["responses"][0])
+    duplicated = copy.deepcopy(candidate)
+    duplicated["responses"].append(duplicated["responses"][0])
+    path.write_text(json.dumps(duplicated), encoding="utf-8")
+    with pytest.raises(RuntimeAdapterError, match="duplicate transcript case_id"):
+        IndexedTranscriptRuntimeAdapter(path)
+    runtime = json.dumps(candidate["runtime"])
+    for malformed in (
+        f'{{"runtime": {runtime}, "responses": [{{"case_id": "a"',
+        f'{{"runtime": {runtime}, "capability_probes": [], "responses": [],}}',
+    ):
+        path.write_text(malformed, encoding="utf-8")
+        with pytest.raises(RuntimeAdapterError, match="transcript JSON at offset"):
+            IndexedTranscriptRuntimeAdapter(path)
+
+
+def test_cli_report_cache_hits_on_identical_inputs_only(tmp_path, capsys):
+    cache_dir = tmp_path / "cache"
+    candidate_path = tmp_path / "candidate.json"
+    candidate_path.write_bytes((FIXTURES / "candidate-transcript.json").read_bytes())
+
+    def evaluate(*extra: str) -> dict:
+        output = tmp_path / "report.json"
+        arguments = [
+            "--manifest",
+            str(FIXTURES / "manifest.json"),
+            "--baseline",
+            str(FIXTURES / "baseline-transcript.json"),
+            "--candidate",
+            str(candidate_path),
+            "--declaration",
+            str(DECLARATION),
+            "--cache-dir",
+            str(cache_dir),
+            "--output",
+            str(output),
+            "--overwrite",
+            *extra,
+        ]
+        assert run(arguments) == 0
+        emitted = json.loads(capsys.readouterr().out)
+        assert load_json(output)["integrity"]["digest"] == emitted["report_digest"]
+        return emitted
+
+    expected = fixture("expected-summary.json")["report_digest"]
+    first = evaluate("--evaluated-at", EVALUATED_AT)
+    assert (first["cache"], first["report_digest"]) == ("miss", expected)
+    assert evaluate("--evaluated-at", EVALUATED_AT)["cache"] == "hit"
+    assert evaluate("--evaluated-at", "2026-08-12T22:34:00Z")["cache"] == "miss"
+    assert evaluate()["cache"] == "bypassed"
+
+    (entry,) = [
+        path for path in cache_dir.rglob("*.json")
+        if load_json(path)["evaluated_at"] == EVALUATED_AT
+    ]
+    tampered = load_json(entry)
+    tampered["threshold_evaluation"]["machine_disposition"] = "eligible_for_human_review"
+    entry.write_text(json.dumps(tampered), encoding="utf-8")
+    repaired = evaluate("--evaluated-at", EVALUATED_AT)
+    assert (repaired["cache"], repaired["report_digest"]) == ("miss", expected)
+    assert evaluate("--evaluated-at", EVALUATED_AT)["cache"] == "hit"
+
+    candidate_path.write_text(
+        json.dumps(load_json(candidate_path), indent=4), encoding="utf-8"
+    )
+    assert evaluate("--evaluated-at", EVALUATED_AT)["cache"] == "miss"
+
+
+def test_report_cache_key_covers_package_and_schemas_and_reports_status(
+    tmp_path, capsys, monkeypatch
+):
+    import tools.evaluate_runtime_replacement as tool
+
+    arguments = [
+        "--manifest",
+        str(FIXTURES / "manifest.json"),
+        "--baseline",
+        str(FIXTURES / "baseline-transcript.json"),
+        "--candidate",
+        str(FIXTURES / "candidate-transcript.json"),
+        "--declaration",
+        str(DECLARATION),
+        "--evaluated-at",
+        EVALUATED_AT,
+        "--cache-dir",
+        str(tmp_path / "cache"),
+    ]
+
+    def status() -> dict:
+        assert run(arguments) == 0
+        captured = capsys.readouterr()
+        assert json.loads(captured.out)["integrity"]["digest"] == fixture(
+            "expected-summary.json"
+        )["report_digest"]
+        return json.loads(captured.err)
+
+    assert status()["cache"] == "miss"
+    assert status()["cache"] == "hit"
+
+    original = tool.file_sha256
+    for changed in ("runtime.py", "provenance.py", "runtime-transcript-v1.0.schema.json"):
+        monkeypatch.setattr(
+            tool,
+            "file_sha256",
+            lambda path, name=changed: (
+                "sha256:" + "0" * 64 if Path(path).name == name else original(path)
+            ),
+        )
+        assert status()["cache"] == "miss"
+    monkeypatch.setattr(tool, "file_sha256", original)
+    assert status()["cache"] == "hit"
+
+    def denied(path, label):
+        if label == "cached report":
+            raise PermissionError("cache directory is not readable")
+        return original_object(path, label)
+
+    original_object = tool._object
+    monkeypatch.setattr(tool, "_object", denied)
+    with pytest.raises(PermissionError):
+        run(arguments)
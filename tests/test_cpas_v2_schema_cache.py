@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from jsonschema.exceptions import SchemaError
+
+from cpas.dka import DKA_SCHEMA, validate_record
+from cpas.schema_cache import (
+    SchemaValidatorCache,
+    schema_validator,
+    schema_validator_stats,
+    warm_schema_validators,
+)
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def example() -> dict:
+    return json.loads(
+        (ROOT / "examples/v2/dka-e-v2.example.json").read_text(encoding="utf-8")
+    )
+
+
+def test_repeated_validation_reuses_one_compiled_validator():
+    warm_schema_validators([DKA_SCHEMA])
+    before = schema_validator_stats()
+    record = example()
+    for _ in range(5):
+        validate_record(record)
+    after = schema_validator_stats()
+    assert after["misses"] == before["misses"]
+    assert after["hits"] - before["hits"] == 5
+    assert schema_validator(DKA_SCHEMA) is schema_validator(str(DKA_SCHEMA))
+
+
+def test_changed_schema_is_recompiled_and_touched_schema_is_not(tmp_path: Path):
+    cache = SchemaValidatorCache()
+    path = tmp_path / "sample.schema.json"
+    path.write_text(
+        json.dumps({"$schema": "https://json-schema.org/draft/2020-12/schema", "type": "object"}),
+        encoding="utf-8",
+    )
+    first = cache.validator(path)
+    assert cache.validator(path) is first
+    assert first.is_valid({})
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.validator(path) is first
+    assert cache.stats()["revalidations"] == 1
+
+    path.write_text(
+        json.dumps({"$schema": "https://json-schema.org/draft/2020-12/schema", "type": "array"}),
+        encoding="utf-8",
+    )
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+    second = cache.validator(path)
+    assert second is not first
+    assert not second.is_valid({})
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 2, 1)
+
+
+def test_warm_invalidate_and_invalid_schema_rejection(tmp_path: Path):
+    cache = SchemaValidatorCache()
+    expected = len(list((ROOT / "schemas").glob("*.schema.json")))
+    assert cache.warm() == expected
+    assert cache.stats()["misses"] == expected
+    assert cache.invalidate(DKA_SCHEMA) == 1
+    assert cache.invalidate() == expected - 1
+    assert cache.stats()["entries"] == 0
+
+    broken = tmp_path / "broken.schema.json"
+    broken.write_text(json.dumps({"type": "not-a-type"}), encoding="utf-8")
+    with pytest.raises(SchemaError):
+        cache.validator(broken)
+    assert cache.stats()["entries"] == 0
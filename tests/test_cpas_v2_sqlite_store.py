@@ -25,7 +25,8 @@ from cpas.dka_store import (
 )
 from cpas.provenance import DKA_SNAPSHOT_DIGEST_PROFILE
 from cpas.rehydrate import rehydrate
-from cpas.sqlite_dka_store import PROFILE_ID, SQLiteDKAStore
+import cpas.sqlite_dka_store as sqlite_store
+from cpas.sqlite_dka_store import PROFILE_ID, WAL_PROFILE_ID, SQLiteDKAStore
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -577,3 +578,646 @@ def test_rehydration_reports_store_access_denial_without_leaking_details(
             "reason": "access_denied",
         }
     ]
+
+
+def test_put_many_commits_a_same_branch_chain_in_one_transaction(
+    store: SQLiteDKAStore, admin: StoreContext
+):
+    base = example()
+    chain = [base]
+    for index in range(1, 4):
+        chain.append(
+            revise_record(
+                chain[-1],
+                {"title": f"Batched revision {index}"},
+                actor=admin.principal_id,
+                updated_at=f"2026-08-12T22:2{index}:00Z",
+                change_summary=f"batched revision {index}",
+            )
+        )
+    items = [
+        {
+            "record": record,
+            "expected_head": chain[index - 1]["integrity"]["digest"] if index else None,
+            "expected_head_profile": (
+                DKA_SNAPSHOT_DIGEST_PROFILE if index else None
+            ),
+        }
+        for index, record in enumerate(chain)
+    ]
+    report = store.put_many(items, context=admin, actor=admin.principal_id)
+    assert report["committed"] is True
+    assert [item["status"] for item in report["items"]] == ["committed"] * 4
+    assert report["items"][-1]["head"] == store.head(base["dka_id"], context=admin)
+    assert report["audit_sequences"] == {"first": 1, "last": 4}
+    assert store.history(base["dka_id"], context=admin) == chain
+    assert store.verify(context=admin)["events"] == 4
+
+
+def test_put_many_rolls_back_the_batch_and_reports_the_rejected_item(
+    store: SQLiteDKAStore, admin: StoreContext
+):
+    base = example()
+    revised = revise_record(
+        base,
+        {"title": "Never committed"},
+        actor=admin.principal_id,
+        updated_at="2026-08-12T22:30:00Z",
+        change_summary="batch rollback fixture",
+    )
+    report = store.put_many(
+        [
+            {"record": base, "expected_head": None},
+            {"record": revised, "expected_head": "sha256:" + "0" * 64},
+            {"record": revised, "expected_head": base["integrity"]["digest"]},
+        ],
+        context=admin,
+        actor=admin.principal_id,
+    )
+    assert report["committed"] is False
+    assert [item["status"] for item in report["items"]] == [
+        "rolled_back",
+        "rejected",
+        "not_attempted",
+    ]
+    assert report["items"][1]["error"]["code"] == "head_conflict"
+    assert store.head(base["dka_id"], context=admin) is None
+    assert store.audit_events(context=admin) == []
+
+    tampered = copy.deepcopy(base)
+    tampered["claim"] = "tampered after sealing"
+    invalid = store.put_many(
+        [
+            {"record": base, "expected_head": None},
+            {"record": tampered, "expected_head": None},
+        ],
+        context=admin,
+        actor=admin.principal_id,
+    )
+    assert [item["status"] for item in invalid["items"]] == ["not_attempted", "rejected"]
+    assert invalid["items"][1]["error"]["code"] == "corruption_detected"
+    with pytest.raises(AccessDenied, match="dka:write"):
+        store.put_many([], context=context("dka:read"))
+
+
+def test_pooled_connections_are_reused_bounded_and_reset_on_identity_change(
+    tmp_path: Path, admin: StoreContext
+):
+    pooled = SQLiteDKAStore(
+        tmp_path / "pooled.db",
+        tenant_id=TENANT,
+        local_filesystem=True,
+        busy_timeout_ms=5_000,
+        read_pool_size=2,
+    )
+    record = example()
+    pooled.put(record, expected_head=None, context=admin, actor=admin.principal_id)
+
+    def read(_: int) -> dict:
+        return pooled.get(record["dka_id"], context=admin)
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        results = list(executor.map(read, range(60)))
+    assert all(result == record for result in results)
+    status = pooled.pool_status(context=admin)
+    assert status["open_readers"] <= 2
+    assert status["connections_created"] <= 3
+    assert status["connections_reused"] >= 58
+    assert status["timeouts"] == 0
+
+    replacement = SQLiteDKAStore(
+        tmp_path / "replacement.db", tenant_id=TENANT, local_filesystem=True
+    )
+    os.replace(replacement.path, pooled.path)
+    with pytest.raises(ProfileViolation, match="identity changed"):
+        pooled.get(record["dka_id"], context=admin)
+    status = pooled.pool_status(context=admin)
+    assert status["identity_resets"] == 1
+    assert status["idle_readers"] == 0
+    with pytest.raises(AccessDenied, match="dka:verify"):
+        pooled.pool_status(context=context("dka:read"))
+    with pytest.raises(ValueError, match="read_pool_size"):
+        SQLiteDKAStore(
+            tmp_path / "invalid.db",
+            tenant_id=TENANT,
+            local_filesystem=True,
+            read_pool_size=0,
+        )
+
+
+def test_wal_variant_is_gated_on_builds_with_the_wal_reset_fix(tmp_path: Path):
+    fixed = sqlite_store._wal_reset_fixed
+    assert fixed((3, 51, 3)) and fixed((3, 52, 0)) and fixed((4, 0, 0))
+    assert fixed((3, 50, 7)) and fixed((3, 44, 6))
+    assert not fixed((3, 51, 2)) and not fixed((3, 50, 6)) and not fixed((3, 45, 0))
+    assert not fixed((3, 44, 5)) and not fixed((3, 40, 1))
+    if not fixed(sqlite3.sqlite_version_info):
+        with pytest.raises(ProfileViolation, match="WAL-reset fix"):
+            SQLiteDKAStore(
+                tmp_path / "wal.db",
+                tenant_id=TENANT,
+                local_filesystem=True,
+                profile_id=WAL_PROFILE_ID,
+            )
+    with pytest.raises(ProfileViolation, match="unknown SQLite store profile"):
+        SQLiteDKAStore(
+            tmp_path / "other.db",
+            tenant_id=TENANT,
+            local_filesystem=True,
+            profile_id="cpas-sqlite-memory-v1",
+        )
+
+
+def test_wal_variant_reads_during_writes_checkpoints_and_converts(
+    tmp_path: Path, admin: StoreContext, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(sqlite_store, "_wal_reset_fixed", lambda version: True)
+    wal = SQLiteDKAStore(
+        tmp_path / "wal.db",
+        tenant_id=TENANT,
+        local_filesystem=True,
+        busy_timeout_ms=100,
+        profile_id=WAL_PROFILE_ID,
+    )
+    record = example()
+    wal.put(record, expected_head=None, context=admin, actor=admin.principal_id)
+    status = wal.profile_status(context=admin)
+    assert (status["profile_id"], status["journal_mode"], status["synchronous"]) == (
+        WAL_PROFILE_ID,
+        "wal",
+        2,
+    )
+    assert status["wal_sidecars_private"] is True
+    assert status["conformant"] is True
+    with pytest.raises(ProfileViolation, match="profile_id mismatch"):
+        SQLiteDKAStore(wal.path, tenant_id=TENANT, local_filesystem=True)
+
+    writer = sqlite3.connect(wal.path, isolation_level=None)
+    try:
+        writer.execute("BEGIN EXCLUSIVE")
+        writer.execute("UPDATE metadata SET value=value WHERE key='tenant_id'")
+        assert wal.get(record["dka_id"], context=admin) == record
+        with pytest.raises(StoreBusy):
+            wal.put(
+                _variant(record, "blocked", "Blocked while the writer holds the lock."),
+                expected_head=None,
+                context=admin,
+            )
+        writer.execute("ROLLBACK")
+    finally:
+        writer.close()
+
+    checkpoint = wal.checkpoint("TRUNCATE", context=admin)
+    assert checkpoint["mode"] == "TRUNCATE" and checkpoint["completed"] is True
+    with pytest.raises(ValueError, match="checkpoint mode"):
+        wal.checkpoint("NOW", context=admin)
+    assert wal.verify(context=admin)["passed"] is True
+
+    rollback_backup = tmp_path / "rollback-backup.db"
+    backup = wal.backup(rollback_backup, context=admin, profile_id=PROFILE_ID)
+    assert backup["profile_id"] == PROFILE_ID
+    assert wal.audit_events(context=admin)[-1]["detail"]["profile_conversion"] == {
+        "from": WAL_PROFILE_ID,
+        "to": PROFILE_ID,
+    }
+    rollback = SQLiteDKAStore(rollback_backup, tenant_id=TENANT, local_filesystem=True)
+    assert rollback.get(record["dka_id"], context=admin) == record
+    assert rollback.verify(context=admin)["passed"] is True
+    rollback.close()
+    with pytest.raises(ProfileViolation, match="only for"):
+        rollback.checkpoint(context=admin)
+
+    restored = SQLiteDKAStore.restore_copy(
+        rollback_backup,
+        tmp_path / "restored-wal.db",
+        tenant_id=TENANT,
+        local_filesystem=True,
+        context=admin,
+        profile_id=WAL_PROFILE_ID,
+        source_profile_id=PROFILE_ID,
+    )
+    assert restored.get(record["dka_id"], context=admin) == record
+    assert restored.verify(context=admin)["profile"]["journal_mode"] == "wal"
+    assert restored.audit_events(context=admin)[-1]["detail"]["profile_conversion"] == {
+        "from": PROFILE_ID,
+        "to": WAL_PROFILE_ID,
+    }
+
+
+def test_cached_audit_tail_follows_commits_from_other_connections(
+    store: SQLiteDKAStore, admin: StoreContext
+):
+    record = example()
+    store.put(record, expected_head=None, context=admin, actor=admin.principal_id)
+    other = SQLiteDKAStore(store.path, tenant_id=TENANT, local_filesystem=True)
+    other.branch(
+        record["dka_id"],
+        source_branch="main",
+        target_branch="review",
+        actor=admin.principal_id,
+        updated_at="2026-08-12T22:00:00Z",
+        context=admin,
+    )
+    store.put(
+        _variant(record, "main", "Appended after another connection committed."),
+        expected_head=record["integrity"]["digest"],
+        context=admin,
+        actor=admin.principal_id,
+    )
+    sequences = [event["sequence"] for event in store.audit_events(context=admin)]
+    assert sequences == [1, 2, 3]
+    assert store.verify(context=admin)["passed"] is True
+
+
+
+def test_put_and_put_many_ignore_caller_mutation_before_the_write_transaction(
+    store: SQLiteDKAStore, admin: StoreContext
+):
+    single = example()
+    batched = _distinct(single, "batched")
+    expected = [copy.deepcopy(single), copy.deepcopy(batched)]
+    begin = store._write_transaction
+    prepared: list[dict] = []
+
+    def mutate_then_begin():
+        record = prepared.pop()
+        record["provenance"]["updated_at"] = "2030-01-01T00:00:00Z"
+        record["evolution"]["change_summary"] = "changed after preparation"
+        return begin()
+
+    store._write_transaction = mutate_then_begin
+    prepared.append(single)
+    store.put(single, expected_head=None, context=admin)
+    prepared.append(batched)
+    report = store.put_many(
+        [{"record": batched, "expected_head": None}], context=admin
+    )
+    assert report["committed"] is True
+    assert [
+        store.get(record["dka_id"], context=admin) for record in expected
+    ] == expected
+    assert store.verify(context=admin)["passed"] is True
+
+def test_per_dka_audit_reads_validate_from_the_persisted_checkpoint(
+    store: SQLiteDKAStore, admin: StoreContext
+):
+    first = example()
+    second = copy.deepcopy(first)
+    second["dka_id"] = first["dka_id"] + "-second"
+    second = seal_record(second)
+    store.put(first, expected_head=None, context=admin, actor=admin.principal_id)
+    store.put(second, expected_head=None, context=admin, actor=admin.principal_id)
+    assert store.record_audit_checkpoint(context=admin)["sequence"] == 2
+    store.put(
+        _variant(first, "main", "Written after the checkpoint."),
+        expected_head=first["integrity"]["digest"],
+        context=admin,
+        actor=admin.principal_id,
+    )
+    assert store.verify(context=admin, checkpoint=True)["audit_checkpoint"]["sequence"] == 3
+    assert [event["sequence"] for event in store.events(first["dka_id"], context=admin)] == [1, 3]
+
+    connection = sqlite3.connect(store.path)
+    event = json.loads(
+        connection.execute(
+            "SELECT event_json FROM audit_events WHERE sequence=2"
+        ).fetchone()[0]
+    )
+    event["request"]["purpose"] = "rewritten"
+    connection.execute(
+        "UPDATE audit_events SET event_json=? WHERE sequence=2", (json.dumps(event),)
+    )
+    connection.commit()
+    assert len(store.events(first["dka_id"], context=admin)) == 2
+    with pytest.raises(CorruptionDetected, match="digest"):
+        store.events(second["dka_id"], context=admin)
+    with pytest.raises(CorruptionDetected, match="digest"):
+        store.verify(context=admin)
+
+    connection.execute(
+        "UPDATE metadata SET value='sha256:' || hex(zeroblob(32)) "
+        "WHERE key='audit_checkpoint_digest'"
+    )
+    connection.commit()
+    connection.close()
+    with pytest.raises(CorruptionDetected, match="checkpoint"):
+        store.events(first["dka_id"], context=admin)
+
+
+def test_verify_does_not_move_the_audit_checkpoint_without_permission(
+    store: SQLiteDKAStore, admin: StoreContext
+):
+    record = example()
+    store.put(record, expected_head=None, context=admin, actor=admin.principal_id)
+    assert store.record_audit_checkpoint(context=admin)["sequence"] == 1
+    store.put(
+        _variant(record, "main", "Written after the checkpoint."),
+        expected_head=record["integrity"]["digest"],
+        context=admin,
+        actor=admin.principal_id,
+    )
+
+    verifier = context("dka:verify")
+    report = store.verify(context=verifier)
+    assert report["audit_tail"]["sequence"] == 2
+    assert report["audit_checkpoint"] is None
+    with pytest.raises(AccessDenied, match="dka:checkpoint"):
+        store.verify(context=verifier, checkpoint=True)
+    with pytest.raises(AccessDenied, match="dka:checkpoint"):
+        store.record_audit_checkpoint(context=verifier)
+    assert store.verify(context=verifier, incremental=True)["events"] == 1
+
+    checkpointer = context("dka:verify", "dka:checkpoint")
+    assert store.verify(context=checkpointer, checkpoint=True)["audit_checkpoint"][
+        "sequence"
+    ] == 2
+    assert store.verify(context=verifier, incremental=True)["events"] == 0
+
+
+def _distinct(base: dict, suffix: str) -> dict:
+    candidate = copy.deepcopy(base)
+    candidate["dka_id"] = f"{base['dka_id']}-{suffix}"
+    return seal_record(candidate)
+
+
+def test_incremental_verify_covers_only_dkas_touched_after_the_checkpoint(
+    store: SQLiteDKAStore, admin: StoreContext
+):
+    base = example()
+    for suffix in ("a", "b"):
+        store.put(_distinct(base, suffix), expected_head=None, context=admin)
+    full = store.verify(context=admin, checkpoint=True)
+    assert (full["mode"], full["dkas"], full["snapshots"]) == ("full", 2, 2)
+    assert full["rows"] == 6 and full["rows_per_second"] > 0
+    assert full["audit_checkpoint"]["sequence"] == 2
+
+    added = _distinct(base, "c")
+    store.put(added, expected_head=None, context=admin)
+    incremental = store.verify(context=admin, incremental=True, checkpoint=True)
+    assert incremental["mode"] == "incremental"
+    assert (incremental["dkas"], incremental["events"]) == (1, 1)
+    assert incremental["sqlite_integrity"] == "not-run"
+    assert incremental["audit_checkpoint"]["sequence"] == 3
+
+    store.put(
+        _variant(added, "main", "Tampered after the checkpoint."),
+        expected_head=added["integrity"]["digest"],
+        context=admin,
+    )
+    connection = sqlite3.connect(store.path)
+    payload = json.loads(
+        connection.execute(
+            "SELECT payload_json FROM snapshots WHERE revision=2"
+        ).fetchone()[0]
+    )
+    payload["claim"] = "rewritten without resealing"
+    connection.execute(
+        "UPDATE snapshots SET payload_json=? WHERE revision=2", (json.dumps(payload),)
+    )
+    connection.commit()
+    connection.close()
+    with pytest.raises(CorruptionDetected, match="digest"):
+        store.verify(context=admin, incremental=True)
+
+
+def test_verify_splits_into_disjoint_ranges_and_worker_processes(
+    store: SQLiteDKAStore, admin: StoreContext
+):
+    base = example()
+    for suffix in ("a", "b", "c", "d"):
+        store.put(_distinct(base, suffix), expected_head=None, context=admin)
+    ranges = store.verification_ranges(3, context=admin)
+    assert ranges[0][0] is None and ranges[-1][1] is None
+    assert all(left[1] == right[0] for left, right in zip(ranges, ranges[1:]))
+    reports = [store.verify(context=admin, dka_range=bounds) for bounds in ranges]
+    assert sum(report["dkas"] for report in reports) == 4
+    assert {report["audit_chain"] for report in reports} == {"not-run"}
+    assert all(report["audit_checkpoint"] is None for report in reports)
+
+    parallel = store.verify(context=admin, workers=2)
+    assert (parallel["dkas"], parallel["snapshots"], parallel["events"]) == (4, 4, 4)
+    assert parallel["workers"] == 2
+    with pytest.raises(ValueError, match="dka_range"):
+        store.verify(context=admin, dka_range=(None, None), workers=2)
+
+
+def test_get_many_resolves_refs_on_one_checkout_and_keeps_errors_per_ref(
+    store: SQLiteDKAStore, admin: StoreContext
+):
+    public = example()
+    store.put(public, expected_head=None, context=admin)
+    revised = _variant(public, "main", "Second public revision.")
+    store.put(revised, expected_head=public["integrity"]["digest"], context=admin)
+    sensitive = _distinct(public, "restricted")
+    sensitive["access"] = {
+        "classification": "restricted",
+        "policy_ref": "policy:restricted-conformance",
+    }
+    sensitive = seal_record(sensitive)
+    store.put(sensitive, expected_head=None, context=admin)
+
+    reader = context("dka:read")
+    before = store.pool_status(context=admin)["checkouts"]
+    results = store.get_many(
+        [
+            {"dka_id": public["dka_id"]},
+            {"dka_id": public["dka_id"], "revision": 1},
+            {"dka_id": "missing-dka"},
+            {"dka_id": sensitive["dka_id"]},
+            {"branch": "main"},
+        ],
+        context=reader,
+    )
+    assert store.pool_status(context=admin)["checkouts"] - before == 1
+    assert [item["index"] for item in results] == [0, 1, 2, 3, 4]
+    assert results[0]["record"] == revised
+    assert results[1]["record"] == public
+    assert [item["status"] for item in results] == [
+        "found",
+        "found",
+        "error",
+        "error",
+        "error",
+    ]
+    assert results[2]["error"]["code"] == "record_not_found"
+    assert results[3]["error"]["code"] == "access_denied"
+    assert results[4]["error"]["code"] == "invalid_reference"
+
+    manifest = rehydrate(
+        store,
+        [{"dka_id": public["dka_id"]}, {"dka_id": sensitive["dka_id"]}, {"dka_id": 7}],
+        context=reader,
+        authorize=lambda _: True,
+        stale_policy="allow",
+    )
+    assert [item["dka_id"] for item in manifest["included"]] == [public["dka_id"]]
+    assert [item["reason"] for item in manifest["omitted"]] == [
+        "access_denied",
+        "retrieval_failed",
+    ]
+    with pytest.raises(AccessDenied):
+        store.get_many([{"dka_id": public["dka_id"]}], context=context("dka:audit"))
+
+
+def test_rehydration_stops_retrieving_at_the_budget_and_honours_priority(
+    store: SQLiteDKAStore, admin: StoreContext, monkeypatch: pytest.MonkeyPatch
+):
+    base = example()
+    records = [_distinct(base, suffix) for suffix in ("low", "top", "mid")]
+    for record in records:
+        store.put(record, expected_head=None, context=admin)
+    refs = [
+        {"dka_id": record["dka_id"], "weight": weight}
+        for record, weight in zip(records, (1, 3, 2))
+    ]
+
+    before = store.pool_status(context=admin)["checkouts"]
+    manifest = rehydrate(
+        store,
+        refs,
+        context=admin,
+        authorize=lambda _: True,
+        stale_policy="allow",
+        max_items=1,
+        priority=lambda ref: ref["weight"],
+    )
+    assert store.pool_status(context=admin)["checkouts"] - before == 1
+    assert manifest["ordering"] == "priority"
+    assert manifest["budget"]["refs_retrieved"] == 1
+    assert [item["dka_id"] for item in manifest["included"]] == [records[1]["dka_id"]]
+    assert [(item["dka_id"], item["reason"]) for item in manifest["omitted"]] == [
+        (records[2]["dka_id"], "item_budget_exceeded"),
+        (records[0]["dka_id"], "item_budget_exceeded"),
+    ]
+
+    size = manifest["included"][0]["bytes"]
+    canonicalized = []
+    original = rehydrate.__globals__["canonicalize_json"]
+
+    def counting(value, **kwargs):
+        if isinstance(value, dict) and isinstance(value.get("record"), dict):
+            canonicalized.append(value["record"]["dka_id"])
+        return original(value, **kwargs)
+
+    monkeypatch.setitem(rehydrate.__globals__, "canonicalize_json", counting)
+    tight = rehydrate(
+        store,
+        refs,
+        context=admin,
+        authorize=lambda _: True,
+        stale_policy="allow",
+        max_bytes=size - 1,
+    )
+    assert tight["included"] == []
+    assert {item["reason"] for item in tight["omitted"]} == {"byte_budget_exceeded"}
+    assert tight["budget"]["refs_retrieved"] == 3
+    assert canonicalized == []
+    exact = rehydrate(
+        store,
+        refs[1:2],
+        context=admin,
+        authorize=lambda _: True,
+        stale_policy="allow",
+        max_bytes=size,
+    )
+    assert exact["budget"]["used_bytes"] == size
+    assert canonicalized == [records[1]["dka_id"]]
+
+
+def test_iter_history_streams_a_revision_range_in_keyset_pages(
+    store: SQLiteDKAStore, admin: StoreContext, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(sqlite_store, "_HISTORY_PAGE_ROWS", 2)
+    chain = [example()]
+    store.put(chain[0], expected_head=None, context=admin)
+    for index in range(1, 5):
+        chain.append(
+            revise_record(
+                chain[-1],
+                {"title": f"Streamed revision {index}"},
+                actor=admin.principal_id,
+                updated_at=f"2026-08-13T09:0{index}:00Z",
+                change_summary=f"streamed revision {index}",
+            )
+        )
+        store.put(
+            chain[-1], expected_head=chain[-2]["integrity"]["digest"], context=admin
+        )
+
+    assert store.history(chain[0]["dka_id"], context=admin) == chain
+    before = store.pool_status(context=admin)
+    window = store.iter_history(
+        chain[0]["dka_id"],
+        since_revision=2,
+        until_revision=4,
+        newest_first=True,
+        context=admin,
+    )
+    assert next(window) == chain[3]
+    assert store.pool_status(context=admin)["idle_readers"] == before["idle_readers"]
+    assert list(window) == [chain[2], chain[1]]
+    assert store.pool_status(context=admin)["checkouts"] - before["checkouts"] == 2
+
+    partial = store.iter_history(chain[0]["dka_id"], since_revision=4, context=admin)
+    assert next(partial) == chain[3]
+    partial.close()
+    assert store.pool_status(context=admin)["idle_readers"] == before["idle_readers"]
+
+    with pytest.raises(ValueError, match="since_revision"):
+        store.iter_history(chain[0]["dka_id"], since_revision=0, context=admin)
+    with pytest.raises(AccessDenied):
+        store.iter_history(chain[0]["dka_id"], context=context("dka:audit"))
+
+    connection = sqlite3.connect(store.path)
+    payload = json.loads(
+        connection.execute(
+            "SELECT payload_json FROM snapshots WHERE revision=3"
+        ).fetchone()[0]
+    )
+    payload["title"] = "tampered without resealing"
+    connection.execute(
+        "UPDATE snapshots SET payload_json=? WHERE revision=3", (json.dumps(payload),)
+    )
+    connection.commit()
+    connection.close()
+    lazy = store.iter_history(chain[0]["dka_id"], context=admin)
+    assert [next(lazy), next(lazy)] == chain[:2]
+    with pytest.raises(CorruptionDetected):
+        next(lazy)
+
+
+def test_paused_history_iterators_hold_no_reader_or_read_lock(
+    store: SQLiteDKAStore, admin: StoreContext, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(sqlite_store, "_HISTORY_PAGE_ROWS", 1)
+    chain = [example()]
+    store.put(chain[0], expected_head=None, context=admin)
+    for index in range(1, 3):
+        chain.append(
+            revise_record(
+                chain[-1],
+                {"title": f"Paged revision {index}"},
+                actor=admin.principal_id,
+                updated_at=f"2026-08-13T10:0{index}:00Z",
+                change_summary=f"paged revision {index}",
+            )
+        )
+        store.put(
+            chain[-1], expected_head=chain[-2]["integrity"]["digest"], context=admin
+        )
+
+    paused = [store.iter_history(chain[0]["dka_id"], context=admin) for _ in range(6)]
+    assert [next(iterator) for iterator in paused] == [chain[0]] * 6
+    assert store.pool_status(context=admin)["read_pool_size"] < len(paused)
+
+    chain.append(
+        revise_record(
+            chain[-1],
+            {"title": "Written while iterators are paused"},
+            actor=admin.principal_id,
+            updated_at="2026-08-13T10:09:00Z",
+            change_summary="write during paused iteration",
+        )
+    )
+    store.put(chain[-1], expected_head=chain[-2]["integrity"]["digest"], context=admin)
+    assert all(list(iterator) == chain[1:] for iterator in paused)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import copy
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from cpas.provenance import file_sha256, verify_many
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def example() -> dict:
+    return json.loads(
+        (ROOT / "examples/v2/dka-e-v2.example.json").read_text(encoding="utf-8")
+    )
+
+
+def test_verify_many_keeps_order_and_reports_each_failure():
+    record = example()
+    tampered = copy.deepcopy(record)
+    tampered["claim"] = "tampered without resealing"
+    artifacts = [record, tampered, "not-a-record", record]
+
+    sequential = verify_many(artifacts, kind="dka")
+    parallel = verify_many(artifacts, kind="dka", workers=2, chunksize=1)
+    assert parallel == sequential
+    assert [item["index"] for item in sequential] == [0, 1, 2, 3]
+    assert [item["verified"] for item in sequential] == [True, False, False, True]
+    assert "error" not in sequential[1]
+    assert sequential[2]["error"]["type"] == "AttributeError"
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        shared = verify_many(artifacts, kind="dka", chunksize=3, executor=executor)
+    assert shared == sequential
+
+    with pytest.raises(ValueError, match="unsupported verification kind"):
+        verify_many([record], kind="unknown")
+    with pytest.raises(ValueError, match="chunksize"):
+        verify_many([record], kind="dka", chunksize=0)
+
+
+def test_verify_many_checks_seed_tokens_and_files(tmp_path: Path):
+    token = json.loads(
+        (ROOT / "examples/v2/seed-token-v2.example.json").read_text(encoding="utf-8")
+    )
+    assert verify_many([token], kind="seed-token") == [{"index": 0, "verified": True}]
+
+    artifact = tmp_path / "artifact.txt"
+    artifact.write_text("reviewed content\n", encoding="utf-8")
+    results = verify_many(
+        [
+            {"path": str(artifact), "digest": file_sha256(artifact)},
+            {"path": str(artifact), "digest": "sha256:" + "0" * 64},
+            {"path": str(tmp_path / "missing.txt"), "digest": "sha256:" + "0" * 64},
+        ],
+        kind="file",
+    )
+    assert [item["verified"] for item in results] == [True, False, False]
+    assert results[2]["error"]["type"] == "FileNotFoundError"
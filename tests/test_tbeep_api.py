@@ -29,3 +29,420 @@ def test_missing_thread_token():
     MESSAGE_STORE.clear()
     res = client.post("/api/v1/messages", json={"content": "x"})
     assert res.status_code == 400
+
+
+def test_sqlite_store_commits_each_request_and_shares_the_file(tmp_path):
+    from api.tbeep_api import SQLiteMessageStore, set_message_store
+
+    path = tmp_path / "messages.db"
+    store = SQLiteMessageStore(path)
+    worker = SQLiteMessageStore(path)  # a second worker on the same file
+    previous = set_message_store(store)
+    try:
+        client = app.test_client()
+        first = {"threadToken": "#DB_001.0", "timestamp": "2025-01-01T00:00:00Z", "content": "a"}
+        second = {"threadToken": "#DB_001.0", "timestamp": "2025-01-01T00:00:01Z", "content": "b"}
+        other = {"threadToken": "#DB_002.0", "content": "c"}
+        assert client.post("/api/v1/messages", json=first).status_code == 201
+        assert store.messages("#DB_001.0") == [first]
+        assert worker.messages("#DB_001.0") == [first]
+        # The first store holds no write lock between requests.
+        worker.append(second)
+        assert client.post("/api/v1/messages", json=other).status_code == 201
+        assert client.post("/api/v1/messages", json={"threadToken": 7}).status_code == 400
+    finally:
+        set_message_store(previous)
+        store.close()
+        worker.close()
+
+    reopened = SQLiteMessageStore(path)
+    try:
+        assert reopened.messages("#DB_001.0") == [first, second]
+        assert reopened.messages("#DB_002.0") == [other]
+    finally:
+        reopened.close()
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_cursor_pagination_and_filters(tmp_path, backend):
+    from api.tbeep_api import InMemoryMessageStore, SQLiteMessageStore, set_message_store
+
+    store = (
+        InMemoryMessageStore()
+        if backend == "memory"
+        else SQLiteMessageStore(tmp_path / "messages.db")
+    )
+    previous = set_message_store(store)
+    try:
+        client = app.test_client()
+        sent = [
+            {
+                "threadToken": "#PAGE_001.0",
+                "instance": "Lumin" if index % 2 else "Telos",
+                "timestamp": f"2025-01-01T00:00:0{index}Z",
+                "content": str(index),
+            }
+            for index in range(5)
+        ]
+        client.post("/api/v1/messages", json={"threadToken": "#PAGE_002.0"})
+        for message in sent:
+            client.post("/api/v1/messages", json=message)
+
+        def page(**args):
+            res = client.get(
+                "/api/v1/messages", query_string={"thread_id": "#PAGE_001.0", **args}
+            )
+            assert res.status_code == 200
+            return res
+
+        first = page(limit=2)
+        assert first.get_json() == sent[:2]
+        assert first.headers["X-Has-More"] == "true"
+        assert "after=" + first.headers["X-Next-Cursor"] in first.headers["Link"]
+        second = page(limit=2, after=first.headers["X-Next-Cursor"])
+        assert second.get_json() == sent[2:4]
+        third = page(limit=2, after=second.headers["X-Next-Cursor"])
+        assert third.get_json() == sent[4:]
+        assert third.headers["X-Has-More"] == "false"
+        assert "Link" not in third.headers
+        idle = page(after=third.headers["X-Next-Cursor"])
+        assert idle.get_json() == []
+        assert idle.headers["X-Next-Cursor"] == third.headers["X-Next-Cursor"]
+
+        client.post("/api/v1/messages", json=dict(sent[0], content="late"))
+        late = page(after=third.headers["X-Next-Cursor"])
+        assert [m["content"] for m in late.get_json()] == ["late"]
+
+        ranged = page(since="2025-01-01T00:00:01Z", until="2025-01-01T00:00:04Z")
+        assert ranged.get_json() == sent[1:4]
+        assert page(instance="Lumin").get_json() == [sent[1], sent[3]]
+        assert page(instance="Telos", limit=1, after=first.headers["X-Next-Cursor"]).get_json() == [sent[2]]
+        for bad in ({"limit": "0"}, {"limit": "x"}, {"after": "-1"}):
+            res = client.get(
+                "/api/v1/messages", query_string={"thread_id": "#PAGE_001.0", **bad}
+            )
+            assert res.status_code == 400
+    finally:
+        set_message_store(previous)
+        store.close()
+
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_timestamp_bounds_compare_mixed_formats_in_utc(tmp_path, backend):
+    from api.tbeep_api import InMemoryMessageStore, SQLiteMessageStore, set_message_store
+
+    store = (
+        InMemoryMessageStore()
+        if backend == "memory"
+        else SQLiteMessageStore(tmp_path / "messages.db")
+    )
+    previous = set_message_store(store)
+    try:
+        client = app.test_client()
+        stamps = [
+            "2026-01-01T00:00:00.5",  # naive isoformat(), as in epistemic_fingerprint
+            "2026-01-01T01:30:00+01:00",
+            "2026-01-01T00:10:00Z",
+            None,
+            "not a time",
+        ]
+        for index, stamp in enumerate(stamps):
+            message = {"threadToken": "#TIME_001.0", "content": str(index)}
+            if stamp is not None:
+                message["timestamp"] = stamp
+            client.post("/api/v1/messages", json=message)
+
+        def contents(**bounds):
+            res = client.get(
+                "/api/v1/messages", query_string={"thread_id": "#TIME_001.0", **bounds}
+            )
+            assert res.status_code == 200
+            return [m["content"] for m in res.get_json()]
+
+        assert contents(since="2026-01-01T00:00:00Z") == ["0", "1", "2"]
+        assert contents(since="2026-01-01T00:00:00Z", until="2026-01-01T00:30:00Z") == [
+            "0",
+            "2",
+        ]
+        assert contents(since="2026-01-01T00:00:00.500+00:00") == ["0", "1", "2"]
+        assert contents(since="2026-01-01T00:00:00.6Z") == ["1", "2"]
+        assert contents(until="2026-01-01T00:30:00+00:00") == ["0", "2"]
+        for bad in ({"since": "yesterday"}, {"until": "2026-13-01T00:00:00Z"}):
+            res = client.get(
+                "/api/v1/messages", query_string={"thread_id": "#TIME_001.0", **bad}
+            )
+            assert res.status_code == 400
+            assert "ISO 8601" in res.get_json()["error"]
+    finally:
+        set_message_store(previous)
+        store.close()
+
+
+def test_sqlite_store_backfills_utc_timestamps_in_existing_databases(tmp_path):
+    import sqlite3
+
+    from api.tbeep_api import MessageQuery, SQLiteMessageStore
+
+    path = tmp_path / "messages.db"
+    old = [
+        {"threadToken": "#OLD_001.0", "timestamp": "2026-01-01T00:00:00.5"},
+        {"threadToken": "#OLD_001.0", "timestamp": "2026-01-01T01:30:00+01:00"},
+        {"threadToken": "#OLD_001.0"},
+    ]
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE messages (seq INTEGER PRIMARY KEY AUTOINCREMENT, "
+        "thread_token TEXT NOT NULL, timestamp TEXT, payload_json TEXT NOT NULL)"
+    )
+    connection.executemany(
+        "INSERT INTO messages(thread_token, timestamp, payload_json) VALUES (?, ?, ?)",
+        [(m["threadToken"], m.get("timestamp"), json.dumps(m)) for m in old],
+    )
+    connection.commit()
+    connection.close()
+
+    store = SQLiteMessageStore(path)
+    try:
+        page = store.page(
+            "#OLD_001.0",
+            MessageQuery(since="2026-01-01T00:00:00.000000Z", until="2026-01-01T00:30:00.000000Z"),
+        )
+        assert page.messages == old[:1]
+        assert store.messages("#OLD_001.0") == old
+    finally:
+        store.close()
+
+def test_batch_endpoint_reports_per_item_status():
+    client = app.test_client()
+    MESSAGE_STORE.clear()
+    messages = [
+        {"threadToken": "#BATCH_001.0", "content": "a"},
+        {"content": "no thread"},
+        {"threadToken": "#BATCH_001.0", "content": "b"},
+    ]
+    res = client.post("/api/v1/messages:batch", json=messages)
+    assert res.status_code == 207
+    body = res.get_json()
+    assert body["stored"] == 2
+    assert [item["status"] for item in body["results"]] == ["stored", "rejected", "stored"]
+    assert body["results"][1]["error"] == "threadToken missing"
+    assert MESSAGE_STORE["#BATCH_001.0"] == [messages[0], messages[2]]
+
+    assert client.post("/api/v1/messages:batch", json=messages[:1]).status_code == 201
+    assert client.post("/api/v1/messages:batch", json=[{"x": 1}]).status_code == 400
+    assert client.post("/api/v1/messages:batch", json={"threadToken": "#T"}).status_code == 400
+    assert client.post("/api/v1/messages:batch", json=[]).status_code == 400
+
+
+def test_message_batcher_coalesces_helper_calls():
+    from types import SimpleNamespace
+
+    from cpas_autogen.eep_utils import (
+        MessageBatcher,
+        broadcast_state,
+        request_validation,
+        start_collab_session,
+    )
+
+    client = app.test_client()
+    MESSAGE_STORE.clear()
+    requests_sent = []
+
+    class Session:
+        def post(self, url, *, json, timeout):
+            requests_sent.append(json)
+            body = client.post(url, json=json).get_json()
+            return SimpleNamespace(json=lambda: body)
+
+    agent = SimpleNamespace(idp_metadata={"instance_name": "Unit"}, seed_token=None)
+    with MessageBatcher("/api/v1/messages:batch", window=60, session=Session()) as batcher:
+        agent.eep_batcher = batcher
+        assert start_collab_session(agent, ["Lumin"], thread_token="#EEP_001.0", topic="t")
+        assert request_validation(agent, "claim", thread_token="#EEP_001.0")
+        assert broadcast_state(agent, {"k": 1}, thread_token="#EEP_001.0")
+        pending = batcher.submit({"content": "no thread"})
+        assert requests_sent == []
+    assert len(requests_sent) == 1
+    assert pending.result(timeout=1)["status"] == "rejected"
+    stored = MESSAGE_STORE["#EEP_001.0"]
+    assert [m["type"] for m in stored] == ["collab_session", "validation_request", "state_broadcast"]
+
+    with MessageBatcher("/api/v1/messages:batch", max_batch=2, window=60, session=Session()) as batcher:
+        first = batcher.submit({"threadToken": "#EEP_002.0"})
+        second = batcher.submit({"threadToken": "#EEP_002.0"})
+        assert first.result(timeout=1) == {"index": 0, "status": "stored"}
+        assert second.done()
+    assert len(requests_sent) == 2
+
+
+def test_thread_stream_pushes_new_messages_and_resumes_from_last_event_id():
+    import threading
+    from urllib.parse import quote
+
+    client = app.test_client()
+    MESSAGE_STORE.clear()
+    url = "/api/v1/threads/" + quote("#SSE_001.0", safe="") + "/stream"
+    first = {"threadToken": "#SSE_001.0", "content": "a"}
+    second = {"threadToken": "#SSE_001.0", "content": "b"}
+    client.post("/api/v1/messages", json=first)
+    client.post("/api/v1/messages", json={"threadToken": "#SSE_002.0"})
+
+    def events(response):
+        for chunk in response.response:
+            text = chunk.decode("utf-8")
+            if text.startswith("id:"):
+                lines = dict(line.split(": ", 1) for line in text.strip().split("\n"))
+                yield lines["id"], json.loads(lines["data"])
+
+    res = client.get(url, buffered=False)
+    assert res.mimetype == "text/event-stream"
+    stream = events(res)
+    event_id, message = next(stream)
+    assert message == first
+    timer = threading.Timer(0.05, client.post, ("/api/v1/messages",), {"json": second})
+    timer.start()
+    assert next(stream) == (str(int(event_id) + 1), second)
+    res.close()
+    timer.join()
+
+    resumed = client.get(url, headers={"Last-Event-ID": event_id}, buffered=False)
+    assert next(events(resumed)) == (str(int(event_id) + 1), second)
+    resumed.close()
+    assert client.get(url, headers={"Last-Event-ID": "x"}).status_code == 400
+
+
+def test_eep_client_dispatches_in_background_with_retries():
+    import threading
+    from types import SimpleNamespace
+
+    from cpas_autogen.eep_utils import EEPClient, broadcast_state
+
+    client = app.test_client()
+    MESSAGE_STORE.clear()
+    calls = []
+    entered = threading.Event()
+    release = threading.Event()
+
+    class Session:
+        failures = 1
+
+        def post(self, url, *, json, timeout):
+            entered.set()
+            release.wait(timeout=5)
+            calls.append((url, json))
+            if self.failures:
+                self.failures -= 1
+                return SimpleNamespace(status_code=503, json=lambda: {})
+            res = client.post(url, json=json)
+            body = res.get_json()
+            return SimpleNamespace(status_code=res.status_code, json=lambda: body)
+
+        def close(self):
+            pass
+
+    agent = SimpleNamespace(idp_metadata={"instance_name": "Unit"}, seed_token=None)
+    eep = EEPClient("/api/v1/messages", session=Session(), queue_size=3, backoff=0)
+    agent.eep_client = eep
+    assert broadcast_state(agent, {"n": 1}, thread_token="#CLIENT_001.0")
+    # The worker now holds message 1 inside post(); 2-4 fill the queue.
+    assert entered.wait(timeout=5)
+    for n in (2, 3, 4):
+        assert broadcast_state(agent, {"n": n}, thread_token="#CLIENT_001.0")
+    assert broadcast_state(agent, {"n": 5}, thread_token="#CLIENT_001.0") is False
+    assert calls == []
+    release.set()
+    assert eep.flush(timeout=5)
+    stored = [m["state"]["n"] for m in MESSAGE_STORE["#CLIENT_001.0"]]
+    assert stored == [1, 2, 3, 4]
+    assert [url for url, _ in calls] == [
+        "/api/v1/messages",
+        "/api/v1/messages",
+        "/api/v1/messages:batch",
+    ]
+    assert [m["state"]["n"] for m in calls[2][1]] == [2, 3, 4]
+    stats = eep.stats()
+    assert (stats["sent"], stats["dropped"], stats["retried"], stats["failed"]) == (
+        4,
+        1,
+        1,
+        0,
+    )
+
+    assert eep.send({"content": "no thread"}) is False
+    assert eep.stats()["failed"] == 1
+    assert eep.close(timeout=5)
+    with pytest.raises(RuntimeError):
+        eep.submit({"threadToken": "#CLIENT_001.0"})
+
+
+def test_eep_client_retries_only_requests_the_api_never_received():
+    from types import SimpleNamespace
+
+    import requests
+    from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+    from cpas_autogen.eep_utils import EEPClient
+
+    refused = requests.ConnectionError(
+        MaxRetryError(None, "/api/v1/messages", NewConnectionError(None, "refused"))
+    )
+    outcomes = {
+        "refused": [refused, SimpleNamespace(status_code=201)],
+        "connect-timeout": [requests.ConnectTimeout(), SimpleNamespace(status_code=201)],
+        "429": [SimpleNamespace(status_code=429), SimpleNamespace(status_code=201)],
+        "503": [SimpleNamespace(status_code=503), SimpleNamespace(status_code=201)],
+        "read-timeout": [requests.ReadTimeout(), SimpleNamespace(status_code=201)],
+        "reset": [requests.ConnectionError("aborted"), SimpleNamespace(status_code=201)],
+        "500": [SimpleNamespace(status_code=500), SimpleNamespace(status_code=201)],
+        "502": [SimpleNamespace(status_code=502), SimpleNamespace(status_code=201)],
+        "504": [SimpleNamespace(status_code=504), SimpleNamespace(status_code=201)],
+    }
+    retried = {"refused", "connect-timeout", "429", "503"}
+    for name, answers in outcomes.items():
+        posts = []
+
+        class Session:
+            def post(self, url, *, json, timeout):
+                posts.append(json)
+                answer = answers[len(posts) - 1]
+                if isinstance(answer, Exception):
+                    raise answer
+                return answer
+
+            def close(self):
+                pass
+
+        eep = EEPClient("/api/v1/messages", session=Session(), backoff=0)
+        assert eep.send({"threadToken": "#RETRY"}) is (name in retried), name
+        assert len(posts) == (2 if name in retried else 1), name
+        assert eep.close()
+
+
+def test_eep_client_never_posts_the_stop_sentinel():
+    import threading
+    from types import SimpleNamespace
+
+    from cpas_autogen.eep_utils import _STOP, EEPClient
+
+    bodies = []
+
+    class Session:
+        def post(self, url, *, json, timeout):
+            bodies.append(json)
+            return SimpleNamespace(status_code=201, json=lambda: {"stored": 2})
+
+        def close(self):
+            pass
+
+    eep = EEPClient("/api/v1/messages", session=Session())
+    # A message that raced close() can land behind the sentinel.
+    for item in ({"n": 1}, _STOP, {"n": 2}):
+        eep._queue.put_nowait(item)
+    worker = threading.Thread(target=eep._run, daemon=True)
+    worker.start()
+    worker.join(timeout=5)
+    assert not worker.is_alive()
+    assert bodies == [[{"n": 1}, {"n": 2}]]
+    assert eep._queue.unfinished_tasks == 0
+    assert eep.close()
@@ -7,9 +7,11 @@ from pathlib import Path
 
 import pytest
 
+from cpas.provenance import file_sha256
 from tools.validate_cpas_v2 import (
     ValidationFailure,
     require_file_digest,
+    require_file_digests,
     validate_local_links,
     validate_repository,
 )
@@ -41,6 +43,19 @@ def test_cross_file_digest_mismatch_is_rejected(tmp_path):
         )
 
 
+def test_batched_file_digests_report_the_first_mismatch_in_order(tmp_path):
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (tmp_path / name).write_text(f"{name}\n", encoding="utf-8")
+    references = [
+        ("a.txt", file_sha256(tmp_path / "a.txt"), "first"),
+        ("b.txt", "sha256:" + "0" * 64, "second"),
+        ("c.txt", "sha256:" + "1" * 64, "third"),
+    ]
+    assert require_file_digests(tmp_path, references[:1], workers=2) == 1
+    with pytest.raises(ValidationFailure, match="second: digest mismatch for b.txt"):
+        require_file_digests(tmp_path, references, workers=2)
+
+
 def test_broken_modernization_link_is_rejected(tmp_path):
     document = tmp_path / "index.md"
     document.write_text("[missing](not-present.md)\n", encoding="utf-8")
@@ -1,13 +1,21 @@
 #!/usr/bin/env python3
-"""Compare two CPAS runtime transcripts under a versioned evaluation manifest."""
+"""Compare CPAS runtime transcripts under a versioned evaluation manifest.
+
+Repeat ``--candidate`` with ``--output-dir`` to compare one baseline against a
+shortlist: the baseline is replayed once, one sealed report is written per
+candidate, and a ranking summary is printed and written beside them.
+"""
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Sequence
 
@@ -16,12 +24,22 @@ REPOSITORY_ROOT = Path(__file__).resolve().parents[1]
 if str(REPOSITORY_ROOT) not in sys.path:
     sys.path.insert(0, str(REPOSITORY_ROOT))
 
+import cpas.evaluation  # noqa: E402
 from cpas.evaluation import (  # noqa: E402
+    EvaluationError,
+    compare_runtime_candidates,
     compare_runtime_transcripts,
+    load_transcript,
+    summarize_candidate_reports,
     validate_manifest,
-    validate_transcript,
+    verify_report_integrity,
+)
+from cpas.provenance import (  # noqa: E402
+    JCS_CANONICALIZATION,
+    canonicalize_json,
+    file_sha256,
+    load_json,
 )
-from cpas.provenance import load_json  # noqa: E402
 from cpas.runtime import TranscriptRuntimeAdapter  # noqa: E402
 
 
@@ -29,7 +47,13 @@ def parser() -> argparse.ArgumentParser:
     result = argparse.ArgumentParser(description=__doc__)
     result.add_argument("--manifest", type=Path, required=True)
     result.add_argument("--baseline", type=Path, required=True)
-    result.add_argument("--candidate", type=Path, required=True)
+    result.add_argument(
+        "--candidate",
+        type=Path,
+        required=True,
+        action="append",
+        help="candidate transcript; repeat with --output-dir to rank several",
+    )
     result.add_argument(
         "--declaration",
         type=Path,
@@ -39,7 +63,24 @@ def parser() -> argparse.ArgumentParser:
         "--evaluated-at",
         help="RFC 3339 timestamp; supply this for byte-reproducible reports",
     )
+    result.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="run probes and cases on this many threads (the manifest's "
+        "invocation_policy.max_concurrency still applies)",
+    )
+    result.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="reuse sealed reports for identical inputs and --evaluated-at",
+    )
     result.add_argument("--output", type=Path, help="write the complete report atomically")
+    result.add_argument(
+        "--output-dir",
+        type=Path,
+        help="write one report per candidate and summary.json into this directory",
+    )
     result.add_argument(
         "--overwrite",
         action="store_true",
@@ -90,26 +131,205 @@ def _write_atomic(path: Path, report: dict, *, overwrite: bool) -> None:
         temporary.unlink(missing_ok=True)
 
 
+REPORT_CACHE_VERSION = 2
+
+
+def evaluator_digest() -> str:
+    """Digest every ``cpas`` module and the schemas the evaluator loads.
+
+    Reports depend on more than ``cpas/evaluation.py``: replay (``runtime``),
+    canonicalization and digest frames (``provenance``) and the transcript
+    and report schemas all shape them, so changing any of these misses.
+    """
+
+    package = Path(cpas.evaluation.__file__).resolve().parent
+    schemas = cpas.evaluation.REPORT_SCHEMA.parent
+    material = {
+        f"cpas/{path.relative_to(package).as_posix()}": file_sha256(path)
+        for path in sorted(package.rglob("*.py"))
+    }
+    material.update(
+        (f"schemas/{path.name}", file_sha256(path))
+        for path in sorted(schemas.glob("*.schema.json"))
+    )
+    return "sha256:" + hashlib.sha256(
+        canonicalize_json(material, profile=JCS_CANONICALIZATION)
+    ).hexdigest()
+
+
+def report_cache_key(
+    *,
+    manifest: Path,
+    baseline: Path,
+    candidate: Path,
+    declaration: Path,
+    evaluated_at: str,
+) -> str:
+    """Address a report by its input bytes, ``evaluated_at`` and the evaluator.
+
+    :func:`evaluator_digest` is part of the key, so a change to the package
+    or its schemas never serves a report produced by older code.
+    """
+
+    material = {
+        "cache_version": REPORT_CACHE_VERSION,
+        "evaluator": evaluator_digest(),
+        "manifest": file_sha256(manifest),
+        "baseline": file_sha256(baseline),
+        "candidate": file_sha256(candidate),
+        "declaration": file_sha256(declaration),
+        "evaluated_at": evaluated_at,
+    }
+    return hashlib.sha256(
+        canonicalize_json(material, profile=JCS_CANONICALIZATION)
+    ).hexdigest()
+
+
+class ReportCache:
+    """Directory of sealed reports keyed by :func:`report_cache_key`.
+
+    Reports are fully validated by the comparison before they are stored, so
+    a lookup only re-checks the seal; an unreadable or altered entry counts
+    as a miss and is replaced.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+
+    def path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict | None:
+        path = self.path(key)
+        if not path.is_file():
+            return None
+        try:
+            report = _object(path, "cached report")
+            verify_report_integrity(report)
+        except PermissionError:
+            raise  # an unreadable cache is misconfiguration, not a stale entry
+        except (OSError, ValueError, EvaluationError):
+            return None
+        return report
+
+    def put(self, key: str, report: dict) -> None:
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(path, report, overwrite=True)
+
+
+def _executor(workers: int):
+    return ThreadPoolExecutor(max_workers=workers) if workers > 1 else nullcontext()
+
+
+def _cache_lookup(
+    cache: ReportCache | None,
+    arguments: argparse.Namespace,
+    candidate: Path,
+    declaration_path: Path,
+) -> tuple[str, str | None, dict | None]:
+    if cache is None:
+        return "disabled", None, None
+    if arguments.evaluated_at is None:
+        return "bypassed", None, None  # a report stamped "now" is never reused
+    cache_key = report_cache_key(
+        manifest=arguments.manifest,
+        baseline=arguments.baseline,
+        candidate=candidate,
+        declaration=declaration_path,
+        evaluated_at=arguments.evaluated_at,
+    )
+    report = cache.get(cache_key)
+    return ("miss" if report is None else "hit"), cache_key, report
+
+
+def _run_candidates(
+    arguments: argparse.Namespace,
+    manifest: dict,
+    declaration_path: Path,
+    cache: ReportCache | None,
+) -> int:
+    if arguments.output_dir is None:
+        raise ValueError("several --candidate paths require --output-dir")
+    if arguments.output is not None:
+        raise ValueError("--output writes a single report; use only --output-dir")
+    output_dir = arguments.output_dir
+    if not output_dir.is_dir():
+        raise ValueError(f"output directory does not exist: {output_dir}")
+    lookups = [
+        _cache_lookup(cache, arguments, path, declaration_path)
+        for path in arguments.candidate
+    ]
+    reports = [report for _, _, report in lookups]
+    missing = [index for index, report in enumerate(reports) if report is None]
+    if missing:
+        baseline = load_transcript(arguments.baseline)
+        candidates = []
+        for index in missing:
+            candidate = load_transcript(arguments.candidate[index])
+            candidates.append((candidate, TranscriptRuntimeAdapter(candidate)))
+        declaration = _object(declaration_path, "declaration")
+        with _executor(arguments.workers) as executor:
+            result = compare_runtime_candidates(
+                manifest,
+                declaration,
+                (baseline, TranscriptRuntimeAdapter(baseline)),
+                candidates,
+                evaluated_at=arguments.evaluated_at,
+                declaration_path=declaration_path,
+                executor=executor,
+                inputs_validated=True,
+            )
+        for index, report in zip(missing, result["reports"]):
+            reports[index] = report
+            status, cache_key, _ = lookups[index]
+            if status == "miss":
+                cache.put(cache_key, report)
+    summary = summarize_candidate_reports(reports)
+    for entry in summary["ranking"]:
+        index = entry["candidate_index"]
+        path = output_dir / f"{index:02d}-{arguments.candidate[index].stem}.json"
+        _write_atomic(path, reports[index], overwrite=arguments.overwrite)
+        entry["output"] = str(path)
+        entry["cache"] = lookups[index][0]
+    _write_atomic(output_dir / "summary.json", summary, overwrite=arguments.overwrite)
+    print(json.dumps(summary, sort_keys=True, separators=(",", ":")))
+    return 0
+
+
 def run(argv: Sequence[str] | None = None) -> int:
     arguments = parser().parse_args(argv)
+    if arguments.workers < 1:
+        raise ValueError("--workers must be at least 1")
     manifest = _object(arguments.manifest, "manifest")
-    baseline = _object(arguments.baseline, "baseline transcript")
-    candidate = _object(arguments.candidate, "candidate transcript")
     validate_manifest(manifest)
-    validate_transcript(baseline)
-    validate_transcript(candidate)
     declaration_path = arguments.declaration or _default_declaration(manifest)
-    declaration = _object(declaration_path, "declaration")
-    report = compare_runtime_transcripts(
-        manifest,
-        declaration,
-        baseline,
-        candidate,
-        TranscriptRuntimeAdapter(baseline),
-        TranscriptRuntimeAdapter(candidate),
-        evaluated_at=arguments.evaluated_at,
-        declaration_path=declaration_path,
+    cache = ReportCache(arguments.cache_dir) if arguments.cache_dir else None
+    if len(arguments.candidate) > 1 or arguments.output_dir is not None:
+        return _run_candidates(arguments, manifest, declaration_path, cache)
+    (candidate_path,) = arguments.candidate
+    cache_status, cache_key, report = _cache_lookup(
+        cache, arguments, candidate_path, declaration_path
     )
+    if report is None:
+        baseline = load_transcript(arguments.baseline)
+        candidate = load_transcript(candidate_path)
+        declaration = _object(declaration_path, "declaration")
+        with _executor(arguments.workers) as executor:
+            report = compare_runtime_transcripts(
+                manifest,
+                declaration,
+                baseline,
+                candidate,
+                TranscriptRuntimeAdapter(baseline),
+                TranscriptRuntimeAdapter(candidate),
+                evaluated_at=arguments.evaluated_at,
+                declaration_path=declaration_path,
+                executor=executor,
+                inputs_validated=True,
+            )
+        if cache_status == "miss":
+            cache.put(cache_key, report)
     if arguments.output:
         _write_atomic(arguments.output, report, overwrite=arguments.overwrite)
         emitted = {
@@ -123,10 +343,14 @@ def run(argv: Sequence[str] | None = None) -> int:
             ],
             "human_review_status": report["human_review"]["status"],
             "final_disposition": report["final_disposition"],
+            "cache": cache_status,
         }
         print(json.dumps(emitted, sort_keys=True, separators=(",", ":")))
     else:
         print(json.dumps(report, sort_keys=True, indent=2, ensure_ascii=False))
+        if cache is not None:  # stdout carries the report; keep it parseable
+            status = {"cache": cache_status, "report_digest": report["integrity"]["digest"]}
+            print(json.dumps(status, sort_keys=True, separators=(",", ":")), file=sys.stderr)
     return 0
 
 
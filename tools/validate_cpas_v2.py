@@ -13,8 +13,6 @@ from pathlib import Path
 from typing import Any, Iterable, Mapping
 from urllib.parse import unquote, urlsplit
 
-from jsonschema import Draft202012Validator, FormatChecker
-
 REPOSITORY_ROOT = Path(__file__).resolve().parents[1]
 if str(REPOSITORY_ROOT) not in sys.path:
     sys.path.insert(0, str(REPOSITORY_ROOT))
@@ -38,7 +36,9 @@ from cpas.provenance import (  # noqa: E402
     SEED_TOKEN_DIGEST_PROFILE,
     file_sha256,
     load_json,
+    verify_many,
 )
+from cpas.schema_cache import schema_validator, warm_schema_validators  # noqa: E402
 from cpas.seed_token import validate_token  # noqa: E402
 from cpas.runtime import TranscriptRuntimeAdapter  # noqa: E402
 from tools.verify_canonicalization_vectors import verify_vectors  # noqa: E402
@@ -122,10 +122,8 @@ def _object(root: Path, relative: str) -> dict[str, Any]:
 
 def validate_schema_instances(root: Path) -> None:
     for schema_relative, instance_relative in SCHEMA_INSTANCE_PAIRS:
-        schema = _object(root, schema_relative)
         instance = _object(root, instance_relative)
-        Draft202012Validator.check_schema(schema)
-        validator = Draft202012Validator(schema, format_checker=FormatChecker())
+        validator = schema_validator(root / schema_relative)
         errors = sorted(validator.iter_errors(instance), key=lambda item: list(item.path))
         if errors:
             first = errors[0]
@@ -137,28 +135,45 @@ def validate_all_schemas(root: Path) -> int:
     paths = sorted((root / "schemas").glob("*.schema.json"))
     if not paths:
         raise ValidationFailure("no CPAS v2 schemas discovered")
-    for path in paths:
-        schema = load_json(path)
-        Draft202012Validator.check_schema(schema)
-    return len(paths)
+    return warm_schema_validators(paths)
 
 
 def require_file_digest(root: Path, ref: str, expected: str, *, owner: str) -> None:
-    path = (root / ref).resolve()
-    try:
-        path.relative_to(root.resolve())
-    except ValueError as exc:
-        raise ValidationFailure(f"{owner}: source reference escapes repository: {ref}") from exc
-    if not path.is_file():
-        raise ValidationFailure(f"{owner}: referenced file does not exist: {ref}")
-    actual = file_sha256(path)
-    if actual != expected:
-        raise ValidationFailure(
-            f"{owner}: digest mismatch for {ref}: expected {expected}, computed {actual}"
-        )
+    require_file_digests(root, [(ref, expected, owner)])
+
+
+def require_file_digests(
+    root: Path,
+    references: Iterable[tuple[str, str, str]],
+    *,
+    workers: int = 1,
+) -> int:
+    """Check ``(ref, expected digest, owner)`` triples, hashing via ``verify_many``."""
+
+    references = list(references)
+    artifacts = []
+    for ref, expected, owner in references:
+        path = (root / ref).resolve()
+        try:
+            path.relative_to(root.resolve())
+        except ValueError as exc:
+            raise ValidationFailure(
+                f"{owner}: source reference escapes repository: {ref}"
+            ) from exc
+        if not path.is_file():
+            raise ValidationFailure(f"{owner}: referenced file does not exist: {ref}")
+        artifacts.append({"path": str(path), "digest": expected})
+    results = verify_many(artifacts, kind="file", workers=workers, chunksize=8)
+    for (ref, expected, owner), artifact, result in zip(references, artifacts, results):
+        if not result["verified"]:
+            actual = file_sha256(artifact["path"])
+            raise ValidationFailure(
+                f"{owner}: digest mismatch for {ref}: expected {expected}, computed {actual}"
+            )
+    return len(references)
 
 
-def validate_semantics_and_integrity(root: Path) -> int:
+def validate_semantics_and_integrity(root: Path, *, workers: int = 1) -> int:
     declaration = _object(root, "instances/current/Clarence-9-v2.0.json")
     dka = _object(root, "examples/v2/dka-e-v2.example.json")
     token = _object(root, "examples/v2/seed-token-v2.example.json")
@@ -193,14 +208,12 @@ def validate_semantics_and_integrity(root: Path) -> int:
         raise ValidationFailure("capability profile digest is not domain-separated")
 
     checked = 0
+    file_references: list[tuple[str, str, str]] = []
     for source in declaration["provenance"]["source_artifacts"]:
         if source.get("digest_profile") != "raw-sha256":
             raise ValidationFailure("Clarence-9 source artifact lacks raw-sha256 profile")
-        require_file_digest(
-            root,
-            source["path"],
-            source["digest"],
-            owner="Clarence-9 v2 provenance",
+        file_references.append(
+            (source["path"], source["digest"], "Clarence-9 v2 provenance")
         )
         checked += 1
 
@@ -208,11 +221,8 @@ def validate_semantics_and_integrity(root: Path) -> int:
         if source["kind"] == "repository" and source.get("digest"):
             if source.get("digest_profile") != "raw-sha256":
                 raise ValidationFailure("DKA-E repository source lacks raw-sha256 profile")
-            require_file_digest(
-                root,
-                source["ref"],
-                source["digest"],
-                owner="DKA-E example provenance",
+            file_references.append(
+                (source["ref"], source["digest"], "DKA-E example provenance")
             )
             checked += 1
 
@@ -221,11 +231,8 @@ def validate_semantics_and_integrity(root: Path) -> int:
         if state_ref["kind"] == "idp":
             if state_ref.get("digest_profile") != "raw-sha256":
                 raise ValidationFailure("SeedToken IDP state ref lacks raw-sha256 profile")
-            require_file_digest(
-                root,
-                state_ref["ref"],
-                state_ref["digest"],
-                owner="SeedToken state reference",
+            file_references.append(
+                (state_ref["ref"], state_ref["digest"], "SeedToken state reference")
             )
             checked += 1
         elif state_ref["kind"] == "dka":
@@ -251,11 +258,8 @@ def validate_semantics_and_integrity(root: Path) -> int:
         if evidence.get("digest"):
             if evidence.get("digest_profile") != "raw-sha256":
                 raise ValidationFailure("EEP repository evidence lacks raw-sha256 profile")
-            require_file_digest(
-                root,
-                evidence["source_ref"],
-                evidence["digest"],
-                owner="EEP evidence",
+            file_references.append(
+                (evidence["source_ref"], evidence["digest"], "EEP evidence")
             )
             checked += 1
     for reference in exchange["dka_refs"]:
@@ -265,6 +269,7 @@ def validate_semantics_and_integrity(root: Path) -> int:
             if reference["digest"] != dka["integrity"]["digest"]:
                 raise ValidationFailure("EEP DKA digest does not match DKA-E example")
             checked += 1
+    require_file_digests(root, file_references, workers=workers)
     return checked
 
 
@@ -415,11 +420,13 @@ def validate_legacy_migrations(root: Path) -> int:
     return count
 
 
-def validate_repository(root: Path = REPOSITORY_ROOT) -> ValidationReport:
+def validate_repository(
+    root: Path = REPOSITORY_ROOT, *, workers: int = 1
+) -> ValidationReport:
     root = root.resolve()
     schema_count = validate_all_schemas(root)
     validate_schema_instances(root)
-    digest_references = validate_semantics_and_integrity(root)
+    digest_references = validate_semantics_and_integrity(root, workers=workers)
     runtime_checks, runtime_digest_references = validate_runtime_evaluation(root)
     digest_references += runtime_digest_references
     files = markdown_files(root)
@@ -447,9 +454,15 @@ def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--root", type=Path, default=REPOSITORY_ROOT)
     parser.add_argument("--json", action="store_true", help="emit the success report as JSON")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="processes used to hash referenced files (default: 1)",
+    )
     args = parser.parse_args(argv)
     try:
-        report = validate_repository(args.root)
+        report = validate_repository(args.root, workers=args.workers)
     except Exception as exc:  # CLI boundary: retain a concise CI annotation
         print(f"CPAS v2 validation failed: {exc}", file=sys.stderr)
         return 1
@@ -4,7 +4,9 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import sys
+from io import BytesIO
 from pathlib import Path
 from typing import Any, Mapping
 
@@ -21,9 +23,11 @@ from cpas.provenance import (  # noqa: E402
     LEGACY_DIGEST_PROFILE,
     DuplicateKeyError,
     canonicalize_json,
+    digest_preimage,
     load_json,
     loads_json,
     profiled_digest,
+    write_canonical_json,
 )
 
 DEFAULT_VECTORS = (
@@ -83,6 +87,10 @@ def verify_vectors(path: str | Path = DEFAULT_VECTORS) -> int:
             raise VectorFailure(f"{vector_id}: canonical bytes differ")
         if len(canonical) != vector.get("canonical_length"):
             raise VectorFailure(f"{vector_id}: canonical length differs")
+        streamed = BytesIO()
+        write_canonical_json(vector.get("value"), streamed, profile=canonicalization)
+        if streamed.getvalue() != canonical:
+            raise VectorFailure(f"{vector_id}: streamed canonical bytes differ")
         digests = _mapping(vector.get("digests"), owner=f"{vector_id} digests")
         for profile, expected in digests.items():
             actual = profiled_digest(
@@ -92,6 +100,15 @@ def verify_vectors(path: str | Path = DEFAULT_VECTORS) -> int:
             )
             if actual != expected:
                 raise VectorFailure(f"{vector_id}: digest differs for {profile}")
+            preimage = digest_preimage(
+                vector.get("value"),
+                canonicalization=canonicalization,
+                digest_profile=str(profile),
+            )
+            if "sha256:" + hashlib.sha256(preimage).hexdigest() != actual:
+                raise VectorFailure(
+                    f"{vector_id}: streamed digest differs from preimage for {profile}"
+                )
             checked += 1
 
     legacy = _mapping(vectors.get("legacy"), owner="legacy vector")
@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from urllib.parse import quote
 
 import pandas as pd
 import streamlit as st
@@ -175,23 +176,97 @@ def suggest_realign(df: pd.DataFrame) -> None:
 
 
 
+API_URL = "http://localhost:5000/api/v1/messages"
+STREAM_URL = "http://localhost:5000/api/v1/threads"
+AVATARS = {
+    "Meridian": "🧭",
+    "Lumin": "💡",
+    "Telos": "🎯",
+    "Clarence-9": "🤖",
+}
+PAGE_SIZE = 200
+
+
 def fetch_messages(thread_id: str) -> list[dict]:
-    """Fetch messages from the local T-BEEP API."""
+    """Fetch messages from the local T-BEEP API.
+
+    Messages already shown for ``thread_id`` are kept in the session together
+    with the API's next cursor, so each rerun only downloads new messages.
+    """
     if not thread_id:
         return []
+    cache = st.session_state.setdefault("tbeep_threads", {})
+    thread = cache.setdefault(thread_id, {"cursor": "0", "messages": []})
     try:
-        res = requests.get(
-            "http://localhost:5000/api/v1/messages",
-            params={"thread_id": thread_id},
-            timeout=5,
-        )
-        if res.status_code == 200:
+        while True:
+            res = requests.get(
+                API_URL,
+                params={
+                    "thread_id": thread_id,
+                    "after": thread["cursor"],
+                    "limit": PAGE_SIZE,
+                },
+                timeout=5,
+            )
+            if res.status_code != 200:
+                break
             data = res.json()
-            if isinstance(data, list):
-                return data
+            if not isinstance(data, list):
+                break
+            if "X-Next-Cursor" not in res.headers:
+                # Server without pagination: the body is the whole thread.
+                thread["messages"] = data
+                break
+            thread["messages"].extend(data)
+            thread["cursor"] = res.headers["X-Next-Cursor"]
+            if res.headers.get("X-Has-More") != "true":
+                break
     except Exception:
         pass
-    return []
+    return thread["messages"]
+
+
+def stream_messages(thread_id: str, last_event_id: str = "0"):
+    """Yield ``(event_id, message)`` pairs from the thread's SSE stream.
+
+    The connection resumes after ``last_event_id`` and stays open; the
+    generator ends when the API closes it or cannot be reached.
+    """
+    url = f"{STREAM_URL}/{quote(thread_id, safe='')}/stream"
+    try:
+        with requests.get(
+            url,
+            headers={"Last-Event-ID": last_event_id, "Accept": "text/event-stream"},
+            stream=True,
+            timeout=(5, 60),
+        ) as res:
+            if res.status_code != 200:
+                return
+            event_id, data = None, []
+            for line in res.iter_lines(decode_unicode=True):
+                if line:
+                    field, _, value = line.partition(":")
+                    if field == "id":
+                        event_id = value.strip()
+                    elif field == "data":
+                        data.append(value[1:] if value.startswith(" ") else value)
+                    continue
+                if event_id is not None and data:
+                    yield event_id, json.loads("\n".join(data))
+                event_id, data = None, []
+    except Exception:
+        return
+
+
+def show_message(msg: dict) -> None:
+    avatar = AVATARS.get(msg.get("instance"), "👤")
+    label = f"{avatar} {msg.get('instance', 'Unknown')}"
+    with st.expander(label):
+        for k, v in msg.items():
+            if k == "content":
+                continue
+            st.markdown(f"**{k}:** {v}")
+        st.markdown(msg.get("content", ""))
 
 
 baseline_data = load_json(BASELINE_FILE)
@@ -243,27 +318,19 @@ st.title("Epistemic Metrics Dashboard")
 
 # Sidebar input for selecting a specific conversation thread
 thread_id = st.sidebar.text_input("Thread ID")
+live = st.sidebar.checkbox(
+    "Live stream", help="Keep a connection open and append messages as they arrive."
+)
 
 # Two-column layout: left for messages, right for metrics
 left, right = st.columns([2, 1])
 
 with left:
     # Display stored T-BEEP messages for the selected thread
-    AVATARS = {
-        "Meridian": "🧭",
-        "Lumin": "💡",
-        "Telos": "🎯",
-        "Clarence-9": "🤖",
-    }
     for msg in fetch_messages(thread_id):
-        avatar = AVATARS.get(msg.get("instance"), "👤")
-        label = f"{avatar} {msg.get('instance', 'Unknown')}"
-        with st.expander(label):
-            for k, v in msg.items():
-                if k == "content":
-                    continue
-                st.markdown(f"**{k}:** {v}")
-            st.markdown(msg.get("content", ""))
+        show_message(msg)
+    # Live mode appends here once the rest of the page has rendered
+    live_messages = st.container()
 
 with right:
     # Existing metric visualizations live in the right column
@@ -364,3 +431,13 @@ with right:
 
     st.sidebar.markdown("**Usage**: `streamlit run ui/dashboard.py`")
 
+if live and thread_id:
+    # Runs last so the page is complete; new messages are appended to the
+    # thread without re-rendering it. Any widget interaction reruns the
+    # script, which ends this loop.
+    thread = st.session_state["tbeep_threads"][thread_id]
+    with live_messages:
+        for event_id, msg in stream_messages(thread_id, thread["cursor"]):
+            thread["messages"].append(msg)
+            thread["cursor"] = event_id
+            show_message(msg)